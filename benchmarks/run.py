@@ -0,0 +1,224 @@
+"""Benchmarks of the core rule and rendering paths.
+
+Usage:
+    python -m benchmarks.run                      # run and compare against benchmarks/baseline.json
+    python -m benchmarks.run --output result.json # also save the results
+    python -m benchmarks.run --update-baseline    # store the results as the new baseline
+
+Each benchmark reports its operations per second (best of several repeats), the peak of memory
+allocated during one operation and the memory it retains, as traced by `tracemalloc`. A benchmark slower than the
+baseline by more than the tolerance is a regression, and the command exits with status 1.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import timeit
+import tracemalloc
+
+from typing import Callable, Dict, List
+
+from src.board import Board
+from src.colors import Colors
+from src.piece import Piece
+from src.player.deck import Deck
+from src.renderer import Renderer
+from src.resources import load_pieces
+
+BASELINE_PATH: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+# Setup of each benchmark, returning the operation to measure
+BENCHMARKS: Dict[str, Callable[[], Callable[[], None]]] = {}
+
+
+def benchmark(name: str) -> Callable[[Callable[[], Callable[[], None]]], Callable[[], Callable[[], None]]]:
+    """Registers the setup of a benchmark.
+
+    Args:
+        name (str): Name of the benchmark in the results.
+    """
+    def register(setup: Callable[[], Callable[[], None]]) -> Callable[[], Callable[[], None]]:
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+
+def opening() -> Board:
+    """Builds a 20x20 board with a few pieces of each color, close to an opening position."""
+    board = Board(20, 20)
+    pieces = load_pieces()
+    for i, (color, x, y) in enumerate([(Colors.BLUE, 0, 0), (Colors.GREEN, 17, 0),
+                                       (Colors.RED, 17, 17), (Colors.YELLOW, 0, 17)]):
+        board.put(pieces[i], x, y, color)
+    board.save()
+    return board
+
+
+@benchmark("board.put")
+def bench_board_put() -> Callable[[], None]:
+    board = Board(20, 20)
+    piece = Piece(((1, 0), (2, 0), (0, 1), (1, 1), (1, 2)))
+
+    # As a search plays a move then takes it back
+    def put() -> None:
+        board.put(piece, 8, 8, Colors.BLUE)
+        board.undo()
+    return put
+
+
+@benchmark("board.can_place_piece_at")
+def bench_board_can_place_piece_at() -> Callable[[], None]:
+    board = Board(20, 20)
+    piece = Piece(((0, 0), (1, 0), (2, 0), (1, 1), (1, 2)))
+    board.put(piece, 0, 0, Colors.BLUE)
+    return lambda: board.can_place_piece_at(piece, 3, 1, Colors.BLUE)
+
+
+@benchmark("board.is_piece_in_corner_at")
+def bench_board_is_piece_in_corner_at() -> Callable[[], None]:
+    board = Board(20, 20)
+    piece = Piece(((1, 0), (2, 0), (0, 1), (1, 1), (1, 2)))
+    return lambda: board.is_piece_in_corner_at(piece, 17, 17)
+
+
+@benchmark("piece.rotate")
+def bench_piece_rotate() -> Callable[[], None]:
+    piece = Piece(((1, 0), (2, 0), (0, 1), (1, 1), (1, 2)))
+    return piece.rotate
+
+
+@benchmark("piece.mirror")
+def bench_piece_mirror() -> Callable[[], None]:
+    piece = Piece(((1, 0), (2, 0), (0, 1), (1, 1), (1, 2)))
+    return lambda: piece.mirror(True, False)
+
+
+@benchmark("deck.display")
+def bench_deck_display() -> Callable[[], None]:
+    deck = Deck(load_pieces())
+    deck.apply_color(Colors.BLUE)
+    return deck.display
+
+
+@benchmark("board.display")
+def bench_board_display() -> Callable[[], None]:
+    return opening().display
+
+
+@benchmark("renderer.update")
+def bench_renderer_update() -> Callable[[], None]:
+    board = opening()
+    deck = Deck(load_pieces())
+    deck.apply_color(Colors.BLUE)
+    renderer = Renderer(io.StringIO())
+    piece = Piece(((0, 0), (1, 0), (0, 1)))
+
+    def update() -> None:
+        # As the terminal interface draws a preview, then the board without it
+        board.push_preview(piece, 8, 8)
+        renderer.update(board.render_changes(), deck.render_changes())
+        board.pop_preview()
+        renderer.update(board.render_changes(), deck.render_changes())
+    return update
+
+
+@benchmark("resources.load_pieces")
+def bench_load_pieces() -> Callable[[], None]:
+    return load_pieces
+
+
+def measure(operation: Callable[[], None], repeat: int, min_time: float) -> Dict[str, float]:
+    """Measures the speed and the allocations of an operation.
+
+    Args:
+        operation (Callable[[], None]): Operation to measure.
+        repeat (int): Number of timings, the best one is kept.
+        min_time (float): Minimal duration of a timing, in seconds.
+
+    Returns:
+        Dict[str, float]: `ops_per_sec`, the peak of memory allocated during one operation
+                          (`alloc_bytes`) and the memory still allocated after it (`retained_bytes`).
+    """
+    # Rendering benchmarks print, their output is not part of the measure
+    with contextlib.redirect_stdout(io.StringIO()):
+        timer = timeit.Timer(operation)
+        number, _ = timer.autorange()
+        number = max(1, int(number * min_time / 0.2))
+        best = min(timer.repeat(repeat, number)) / number
+
+        operation()
+        tracemalloc.start()
+        before, _ = tracemalloc.get_traced_memory()
+        operation()
+        after, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return {
+        "ops_per_sec": 1 / best,
+        "alloc_bytes": peak - before,
+        "retained_bytes": after - before,
+    }
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]],
+            tolerance: float) -> List[str]:
+    """Lists the benchmarks slower than the baseline.
+
+    Args:
+        results (Dict): Results of the current run.
+        baseline (Dict): Stored results.
+        tolerance (float): Allowed slowdown, as a fraction of the baseline speed.
+
+    Returns:
+        List[str]: One message per regression.
+    """
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        expected = baseline[name]["ops_per_sec"]
+        if result["ops_per_sec"] < expected * (1 - tolerance):
+            regressions.append(f"{name}: {result['ops_per_sec']:.0f} ops/sec, "
+                               f"baseline {expected:.0f} ops/sec ({result['ops_per_sec'] / expected - 1:+.0%})")
+    return regressions
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks of the core rule and rendering paths.")
+    parser.add_argument("names", nargs="*", help="benchmarks to run, all of them by default")
+    parser.add_argument("--output", help="file where the results are saved as JSON")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="results to compare against")
+    parser.add_argument("--update-baseline", action="store_true", help="store the results as the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed slowdown (default: 0.2)")
+    parser.add_argument("--repeat", type=int, default=5, help="timings per benchmark (default: 5)")
+    parser.add_argument("--min-time", type=float, default=0.2, help="seconds per timing (default: 0.2)")
+    args = parser.parse_args(argv)
+
+    results = {}
+    for name in args.names or BENCHMARKS:
+        results[name] = measure(BENCHMARKS[name](), args.repeat, args.min_time)
+        print(f"{name:<32} {results[name]['ops_per_sec']:>14,.0f} ops/sec "
+              f"{results[name]['alloc_bytes']:>10,} B allocated {results[name]['retained_bytes']:>8,} B retained")
+
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(results, output, indent=4)
+    if args.update_baseline:
+        with open(args.baseline, "w") as baseline:
+            json.dump(results, baseline, indent=4)
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}, run with --update-baseline to create it")
+        return 0
+    with open(args.baseline) as baseline:
+        regressions = compare(results, json.load(baseline), args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
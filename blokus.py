@@ -1,172 +1,209 @@
-import random
-import time
+import asyncio
 import os
+import sys
 
 from typing import List
 
-from src.exceptions import *
-from src.piece import Piece
+from src.exceptions import PieceNotFoundException
+from src.instrumentation import instrumentation
 from src.board import Board
+from src.client import Client
 from src.player import Player
 from src.colors import Colors
+from src.renderer import Renderer
+from src.resources import load_pieces
+from src.server import Server
 
 
 class Game:
-    """Handles game setup, player management, and game flow."""
-    # Colors available to attributes to Players
-    PLAYERS_COLOR: List[Colors] = [Colors.BLUE, Colors.GREEN, Colors.RED, Colors.YELLOW]
+    """Terminal interface of the players sharing this terminal, in a game hosted by a `Server`."""
     NUMBER_OF_PLAYERS: int = 4
-    
+    # Message shown for the moves refused by the server, by exception name
+    ERRORS = {
+        "PieceNotInCornerException": "Au début du jeu, vous devez mettre votre piece dans un coin de la table",
+        "PieceOverlapException": "Votre piece recouvre une autre piece déjà posé sur la table",
+        "NotAdjacentPieceException": "Votre piece n'est pas dans un coin d'une autre piece",
+    }
+
     players: List[Player]
-    pieces: List[Piece]
     board: Board
+    client: Client
+    game: int
+    renderer: Renderer
+    # Shown below the next frame drawn
+    message: str
 
-    def __init__(self, board: Board) -> None:
+    def __init__(self, client: Client, game: int) -> None:
         """Create a new instance of the Game.
 
         Args:
-            board (Board): The game board on which the game is played.
-        """
-        self.board = board
-        
-        self.players = []
-        self.pieces = []
-        self.__load_ressources()
-
-        # Create and attribute color to player
-        colors = self.PLAYERS_COLOR.copy()
-        for _ in range(self.NUMBER_OF_PLAYERS):
-            color = colors[random.randint(0, len(colors) - 1)]
-            colors.remove(color)
-            self.players.append(Player(color, self.pieces))
-
-    def __load_ressources(self) -> None:
-        """Loads chess piece data from text files in the 'res/pieces/' directory.
-
-        Each file is read, and the data is processed into tuples of coordinates 
-        for each piece, which are then stored in the `self.pieces` list.
+            client (Client): Connection to the server, holding seats in the game.
+            game (int): Identifier of the game on the server.
         """
-        pieces_path = "res/pieces/"
-        piece_separator = "&"
-        coord_piece_separator = ";"
-        coord_separator = ","
-
-        for root, _, files in os.walk(pieces_path):
-            for file in files:
-                if file.endswith(".txt"):
-                    with open(os.path.join(root, file)) as piece_file:
-                        for raw_data_piece in piece_file.read().split(piece_separator):
-                            piece_data = []
-                            for coord_piece in raw_data_piece.split(coord_piece_separator):
-                                x, y = coord_piece.split(coord_separator)
-                                piece_data.append((int(x), int(y)))
-                            self.pieces.append(Piece(tuple(piece_data)))
+        self.client = client
+        self.game = game
+        # Copy of the game kept up to date by the client
+        engine = client.games[game]
+        self.board = engine.board
+        self.players = engine.players
+        self.renderer = Renderer()
+        self.message = ""
 
     def screen_clear(self) -> None:
         """Clears the terminal screen."""
-        os.system("clear")
+        print(Renderer.CLEAR_SCREEN, end="", flush=True)
+        self.renderer.invalidate()
+
+    def draw(self, player: Player | None = None) -> None:
+        """Draws the board and the deck of the player, only redrawing the cells that changed.
 
-    def run(self) -> None:
+        Args:
+            player (Player | None): Player whose deck is drawn below the board, if any.
+        """
+        grids = [self.board.render_changes()]
+        if player is not None:
+            grids.append(player.deck.render_changes())
+        self.renderer.update(*grids)
+        if self.message:
+            print(self.message)
+            self.message = ""
+
+    async def run(self) -> None:
         """Main game loop that manages player turns and piece placement.
 
-        Continuously displays the board and player options, allowing each 
-        player to select and place pieces until the game is complete.
+        Displays the board and the deck of each player whose turn it is, allowing them to
+        select and place pieces until the game is complete. The server passes the turn
+        of the players without any legal move, and ends the game when every player has to pass.
         """
         while True:
-            i = 0
-            while i < len(self.players):
-                player = self.players[i]
-
-                self.board.display()
-                player.deck.display()
+            event = await self.client.receive()
+            if event[0] == "OVER":
+                break
+            if event[0] == "TURN" and int(event[2]) in self.client.seats[self.game]:
+                await self.turn(self.players[int(event[2])])
+                self.draw()
 
-                print(f"{str(Colors.RESET)} Quel piece voulez-vous placer > ", end="")
-                piece: Piece | None = None
-                try:
-                    piece = player.deck.get(int(input()) - 1)
-                except ValueError:
-                    print("Choix non valide")
-                    continue
-                except OutOfBoardException:
-                    print("La piece n'existe pas")
-                    continue
-                except Exception as e:
-                    print(e)
+        for player, score in zip(self.players, event[2:]):
+            print(f"{str(player.color)}■{str(Colors.RESET)} {score} points")
 
-                self.screen_clear()
-                self.board.display()
-
-                player_input = ""
-                self.board.save()
-                while player_input != "confirm":
-                    print(f"{str(Colors.RESET)} Où voulez-vous la placer > ")
-                    player_input = input()
+    async def turn(self, player: Player) -> None:
+        """Asks the player for a move until the server accepts one.
 
+        Args:
+            player (Player): Player to move.
+        """
+        while True:
+            self.draw(player)
+
+            print(f"{str(Colors.RESET)} Quel piece voulez-vous placer > ", end="")
+            try:
+                piece = player.deck.get(int(await asyncio.to_thread(input)) - 1)
+            except ValueError:
+                self.message = "Choix non valide"
+                continue
+            except PieceNotFoundException:
+                self.message = "La piece n'existe pas"
+                continue
+
+            self.draw(player)
+
+            x, y = 0, 0
+            player_input = ""
+            while player_input != "confirm":
+                print(f"{str(Colors.RESET)} Où voulez-vous la placer > ")
+                player_input = await asyncio.to_thread(input)
+
+                if player_input == "r" or player_input[:1] == "m":
                     if player_input == "r":
-                        self.board.restore()
-                        piece.rotate()
-                        # Preview
-                        self.board.put(piece, x, y)
-
-                        self.screen_clear()
-                        self.board.display()
-                        continue
-
-                    if player_input[0] == "m":
-                        self.board.restore()
-                        piece.mirror(player_input[1] == "h", player_input[1] == "v")
-                        # Preview
-                        self.board.put(piece, x, y)
-                        
-                        self.screen_clear()
-                        self.board.display()
-                        continue
-
-                    have_coord = player_input.split(",")
-                    if len(have_coord) <= 1 or len(have_coord) > 2:
-                        print("Coord invalid")
-                        continue
-
-                    x, y = have_coord
-                    try:
-                        x = int(x)
-                        y = int(y)
-
-                        self.board.restore()
-                        # Preview
-                        self.board.put(piece, x, y)
-                    except ValueError:
-                        print("Invalid number")
-                        continue
-                    except Exception as e:
-                        print(e)
-                        continue
-
-                    self.screen_clear()
-                    self.board.display()
-                try:
-                    player.place_piece(self.board, piece, x, y)
-                except PieceNotInCornerException:
-                    print("Au début du jeu, vous devez mettre votre piece dans un coin de la table")
-                    self.board.restore()
+                        turned = piece.rotate()
+                    else:
+                        turned = piece.mirror(player_input[1:] == "h", player_input[1:] == "v")
+                    # Near the edge the turned piece may not fit, the previous preview is kept
+                    if self.board.is_piece_out_of_board_at(turned, x, y):
+                        self.message = "La piece sort du plateau"
+                    else:
+                        piece = turned
+                        self.board.pop_preview()
+                        self.board.push_preview(piece, x, y, player.color)
+
+                    self.draw(player)
                     continue
-                except PieceOverlapException:
-                    print("Votre piece recouvre une autre piece déjà posé sur la table")
-                    self.board.restore()
+
+                have_coord = player_input.split(",")
+                if len(have_coord) <= 1 or len(have_coord) > 2:
+                    print("Coord invalid")
                     continue
-                except NotAdjacentPieceException:
-                    print("Votre piece n'est pas dans un coin d'une autre piece")
-                    self.board.restore()
+
+                try:
+                    x, y = int(have_coord[0]), int(have_coord[1])
+
+                    self.board.pop_preview()
+                    self.board.push_preview(piece, x, y, player.color)
+                except ValueError:
+                    print("Invalid number")
                     continue
                 except Exception as e:
                     print(e)
                     continue
-                i += 1
-            self.screen_clear()
-            self.board.display()
-            time.sleep(0.25)
-
 
-game = Game(Board(20, 20))
-game.screen_clear()
-game.run()
+                self.draw(player)
+            self.board.pop_preview()
+
+            await self.client.move(self.game, piece, piece.orientation, x, y)
+            while True:
+                event = await self.client.receive()
+                if event[0] in ("PLAYED", "ERROR"):
+                    break
+            if event[0] == "PLAYED":
+                return
+            self.message = self.ERRORS.get(event[1], " ".join(event[2:]))
+
+
+async def main(seed: int | None = None) -> None:
+    """Hosts a game for the players sharing this terminal.
+
+    Args:
+        seed (int | None): Seed of the color assignment, for reproducible games.
+    """
+    pieces = load_pieces()
+    server = Server(pieces)
+    port = await server.start(port=0)
+    client = await Client.connect(pieces, port=port)
+    game = await client.new_game(Game.NUMBER_OF_PLAYERS, seed)
+    for _ in range(Game.NUMBER_OF_PLAYERS):
+        await client.join(game)
+
+    interface = Game(client, game)
+    interface.screen_clear()
+    await interface.run()
+    await client.close()
+    await server.close()
+
+
+async def serve() -> None:
+    """Hosts games for the clients connecting to this machine."""
+    server = Server(load_pieces())
+    await server.start()
+    await server.serve_forever()
+
+
+def write_metrics(path: str) -> None:
+    """Writes the metrics of the instrumentation, as Prometheus text for a `.prom` file and as JSON otherwise."""
+    with open(path, "w") as metrics_file:
+        metrics_file.write(instrumentation.to_prometheus() if path.endswith(".prom") else instrumentation.to_json())
+
+
+if __name__ == "__main__":
+    # Instruments the rules, the rendering, the agents and the input handling, and writes the metrics at exit
+    metrics_path = os.environ.get("BLOKUS_METRICS")
+    if metrics_path:
+        instrumentation.instrument(Game, "turn", "input.turn")
+        instrumentation.enable()
+    try:
+        if sys.argv[1:] == ["serve"]:
+            asyncio.run(serve())
+        else:
+            asyncio.run(main())
+    finally:
+        if metrics_path:
+            write_metrics(metrics_path)
@@ -0,0 +1,4 @@
+from .agent import Agent
+from .random_agent import RandomAgent
+from .mcts_agent import MCTSAgent
+from .search_agent import SearchAgent
@@ -0,0 +1,42 @@
+from typing import TYPE_CHECKING, Tuple
+
+from ..board import Board
+from ..piece import Piece
+from ..player import Player
+
+if TYPE_CHECKING:
+    from ..engine import Engine
+
+
+class Agent:
+    """Decides the moves of a player, without any input or output.
+
+    Subclasses implement `play`, which is called by the `Engine` on each turn of the player.
+    """
+
+    def bind(self, engine: "Engine", index: int) -> None:
+        """Called by the `Engine` the agent plays in, before the game starts.
+
+        Agents that need the whole game state, such as the decks of the other players,
+        keep the engine. Does nothing by default.
+
+        Args:
+            engine (Engine): Engine running the game.
+            index (int): Index of the player of the agent in the turn order.
+        """
+
+    def play(self, board: Board, player: Player) -> Tuple[Piece, int, int, int] | None:
+        """Chooses the next move of the player.
+
+        Args:
+            board (Board): Current game board.
+            player (Player): Player to play for.
+
+        Raises:
+            NotImplementedError: If the subclass doesn't implement this method.
+
+        Returns:
+            tuple | None: (piece, orientation, x, y) as yielded by `Board.legal_moves`,
+                          or None when the player has no legal move and passes.
+        """
+        raise NotImplementedError()
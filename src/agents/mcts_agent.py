@@ -0,0 +1,224 @@
+import math
+import multiprocessing
+import random
+import time
+
+from copy import copy
+from typing import TYPE_CHECKING, Dict, List, Tuple
+
+from ..board import Board
+from ..piece import Piece
+from ..player import Player
+from .agent import Agent
+from .random_agent import RandomAgent
+
+if TYPE_CHECKING:
+    from ..engine import Engine
+
+# A move of the tree as (id of the piece in the deck, orientation, x, y), or None for a pass.
+# Unlike pieces, ids stay the same in every copy of the game and in every process.
+Move = Tuple[int, int, int, int] | None
+
+
+class Node:
+    """Node of the search tree, reached by playing `move` from its parent.
+
+    Nodes are compact (`__slots__`) since a search creates one per playout.
+    """
+    __slots__ = ("move", "parent", "children", "untried", "visits", "reward", "player")
+    move: Move
+    parent: "Node | None"
+    children: List["Node"]
+    # Moves not expanded yet, generated on the first visit of the node
+    untried: List[Move] | None
+    visits: int
+    # Sum of the rewards of the playouts through the node, for the player who played `move`
+    reward: float
+    player: int
+
+    def __init__(self, move: Move = None, parent: "Node | None" = None, player: int = -1) -> None:
+        self.move = move
+        self.parent = parent
+        self.children = []
+        self.untried = None
+        self.visits = 0
+        self.reward = 0.0
+        self.player = player
+
+    def select(self, exploration: float) -> "Node":
+        """Chooses the child to explore with the UCT formula.
+
+        Args:
+            exploration (float): Weight of the exploration term.
+
+        Returns:
+            Node: Child with the best upper confidence bound.
+        """
+        log_visits = math.log(self.visits)
+        return max(self.children,
+                   key=lambda child: child.reward / child.visits
+                                     + exploration * math.sqrt(log_visits / child.visits))
+
+
+def legal_moves(engine: "Engine") -> List[Move]:
+    """Lists the moves of the current player of a game.
+
+    Returns:
+        List[Move]: Moves of the player, or a single pass if the player cannot move.
+    """
+    player = engine.players[engine.current]
+    moves = [(player.deck.id_of(piece), orientation, x, y)
+             for piece, orientation, x, y in engine.board.legal_moves(player)]
+    return moves or [None]
+
+
+def apply(engine: "Engine", move: Move) -> None:
+    """Plays a move of the tree in a game."""
+    if move is not None:
+        slot, orientation, x, y = move
+        move = (engine.players[engine.current].deck.table[slot], orientation, x, y)
+    engine.apply(move)
+
+
+def search(engine: "Engine", budget: float, seed: int | None,
+           exploration: float = math.sqrt(2)) -> Tuple[Dict[Move, Tuple[int, float]], int]:
+    """Runs a Monte Carlo Tree Search from the current position of a game.
+
+    Each player maximizes its own reward (max-n): 1 for a win, shared between the winners
+    of a tie, 0 otherwise. Playouts are played by a `RandomAgent`.
+    Module level so it can run in the worker processes of `MCTSAgent`.
+
+    Args:
+        engine (Engine): Game to search, it is copied and left unchanged.
+        budget (float): Search time in seconds.
+        seed (int | None): Seed of the random playouts.
+        exploration (float): Weight of the exploration term of UCT.
+
+    Returns:
+        tuple: (statistics, playouts) where statistics map each move of the root
+               to its (visits, total reward).
+    """
+    deadline = time.monotonic() + budget
+    policy = RandomAgent(seed)
+    root = Node(player=engine.current)
+    playouts = 0
+
+    while playouts == 0 or time.monotonic() < deadline:
+        game = copy(engine)
+        node = root
+
+        # Selection
+        while node.untried is not None and not node.untried and node.children:
+            node = node.select(exploration)
+            apply(game, node.move)
+
+        # Expansion
+        if not game.is_over():
+            if node.untried is None:
+                node.untried = legal_moves(game)
+                policy.rng.shuffle(node.untried)
+            if node.untried:
+                child = Node(node.untried.pop(), node, game.current)
+                node.children.append(child)
+                apply(game, child.move)
+                node = child
+
+        # Playout
+        while not game.is_over():
+            game.apply(policy.play(game.board, game.players[game.current]))
+        winners = game.winners()
+        playouts += 1
+
+        # Backpropagation
+        while node is not None:
+            node.visits += 1
+            if node.player in winners:
+                node.reward += 1 / len(winners)
+            node = node.parent
+
+    return {child.move: (child.visits, child.reward) for child in root.children}, playouts
+
+
+class MCTSAgent(Agent):
+    """Plays the most visited move of a Monte Carlo Tree Search with random playouts.
+
+    Each move is searched for a fixed wall-clock budget. With several processes, each of
+    them searches its own tree from the same position (root parallelism) and the statistics
+    of the moves of the root are summed before choosing.
+    The agent needs the state of the whole game, it must play in an `Engine`.
+    """
+    budget: float
+    processes: int
+    exploration: float
+    rng: random.Random
+    engine: "Engine | None"
+    # Playouts and search time since the agent was created
+    playouts: int
+    elapsed: float
+
+    def __init__(self, seed: int | None = None, budget: float = 1.0, processes: int = 1,
+                 exploration: float = math.sqrt(2)) -> None:
+        """Create a new MCTSAgent
+
+        Args:
+            seed (int | None): Seed of the searches, for reproducible playouts.
+            budget (float): Search time of each move in seconds.
+            processes (int): Number of trees searched in parallel, 1 searches in the process of the game.
+                             Agents played in a `Tournament` with several processes must use 1.
+            exploration (float): Weight of the exploration term of UCT.
+        """
+        self.budget = budget
+        self.processes = processes
+        self.exploration = exploration
+        self.rng = random.Random(seed)
+        self.engine = None
+        self.playouts = 0
+        self.elapsed = 0.0
+        self.__pool = None
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_MCTSAgent__pool"] = None
+        return state
+
+    @property
+    def playouts_per_second(self) -> float:
+        """Playouts played per second of search, across all the processes."""
+        return self.playouts / self.elapsed if self.elapsed else 0.0
+
+    def bind(self, engine: "Engine", index: int) -> None:
+        self.engine = engine
+
+    def close(self) -> None:
+        """Stops the worker processes of the agent, if any."""
+        if self.__pool is not None:
+            self.__pool.terminate()
+            self.__pool = None
+
+    def play(self, board: Board, player: Player) -> Tuple[Piece, int, int, int] | None:
+        engine = copy(self.engine)
+        engine.agents = []
+        start = time.monotonic()
+
+        seeds = [self.rng.getrandbits(32) for _ in range(self.processes)]
+        if self.processes == 1:
+            results = [search(engine, self.budget, seeds[0], self.exploration)]
+        else:
+            if self.__pool is None:
+                self.__pool = multiprocessing.Pool(self.processes)
+            results = self.__pool.starmap(
+                search, [(engine, self.budget, seed, self.exploration) for seed in seeds])
+
+        statistics = {}
+        for moves, playouts in results:
+            self.playouts += playouts
+            for move, (visits, reward) in moves.items():
+                total_visits, total_reward = statistics.get(move, (0, 0.0))
+                statistics[move] = (total_visits + visits, total_reward + reward)
+        self.elapsed += time.monotonic() - start
+
+        move = max(statistics, key=lambda move: statistics[move], default=None)
+        if move is None:
+            return None
+        slot, orientation, x, y = move
+        return (player.deck.table[slot], orientation, x, y)
@@ -0,0 +1,34 @@
+import random
+
+from typing import Tuple
+
+from ..board import Board
+from ..piece import Piece
+from ..player import Player
+from .agent import Agent
+
+
+class RandomAgent(Agent):
+    """Plays a random legal move.
+
+    A random piece is chosen first, then a random placement of that piece, so only the moves
+    of the pieces tried are generated instead of every legal move of the player.
+    """
+    rng: random.Random
+
+    def __init__(self, seed: int | None = None) -> None:
+        """Create a new RandomAgent
+
+        Args:
+            seed (int | None): Seed of the random generator, for reproducible games.
+        """
+        self.rng = random.Random(seed)
+
+    def play(self, board: Board, player: Player) -> Tuple[Piece, int, int, int] | None:
+        pieces = list(player.deck.pieces)
+        self.rng.shuffle(pieces)
+        for piece in pieces:
+            moves = list(board.legal_moves(player, [piece]))
+            if moves:
+                return self.rng.choice(moves)
+        return None
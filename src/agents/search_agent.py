@@ -0,0 +1,266 @@
+import math
+import time
+
+from copy import copy
+from typing import TYPE_CHECKING, Dict, List, Tuple
+
+from ..board import Board
+from ..piece import Piece
+from ..player import Player
+from ..transposition_table import TranspositionTable
+from .agent import Agent
+from .mcts_agent import Move, apply
+
+if TYPE_CHECKING:
+    from ..engine import Engine
+
+
+class _SearchLimitReached(Exception):
+    """Raised inside the search once the node or time limit is reached."""
+
+
+class SearchAgent(Agent):
+    """Plays the best move of a depth-limited search, deepened until a node or time limit.
+
+    Two searches are available for the 4 players game:
+    - `MAX_N`: each player maximizes its own evaluation.
+    - `PARANOID`: the other players form a coalition minimizing the evaluation of the agent,
+      which reduces the game to two players and allows alpha-beta pruning.
+    Depths count plies, one per turn of a player. Moves are ordered by the best move of the
+    previous iteration (kept in a `TranspositionTable`), the killer moves of the ply,
+    the history of the moves causing cutoffs, then by the size of the piece.
+    The search only depends on the position, so games are reproducible when the node limit
+    is reached before the time limit.
+    The agent needs the state of the whole game, it must play in an `Engine`.
+    """
+    MAX_N: str = "max-n"
+    PARANOID: str = "paranoid"
+    # Evaluation of each anchor of a player, the score counting for one per square
+    ANCHOR_WEIGHT: float = 0.25
+    KILLERS: int = 2
+    # Part of the time limit kept to unwind the search and choose the move to return
+    TIME_RESERVE: float = 0.05
+
+    mode: str
+    max_depth: int
+    nodes: int | None
+    time_limit: float | None
+    engine: "Engine | None"
+    index: int
+    table: TranspositionTable
+    # Moves causing a cutoff at each ply, most recent first
+    killers: Dict[int, List[Move]]
+    # Cutoffs caused by each move of each player, weighted by the depth searched
+    history: Dict[Tuple[int, Move], int]
+    # Nodes searched and depth completed by the last call of `play`
+    searched: int
+    depth: int
+
+    def __init__(self, mode: str = PARANOID, max_depth: int = 8,
+                 nodes: int | None = None, time_limit: float | None = 0.2) -> None:
+        """Create a new SearchAgent
+
+        Args:
+            mode (str): `PARANOID` or `MAX_N`.
+            max_depth (int): Depth at which iterative deepening stops.
+            nodes (int | None): Nodes searched for each move at most.
+            time_limit (float | None): Search time of each move in seconds at most.
+
+        Raises:
+            ValueError: If the mode is unknown.
+        """
+        if mode not in (self.MAX_N, self.PARANOID):
+            raise ValueError(f"unknown search mode {mode!r}")
+        self.mode = mode
+        self.max_depth = max_depth
+        self.nodes = nodes
+        self.time_limit = time_limit
+        self.engine = None
+        self.index = 0
+        self.table = TranspositionTable(1 << 16)
+        self.killers = {}
+        self.history = {}
+        self.searched = 0
+        self.depth = 0
+        self.__deadline = None
+        self.__root_move = None
+        self.__root_moves = None
+
+    def bind(self, engine: "Engine", index: int) -> None:
+        self.engine = engine
+        self.index = index
+
+    def evaluate(self, engine: "Engine") -> List[float]:
+        """Evaluates a position for every player.
+
+        The evaluation is the score of the player, plus its anchors while the game goes on.
+
+        Args:
+            engine (Engine): Game to evaluate.
+
+        Returns:
+            List[float]: Evaluation of each player.
+        """
+        if engine.is_over():
+            return [float(score) for score in engine.scores()]
+        anchors = engine.board.anchors
+        return [player.score() + self.ANCHOR_WEIGHT * anchors.get(player.color.value, 0).bit_count()
+                for player in engine.players]
+
+    def play(self, board: Board, player: Player) -> Tuple[Piece, int, int, int] | None:
+        if self.time_limit is None:
+            self.__deadline = None
+        else:
+            self.__deadline = time.monotonic() + self.time_limit * (1 - self.TIME_RESERVE)
+        engine = copy(self.engine)
+        engine.agents = []
+        self.searched = 0
+        self.depth = 0
+        self.killers = {}
+        self.table.new_search()
+        self.__root_moves = None
+
+        best = None
+        for depth in range(1, self.max_depth + 1):
+            self.__root_move = None
+            try:
+                if self.mode == self.PARANOID:
+                    _, move = self.__paranoid(engine, depth, -math.inf, math.inf, 0)
+                else:
+                    _, move = self.__max_n(engine, depth, 0)
+            except _SearchLimitReached:
+                # The best move of the previous iteration is searched first,
+                # a move found better since then is better at this depth too
+                if self.__root_move is not None or best is None:
+                    best = self.__root_move
+                break
+            best = move
+            self.depth = depth
+
+        if best is None:
+            # The search stopped before a move was searched, the reserve is left to pick one
+            # without ordering the moves again
+            if self.__root_moves is not None:
+                best = self.__root_moves[0]
+            else:
+                best = next(((player.deck.id_of(piece), orientation, x, y) for piece, orientation, x, y
+                             in engine.board.legal_moves(engine.players[engine.current])), None)
+        if best is None:
+            return None
+        slot, orientation, x, y = best
+        return (player.deck.table[slot], orientation, x, y)
+
+    def __count_node(self) -> None:
+        self.searched += 1
+        if self.nodes is not None and self.searched > self.nodes:
+            raise _SearchLimitReached()
+        self.__check_time()
+
+    def __check_time(self) -> None:
+        """Stops the search once the deadline is passed, also called between the nodes
+        as listing the moves and copying the positions take most of the time."""
+        if self.__deadline is not None and time.monotonic() >= self.__deadline:
+            raise _SearchLimitReached()
+
+    def __ordered_moves(self, engine: "Engine", ply: int, best: Move) -> List[Move]:
+        """Lists the moves of the current player, the most promising first."""
+        current = engine.current
+        player = engine.players[current]
+        killers = self.killers.get(ply, [])
+        moves = []
+        for piece, orientation, x, y in engine.board.legal_moves(player):
+            self.__check_time()
+            move = (player.deck.id_of(piece), orientation, x, y)
+            moves.append(((move == best, move in killers, self.history.get((current, move), 0),
+                           len(piece.data)), move))
+        if not moves:
+            return [None]
+        moves.sort(key=lambda item: item[0], reverse=True)
+        moves = [move for _, move in moves]
+        if ply == 0 and self.__root_moves is None:
+            self.__root_moves = moves
+        return moves
+
+    def __cutoff(self, current: int, move: Move, depth: int, ply: int) -> None:
+        """Records a move causing a cutoff, to try it first in other positions."""
+        if move is None:
+            return
+        killers = self.killers.setdefault(ply, [])
+        if move not in killers:
+            killers.insert(0, move)
+            del killers[self.KILLERS:]
+        self.history[(current, move)] = self.history.get((current, move), 0) + depth * depth
+
+    def __paranoid(self, engine: "Engine", depth: int, alpha: float, beta: float,
+                   ply: int) -> Tuple[float, Move]:
+        self.__count_node()
+        if depth == 0 or engine.is_over():
+            values = self.evaluate(engine)
+            others = [value for i, value in enumerate(values) if i != self.index]
+            return values[self.index] - sum(others) / max(len(others), 1), None
+
+        position = engine.hash()
+        entry = self.table.lookup(position)
+        best_move = None
+        if entry is not None:
+            entry_depth, value, flag, best_move = entry
+            if entry_depth >= depth and ply > 0:
+                if (flag == TranspositionTable.EXACT
+                    or (flag == TranspositionTable.LOWER_BOUND and value >= beta)
+                    or (flag == TranspositionTable.UPPER_BOUND and value <= alpha)):
+                    return value, best_move
+
+        maximizing = engine.current == self.index
+        original_alpha, original_beta = alpha, beta
+        best = -math.inf if maximizing else math.inf
+        for move in self.__ordered_moves(engine, ply, best_move):
+            self.__check_time()
+            child = copy(engine)
+            apply(child, move)
+            value, _ = self.__paranoid(child, depth - 1, alpha, beta, ply + 1)
+            if (value > best) if maximizing else (value < best):
+                best, best_move = value, move
+                if ply == 0:
+                    self.__root_move = move
+            if maximizing:
+                alpha = max(alpha, best)
+            else:
+                beta = min(beta, best)
+            if alpha >= beta:
+                self.__cutoff(engine.current, move, depth, ply)
+                break
+
+        if best <= original_alpha:
+            flag = TranspositionTable.UPPER_BOUND
+        elif best >= original_beta:
+            flag = TranspositionTable.LOWER_BOUND
+        else:
+            flag = TranspositionTable.EXACT
+        self.table.store(position, depth, best, flag, best_move)
+        return best, best_move
+
+    def __max_n(self, engine: "Engine", depth: int, ply: int) -> Tuple[List[float], Move]:
+        self.__count_node()
+        if depth == 0 or engine.is_over():
+            return self.evaluate(engine), None
+
+        position = engine.hash()
+        entry = self.table.lookup(position)
+        best_move = None if entry is None else entry[3]
+
+        current = engine.current
+        best = None
+        for move in self.__ordered_moves(engine, ply, best_move):
+            self.__check_time()
+            child = copy(engine)
+            apply(child, move)
+            values, _ = self.__max_n(child, depth - 1, ply + 1)
+            if best is None or values[current] > best[current]:
+                best, best_move = values, move
+                if ply == 0:
+                    self.__root_move = move
+
+        # Without cutoffs, the best moves feed the history
+        self.__cutoff(current, best_move, depth, ply)
+        self.table.store(position, depth, best, TranspositionTable.EXACT, best_move)
+        return best, best_move
@@ -1,18 +1,77 @@
+from typing import TYPE_CHECKING, Dict, Generator, List, Set, Tuple
+
 import numpy as np
 
 from .exceptions import NotAdjacentPieceException, PieceOverlapException, OutOfBoardException
 from .piece import Piece
 from .colors import Colors
+from .zobrist import cell_key
+
+if TYPE_CHECKING:
+    from .player import Player
+
+# Color of the piece previews, not counted in `Board.occupied`
+PREVIEW_COLOR: int = Colors.LIGHT_GRAY.value
 
 
 class Board:
-    """Represents the game board where pieces are placed."""
+    """Represents the game board where pieces are placed.
+
+    Besides the `board` array used for display, the board keeps one bitboard per color:
+    a Python int where the cell `(x, y)` is the bit `y * stride + x`. The stride has one
+    more column than the board so that shifted masks never wrap from a row to the next,
+    which lets the placement rules be checked with a few shifts and ANDs.
+    """
     board: np.ndarray
     # Save of the board for specific context
     backup: np.ndarray | None
     width: int
     height: int
 
+    stride: int
+    # Bitboard of every cell inside the board
+    mask: int
+    # Bitboard of the four corners of the board
+    corners: int
+    # Bitboard of each color, by color value
+    occupancy: Dict[int, int]
+    # Bitboard of every placed piece (previews excluded)
+    occupied: int
+    # Bitboard of the cells sharing a side with each color, by color value
+    forbidden: Dict[int, int]
+    # Bitboard of the anchors of each color, by color value: the empty cells touching
+    # the color by a corner without sharing a side with it, which any next piece must cover
+    anchors: Dict[int, int]
+    # Save of the bitboards (occupancy, forbidden, anchors), of the hash and of the journal length alongside `backup`
+    backup_bitboards: Tuple[Dict[int, int], Dict[int, int], Dict[int, int], int, int] | None
+
+    # Zobrist hash of the cells of the board, see `src.zobrist.position_hash` for the whole position
+    hash: int
+
+    # Changes made by each `put`, most recent last, and the ones undone, most recent last: (data, color, x, y,
+    # cells, previous value of each cell as (index in the flattened board, value) or None if they were empty,
+    # previous (occupancy, forbidden, anchors) of the color (None where it had none), previous (color, occupancy,
+    # anchors) of the other colors covered, previous occupied, previous hash)
+    journal: List[Tuple[Tuple[Tuple[int, int]], int, int, int, int, List[Tuple[int, int]] | None,
+                        Tuple[int | None, int | None, int | None], Tuple[Tuple[int, int, int], ...], int, int]]
+    undone: List[Tuple[Tuple[Tuple[int, int]], int, int, int, int, List[Tuple[int, int]] | None,
+                       Tuple[int | None, int | None, int | None], Tuple[Tuple[int, int, int], ...], int, int]]
+    # Journal entries of the previews pushed and not popped yet, most recent last
+    previews: List[tuple]
+    # Bitboard of the cells changed since the last `render_changes`
+    changed: int
+
+    # Masks of each piece shape, shared by every board with the same stride:
+    # stride -> data -> (cells, edges, diagonals, min_x, min_y, max_x, max_y)
+    __masks: Dict[int, Dict[Tuple[Tuple[int, int]], Tuple[int, int, int, int, int, int, int]]] = {}
+    # Index of each cell of each piece shape in the flattened board, relative to the origin of the piece,
+    # shared by every board with the same width: width -> data -> indexes
+    __indexes: Dict[int, Dict[Tuple[Tuple[int, int]], Tuple[int, ...]]] = {}
+    # Zobrist key of each cell holding each color, by index in the flattened board: (width, height) -> color -> keys
+    __keys: Dict[Tuple[int, int], Dict[int, List[int]]] = {}
+    # Kernels of each piece shape for `placement_mask`: data -> (cells, edges, diagonals)
+    __kernels: Dict[Tuple[Tuple[int, int]], Tuple[List[Tuple[int, int]], ...]] = {}
+
     def __init__(self, width: int, height: int) -> None:
         """Create a new Board
 
@@ -20,24 +79,373 @@ class Board:
             width (int): Width of the board.
             height (int): Height of the board.
         """
-        self.board = np.array([[0 for _ in range(width)] for _ in range(height)])
+        self.board = np.zeros((height, width), dtype=np.uint8)
+        self.backup = None
         self.width = width
         self.height = height
 
-    def put(self, piece: Piece, x: int, y: int) -> None:
+        self.stride = width + 1
+        row = (1 << width) - 1
+        self.mask = 0
+        for y in range(height):
+            self.mask |= row << (y * self.stride)
+        self.corners = (self.bit(0, 0) | self.bit(width - 1, 0)
+                        | self.bit(0, height - 1) | self.bit(width - 1, height - 1))
+        self.occupancy = {}
+        self.occupied = 0
+        self.forbidden = {}
+        self.anchors = {}
+        self.backup_bitboards = None
+        self.hash = 0
+        self.journal = []
+        self.undone = []
+        self.previews = []
+        self.changed = self.mask
+        self.__rows = None
+        self.__bind_caches()
+        self.__bind_cells()
+
+    @classmethod
+    def from_array(cls, board: np.ndarray) -> "Board":
+        """Creates a board over an existing array of cells, without copying it.
+
+        Pieces placed on the board are written into the array, which can be a view
+        of a shared memory block (see `src.board_pool`).
+
+        Args:
+            board (np.ndarray): Color value of each cell, of shape (height, width).
+
+        Returns:
+            Board: The board, its bitboards built from the cells.
+        """
+        height, width = board.shape
+        instance = cls(width, height)
+        instance.board = board
+        instance.__bind_cells()
+        instance.__sync_bitboards()
+        instance.changed = instance.mask
+        return instance
+
+    def __copy__(self) -> "Board":
+        """Copies the cells and the bitboards of the board, without its backup and its journal."""
+        board = Board.__new__(Board)
+        board.__dict__.update(self.__dict__)
+        board.board = self.board.copy()
+        board.__bind_cells()
+        board.occupancy = self.occupancy.copy()
+        board.forbidden = self.forbidden.copy()
+        board.anchors = self.anchors.copy()
+        board.backup = None
+        board.backup_bitboards = None
+        board.journal = []
+        board.undone = []
+        board.previews = []
+        board.changed = self.mask
+        board.__rows = None
+        return board
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        # Shared by every board of the process, rebuilt on demand
+        for cache in ("_Board__piece_masks", "_Board__piece_indexes", "_Board__color_keys", "_Board__cells"):
+            del state[cache]
+        state["_Board__rows"] = None
+        state["changed"] = self.mask
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self.__bind_caches()
+        self.__bind_cells()
+
+    def __bind_caches(self) -> None:
+        """Binds the caches shared by every board of the same size."""
+        self.__piece_masks = Board.__masks.setdefault(self.stride, {})
+        self.__piece_indexes = Board.__indexes.setdefault(self.width, {})
+        self.__color_keys = Board.__keys.setdefault((self.width, self.height), {})
+
+    def __bind_cells(self) -> None:
+        """Keeps a flat view of the `board` array for `put` and `undo`, much faster to index than the array.
+
+        Arrays a view can't be cast from (such as a field of a structured array, see `from_array`)
+        are indexed through their `flat` iterator instead.
+        """
+        board = self.board
+        if board.dtype == np.uint8 and board.flags.c_contiguous:
+            self.__cells = memoryview(board).cast("B")
+        else:
+            self.__cells = None
+
+    def __cell_keys(self, color: int) -> List[int]:
+        """Retrieves the Zobrist key of each cell holding a color, by index in the flattened board."""
+        keys = self.__color_keys.get(color)
+        if keys is None:
+            keys = self.__color_keys[color] = [cell_key(index % self.width, index // self.width, color)
+                                               for index in range(self.width * self.height)]
+        return keys
+
+    def bit(self, x: int, y: int) -> int:
+        """Returns the bitboard of a single cell.
+
+        Args:
+            x (int): Horizontal position of the cell.
+            y (int): Vertical position of the cell.
+
+        Returns:
+            int: Bitboard with only the bit of the cell set.
+        """
+        return 1 << (y * self.stride + x)
+
+    def piece_masks(self, data: Tuple[Tuple[int, int]]) -> Tuple[int, int, int, int, int, int, int]:
+        """Retrieves the bitboard masks of a piece, computing them once per orientation.
+
+        `cells` is relative to the origin of the piece, while `edges` (cells sharing a side
+        with the piece) and `diagonals` (cells touching the piece only by a corner) are relative
+        to one cell up and left of the origin, so they never hold negative coordinates.
+
+        Args:
+            data (tuple): Cells of the piece to compute the masks of.
+
+        Returns:
+            tuple: (cells, edges, diagonals, min_x, min_y, max_x, max_y)
+        """
+        masks = self.__piece_masks.get(data)
+        if masks is None:
+            cells = set(data)
+            edges = set()
+            diagonals = set()
+            for x, y in cells:
+                edges.update([(x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1)])
+                diagonals.update([(x - 1, y - 1), (x + 1, y - 1), (x - 1, y + 1), (x + 1, y + 1)])
+            edges -= cells
+            diagonals -= cells | edges
+
+            to_mask = lambda coords, shift: sum(1 << ((y + shift) * self.stride + x + shift) for x, y in coords)
+            masks = (to_mask(cells, 0), to_mask(edges, 1), to_mask(diagonals, 1),
+                     min(x for x, _ in cells), min(y for _, y in cells),
+                     max(x for x, _ in cells), max(y for _, y in cells))
+            self.__piece_masks[data] = masks
+        return masks
+
+    def shift(self, mask: int, x_offset: int, y_offset: int) -> int:
+        """Moves a bitboard mask by the given offset.
+
+        Bits moved out of the board are dropped, or land in the padding column.
+
+        Args:
+            mask (int): Bitboard to move.
+            x_offset (int): Horizontal offset.
+            y_offset (int): Vertical offset.
+
+        Returns:
+            int: The moved bitboard.
+        """
+        offset = y_offset * self.stride + x_offset
+        return mask << offset if offset >= 0 else mask >> -offset
+
+    def cells_of(self, bitboard: int) -> Generator[Tuple[int, int], None, None]:
+        """Yields the coordinates of each cell set in a bitboard.
+
+        Args:
+            bitboard (int): Bitboard to read.
+
+        Yields:
+            tuple: A tuple containing (x, y) for each cell of the bitboard.
+        """
+        while bitboard:
+            lowest = bitboard & -bitboard
+            index = lowest.bit_length() - 1
+            yield (index % self.stride, index // self.stride)
+            bitboard ^= lowest
+
+    def put(self, piece: Piece, x: int, y: int, color: Colors) -> None:
         """Places a piece on the board at the specified coordinates.
 
-        The piece will be represented with its designated color. 
+        The piece will be represented with the given color.
         If there are already pieces in the target location, 
         the existing values will be overwritten with the new piece's value.
 
+        The anchors are updated only around the piece: its cells are no longer anchors,
+        its sides are forbidden to its color and its free diagonals become anchors.
+        The changed cells are recorded in the journal, so the placement can be undone.
+
         Args:
             piece (Piece): Piece to be placed on the board.
             x_offset (int): Horizontal offset for placement.
             y_offset (int): Vertical offset for placement.
+            color (Colors): Color of the player placing the piece.
+
+        Raises:
+            OutOfBoardException: If a cell of the piece is outside of the board, nothing is changed.
+        """
+        self.undone.clear()
+        self.__put(piece.data, color.value, x, y)
+
+    def __put(self, data: Tuple[Tuple[int, int]], color: int, x: int, y: int) -> None:
+        """Places cells of a color on the board, and records the change in the journal.
+
+        The bitboards are updated in place, and only the previous values of the ones the piece
+        changes are recorded: the bitboards of its color, and those of the colors it covers.
+
+        Args:
+            data (tuple): Cells of the piece.
+            color (int): Value of the color of the piece.
+            x (int): Horizontal offset for placement.
+            y (int): Vertical offset for placement.
+
+        Raises:
+            OutOfBoardException: If a cell of the piece is outside of the board, nothing is changed.
+        """
+        cells, edges, diagonals, min_x, min_y, max_x, max_y = (self.__piece_masks.get(data)
+                                                               or self.piece_masks(data))
+        # Checked before anything is written: NumPy would wrap negative indexes to the opposite edge
+        if min_x + x < 0 or min_y + y < 0 or max_x + x >= self.width or max_y + y >= self.height:
+            raise OutOfBoardException()
+        occupancy = self.occupancy
+        forbidden = self.forbidden
+        anchors = self.anchors
+        board = self.__cells if self.__cells is not None else self.board.flat
+        origin = y * self.width + x
+        indexes = self.__piece_indexes.get(data) or self.__indexes_of(data)
+        # The piece is inside the board, so its cells only shift left, its sides and diagonals
+        # (relative to one cell up and left of it) only shift right when it isn't in the first row or column
+        offset = y * self.stride + x
+        cells <<= offset
+        offset -= self.stride + 1
+        if offset >= 0:
+            edges <<= offset
+            diagonals <<= offset
+        else:
+            edges >>= -offset
+            diagonals >>= -offset
+
+        # Other colors lose the cells covered, from their pieces (previews) and from their anchors
+        covered = occupancy.get(color, 0) & cells
+        others = ()
+        for other, bitboard in occupancy.items():
+            if other != color and (bitboard | anchors[other]) & cells:
+                covered |= bitboard & cells
+                others += ((other, bitboard, anchors[other]),)
+                occupancy[other] = bitboard & ~cells
+                anchors[other] &= ~cells
+        previous = None
+        if covered:
+            previous = [(origin + index, int(board[origin + index])) for index in indexes]
+        own_occupancy, own_forbidden, own_anchors = own = (occupancy.get(color), forbidden.get(color),
+                                                           anchors.get(color))
+        self.journal.append((data, color, x, y, cells, previous, own, others, self.occupied, self.hash))
+
+        keys = self.__color_keys.get(color) or self.__cell_keys(color)
+        hash = self.hash
+        for index in indexes:
+            board[origin + index] = color
+            hash ^= keys[origin + index]
+        if previous is not None:
+            for index, value in previous:
+                if value != 0:
+                    hash ^= self.__cell_keys(value)[index]
+        self.hash = hash
+        self.changed |= cells
+
+        occupancy[color] = (own_occupancy or 0) | cells
+        if color == PREVIEW_COLOR:
+            self.occupied &= ~cells
+        else:
+            self.occupied |= cells
+        own_forbidden = forbidden[color] = (own_forbidden or 0) | (edges & self.mask)
+        anchors[color] = ((own_anchors or 0) | diagonals) & self.mask & ~own_forbidden & ~self.occupied
+
+    def __indexes_of(self, data: Tuple[Tuple[int, int]]) -> Tuple[int, ...]:
+        """Retrieves the index of each cell of a piece in the flattened board, relative to its origin."""
+        indexes = self.__piece_indexes.get(data)
+        if indexes is None:
+            indexes = self.__piece_indexes[data] = tuple(y * self.width + x for x, y in data)
+        return indexes
+
+    def undo(self) -> bool:
+        """Removes the last piece placed, restoring only the cells and the bitboards it changed.
+
+        Returns:
+            bool: False if there was nothing to undo.
+        """
+        if not self.journal:
+            return False
+        entry = self.journal.pop()
+        self.__revert(entry)
+        self.undone.append(entry)
+        return True
+
+    def __revert(self, entry: tuple) -> None:
+        """Restores the cells and the bitboards of the board before a journal entry."""
+        data, color, x, y, cells, previous, own, others, self.occupied, self.hash = entry
+        self.changed |= cells
+        board = self.__cells if self.__cells is not None else self.board.flat
+        if previous is None:
+            origin = y * self.width + x
+            for index in self.__piece_indexes[data]:
+                board[origin + index] = 0
+        else:
+            for index, value in previous:
+                board[index] = value
+        # The three bitboards of a color are set together, by the first piece of the color
+        if own[0] is None:
+            del self.occupancy[color], self.forbidden[color], self.anchors[color]
+        else:
+            self.occupancy[color], self.forbidden[color], self.anchors[color] = own
+        for other, occupancy, anchors in others:
+            self.occupancy[other] = occupancy
+            self.anchors[other] = anchors
+
+    def redo(self) -> bool:
+        """Places again the last piece undone.
+
+        Returns:
+            bool: False if there was nothing to redo.
         """
-        for x_piece, y_piece in piece.iterate_data():
-            self.board[y_piece + y, x_piece + x] = piece.color.value
+        if not self.undone:
+            return False
+        data, color, x, y = self.undone.pop()[:4]
+        self.__put(data, color, x, y)
+        return True
+
+    def push_preview(self, piece: Piece, x: int, y: int, color: Colors = Colors.LIGHT_GRAY) -> None:
+        """Draws a piece on the board, until `pop_preview` is called.
+
+        Unlike `put`, a preview keeps the pieces undone, so they can still be redone.
+
+        Args:
+            piece (Piece): Piece to preview.
+            x (int): Horizontal offset for placement.
+            y (int): Vertical offset for placement.
+            color (Colors): Color of the preview.
+
+        Raises:
+            OutOfBoardException: If a cell of the piece is outside of the board, nothing is changed.
+        """
+        self.__put(piece.data, color.value, x, y)
+        self.previews.append(self.journal[-1])
+
+    def pop_preview(self) -> None:
+        """Removes the last preview pushed, if any. A preview can't be redone.
+
+        Pieces put after the preview stay on the board: they are undone, then put again once the preview is gone.
+        """
+        if not self.previews:
+            return
+        preview = self.previews.pop()
+        index = next((i for i in range(len(self.journal) - 1, -1, -1) if self.journal[i] is preview), None)
+        if index is None:  # already undone
+            return
+        later = self.journal[index + 1:]
+        for entry in reversed(self.journal[index:]):
+            self.__revert(entry)
+        del self.journal[index:]
+        for entry in later:
+            data, color, x, y = entry[:4]
+            self.__put(data, color, x, y)
+            # The previews put again are the new entries
+            if any(other is entry for other in self.previews):
+                self.previews = [self.journal[-1] if other is entry else other for other in self.previews]
 
     def get(self) -> np.ndarray:
         """Returns the current state of the board.
@@ -50,14 +458,76 @@ class Board:
     def save(self) -> None:
         """Saves a backup of the current board state."""
         self.backup = self.board.copy()
+        self.backup_bitboards = (self.occupancy.copy(), self.forbidden.copy(), self.anchors.copy(),
+                                 self.hash, len(self.journal))
 
     def restore(self) -> None:
         """Restores the board to the last saved state."""
         self.board[:] = self.backup
+        occupancy, forbidden, anchors, self.hash, journal_length = self.backup_bitboards
+        self.occupancy = occupancy.copy()
+        self.forbidden = forbidden.copy()
+        self.anchors = anchors.copy()
+        self.__sync_occupied()
+        self.changed = self.mask
+        # Pieces placed after the save are gone
+        del self.journal[journal_length:]
+        self.undone.clear()
+        self.previews = []
 
     def rotate(self) -> None:
         """Rotates the board 90 degrees counterclockwise."""
-        self.board = np.rot90(self.board)
+        self.board = np.ascontiguousarray(np.rot90(self.board))
+        self.__bind_cells()
+        self.__sync_bitboards()
+        self.changed = self.mask
+        self.__rows = None
+        # The cells recorded no longer match the board
+        self.journal.clear()
+        self.undone.clear()
+        self.previews = []
+
+    def __sync_occupied(self) -> None:
+        """Recomputes the bitboard of every placed piece from the bitboard of each color."""
+        self.occupied = 0
+        for color, bitboard in self.occupancy.items():
+            if color != Colors.LIGHT_GRAY.value:  # piece preview
+                self.occupied |= bitboard
+
+    def __sync_bitboards(self) -> None:
+        """Rebuilds the bitboards from the `board` array."""
+        self.occupancy = {}
+        for y, x in zip(*np.nonzero(self.board)):
+            color = int(self.board[y, x])
+            self.occupancy[color] = self.occupancy.get(color, 0) | self.bit(int(x), int(y))
+        self.__sync_occupied()
+
+        self.hash = 0
+        for color, bitboard in self.occupancy.items():
+            for x, y in self.cells_of(bitboard):
+                self.hash ^= cell_key(x, y, color)
+
+        self.forbidden = {}
+        self.anchors = {}
+        for color, bitboard in self.occupancy.items():
+            edges = (self.shift(bitboard, -1, 0) | self.shift(bitboard, 1, 0)
+                     | self.shift(bitboard, 0, -1) | self.shift(bitboard, 0, 1))
+            diagonals = (self.shift(bitboard, -1, -1) | self.shift(bitboard, 1, -1)
+                         | self.shift(bitboard, -1, 1) | self.shift(bitboard, 1, 1))
+            self.forbidden[color] = edges & ~bitboard & self.mask
+            self.anchors[color] = diagonals & ~edges & ~self.occupied & self.mask
+
+    def get_anchors(self, color: Colors) -> Set[Tuple[int, int]]:
+        """Retrieves the anchors of a color.
+
+        Args:
+            color (Colors): Color to retrieve the anchors of.
+
+        Returns:
+            set: Coordinates (x, y) of the empty cells touching the color by a corner
+                 without sharing a side with it.
+        """
+        return set(self.cells_of(self.anchors.get(color.value, 0)))
 
     def is_piece_in_corner_at(self, piece: Piece, x_offset: int, y_offset: int) -> bool:
         """Checks if any part of the piece is positioned in one of the corners of the board.
@@ -70,106 +540,275 @@ class Board:
         Returns:
             bool: True if at least one part of the piece is in a corner; otherwise, False.
         """
-        i = 0
-        data = piece.data
-        while (i < len(data)
-               and not ((y_offset + data[i][1] == 0 and x_offset + data[i][0] == 0)
-                        or (y_offset + data[i][1] == 0 and x_offset + data[i][0] == (self.width - 1))
-                        or (y_offset + data[i][1] == (self.height - 1) and x_offset + data[i][0] == 0)
-                        or (y_offset + data[i][1] == (self.height - 1) and x_offset + data[i][0] == (self.width - 1)))):
-            i += 1
-        return i < len(data)
+        return self.shift(self.piece_masks(piece.data)[0], x_offset, y_offset) & self.corners != 0
 
     def is_piece_overlapping_at(self, piece: Piece, x_offset: int, y_offset: int) -> bool:
         """Checks if the given piece overlaps with existing pieces on the board.
 
+        Pieces previews (drawn with `Colors.LIGHT_GRAY`) are not taken into account.
+
+        Args:
+            piece (Piece): Piece to check.
+            x_offset (int): Horizontal offset for placement.
+            y_offset (int): Vertical offset for placement.
+
+        Returns:
+            bool: True if there is an overlap.
+        """
+        return self.shift(self.piece_masks(piece.data)[0], x_offset, y_offset) & self.occupied != 0
+
+    def is_piece_out_of_board_at(self, piece: Piece, x_offset: int, y_offset: int) -> bool:
+        """Checks if any part of the piece is outside of the board.
+
         Args:
             piece (Piece): Piece to check.
             x_offset (int): Horizontal offset for placement.
             y_offset (int): Vertical offset for placement.
 
         Returns:
-            bool: True if there is no overlap.
+            bool: True if at least one part of the piece is out of the board.
         """
-        # TODO: For a regular developer, `self.backup` might not be clear,
-        # and it's important not to forget to make a backup before each preview.
-        i = 0
-        data = piece.data
-        while i < len(data) and self.backup[data[i][1] + y_offset, data[i][0] + x_offset] in [0, 6]: # 0: empty; 6: piece preview
-            i += 1
-        return i < len(data)
+        _, _, _, min_x, min_y, max_x, max_y = self.piece_masks(piece.data)
+        return (min_x + x_offset < 0 or min_y + y_offset < 0
+                or max_x + x_offset >= self.width or max_y + y_offset >= self.height)
 
-    def can_place_piece_at(self, piece: Piece, x_offset: int, y_offset: int) -> None:
+    def can_place_piece_at(self, piece: Piece, x_offset: int, y_offset: int, color: Colors) -> None:
         """Verifies if the given piece can be placed at the specified coordinates on the board.
 
         This method checks for overlapping pieces and ensures that the piece
-        is adjacent to at least one already placed piece on the board.
+        touches at least one piece of its color by a corner, without sharing a side with any of them.
 
         Args:
             piece (Piece): Piece to be verified for placement.
             x_offset (int): Horizontal offset for placement.
             y_offset (int): Vertical offset for placement.
+            color (Colors): Color of the player placing the piece.
 
         Raises:
             NotAdjacentPieceException: When the piece is not adjacent to any other pieces on the board.
             PieceOverlapException: When the piece overlaps with another piece on the board.
             OutOfBoardException: When the piece coordinate is out of the board
         """
-        for cell_x, cell_y in piece.iterate_data():
-            cell_x += x_offset
-            cell_y += y_offset
-
-            if cell_x < 0 or cell_y < 0 or cell_x >= self.width or cell_y >= self.height:
-                raise OutOfBoardException()
-            if self.is_piece_overlapping_at(piece, x_offset, y_offset):
-                raise PieceOverlapException()
-
-        top_from = lambda tupl: (tupl[1] - 1) + y_offset
-        right_from = lambda tupl: (tupl[0] + 1) + x_offset
-        bottom_from = lambda tupl: (tupl[1] + 1) + y_offset
-        left_from = lambda tupl: (tupl[0] - 1) + x_offset
-
-        # TODO: Improve the readability of the conditions for detecting the corners of the pieces.
-        for top_left in piece.top_left:
-            if (top_from(top_left) >= 0 and left_from(top_left) >= 0
-                and self.board[top_from(top_left), left_from(top_left)] == piece.color.value):
-
-                if self.board[top_from(top_left), top_left[0] + x_offset] == piece.color.value:
-                    raise NotAdjacentPieceException()
-                if self.board[top_left[1] + y_offset, left_from(top_left)] == piece.color.value:
-                    raise NotAdjacentPieceException()
-                return
-
-        for top_right in piece.top_right:
-            if (top_from(top_right) >= 0 and right_from(top_right) < self.width
-                and self.board[top_from(top_right), right_from(top_right)] == piece.color.value):
-
-                if self.board[top_from(top_right), top_right[0] + x_offset] == piece.color.value:
-                    raise NotAdjacentPieceException()
-                if self.board[top_right[1] + y_offset, right_from(top_right)] == piece.color.value:
-                    raise NotAdjacentPieceException()
-                return
-
-        for bottom_left in piece.bottom_left:
-            if (bottom_from(bottom_left) < self.height and left_from(bottom_left) >= 0
-                and self.board[bottom_from(bottom_left), left_from(bottom_left)] == piece.color.value):
-
-                if self.board[bottom_from(bottom_left), bottom_left[0] + x_offset] == piece.color.value:
-                    raise NotAdjacentPieceException()
-                if self.board[bottom_left[1] + y_offset, left_from(bottom_left)] == piece.color.value:
-                    raise NotAdjacentPieceException()
-                return
-
-        for bottom_right in piece.bottom_right:
-            if (bottom_from(bottom_right) < self.height and right_from(bottom_right) < self.width
-                and self.board[bottom_from(bottom_right), right_from(bottom_right)] == piece.color.value):
-                
-                if self.board[bottom_from(bottom_right), bottom_left[0] + x_offset] == piece.color.value:
-                    raise NotAdjacentPieceException()
-                if self.board[bottom_left[1] + y_offset, right_from(bottom_right)] == piece.color.value:
-                    raise NotAdjacentPieceException()
-                return
-        raise NotAdjacentPieceException()
+        masks = self.__piece_masks.get(piece.data) or self.piece_masks(piece.data)
+        cells, edges, diagonals, min_x, min_y, max_x, max_y = masks
+        if (min_x + x_offset < 0 or min_y + y_offset < 0
+            or max_x + x_offset >= self.width or max_y + y_offset >= self.height):
+            raise OutOfBoardException()
+        # The piece is inside the board, so the offset of its cells is never negative
+        offset = y_offset * self.stride + x_offset
+        if (cells << offset) & self.occupied:
+            raise PieceOverlapException()
+
+        own = self.occupancy.get(color.value, 0)
+        # `edges` and `diagonals` start one cell up and left of the piece
+        offset -= self.stride + 1
+        if offset >= 0:
+            edges <<= offset
+            diagonals <<= offset
+        else:
+            edges >>= -offset
+            diagonals >>= -offset
+        if edges & own or not diagonals & own:
+            raise NotAdjacentPieceException()
+
+    def legal_moves(self, player: "Player",
+                    pieces: List[Piece] | None = None) -> Generator[Tuple[Piece, int, int, int], None, None]:
+        """Yields every placement the player can make on the board.
+
+        Only the placements covering one of the anchors of the player (or a free corner
+        of the board for the first piece) with one of the corner cells of the piece are tried,
+        and they are checked with the bitboards so no exception is raised.
+        Pieces of the same shape in the deck are only tried once.
+
+        Args:
+            player (Player): Player to find the moves of.
+            pieces (List[Piece] | None): Pieces of the deck of the player to try, all of them by default.
+
+        Yields:
+            tuple: (piece, orientation, x, y) where `orientation` is the index of the orientation
+                   in `piece.shape.orientations` and (x, y) the offset of the placement.
+        """
+        color = player.color.value
+        if player.deck.is_full():
+            anchors = list(self.cells_of(self.corners & ~self.occupied))
+            forbidden = 0
+        else:
+            anchors = list(self.cells_of(self.anchors.get(color, 0)))
+            forbidden = self.forbidden.get(color, 0)
+        if not anchors:
+            return
+        blocked = self.occupied | forbidden
+
+        shapes = set()
+        for piece in player.deck.pieces if pieces is None else pieces:
+            if piece.shape in shapes:
+                continue
+            shapes.add(piece.shape)
+
+            for index, orientation in enumerate(piece.shape.orientations):
+                cells, _, _, min_x, min_y, max_x, max_y = self.piece_masks(orientation.data)
+                corner_cells = set(orientation.top_left + orientation.top_right
+                                   + orientation.bottom_left + orientation.bottom_right)
+                tried = set()
+                for anchor_x, anchor_y in anchors:
+                    for cell_x, cell_y in corner_cells:
+                        x = anchor_x - cell_x
+                        y = anchor_y - cell_y
+                        if ((x, y) in tried
+                            or min_x + x < 0 or min_y + y < 0
+                            or max_x + x >= self.width or max_y + y >= self.height):
+                            continue
+                        tried.add((x, y))
+                        if not (cells << (y * self.stride + x)) & blocked:
+                            yield (piece, index, x, y)
+
+    def has_legal_move(self, player: "Player") -> bool:
+        """Checks if the player can still place a piece on the board.
+
+        Args:
+            player (Player): Player to check.
+
+        Returns:
+            bool: True if at least one placement is possible.
+        """
+        return next(self.legal_moves(player), None) is not None
+
+    def color_planes(self) -> np.ndarray:
+        """Splits the board into one occupancy plane per color.
+
+        Returns:
+            np.ndarray: Boolean array of shape (len(Colors), height, width),
+                        where `planes[color.value]` holds the cells of that color.
+        """
+        values = np.array([color.value for color in Colors])
+        planes = np.zeros((values.max() + 1, self.height, self.width), dtype=bool)
+        planes[values] = self.board[np.newaxis] == values[:, np.newaxis, np.newaxis]
+        return planes
+
+    def __kernels_of(self, data: Tuple[Tuple[int, int]]) -> Tuple[List[Tuple[int, int]], ...]:
+        """Computes the cells, sides and diagonals of a piece as kernels for `placement_mask`.
+
+        Args:
+            data (tuple): Cells of the piece.
+
+        Returns:
+            tuple: (cells, edges, diagonals), the coordinates of each kernel relative
+                   to one cell up and left of the bounding box of the piece.
+        """
+        min_x = min(x for x, _ in data)
+        min_y = min(y for _, y in data)
+        cells = {(x - min_x + 1, y - min_y + 1) for x, y in data}
+        edges = set()
+        diagonals = set()
+        for x, y in cells:
+            edges.update([(x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1)])
+            diagonals.update([(x - 1, y - 1), (x + 1, y - 1), (x - 1, y + 1), (x + 1, y + 1)])
+        edges -= cells
+        diagonals -= cells | edges
+
+        kernels = (sorted(cells), sorted(edges), sorted(diagonals))
+        Board.__kernels[data] = kernels
+        return kernels
+
+    def placement_mask(self, piece: Piece, color: Colors, first_piece: bool = False) -> np.ndarray:
+        """Computes where the piece, in its current orientation, can be placed on the whole board at once.
+
+        Each rule is a correlation of the piece (its cells, its sides or its diagonals)
+        with an occupancy plane: the plane is viewed through a sliding window for each cell
+        of the kernel, so every offset of the board is evaluated in the same NumPy operation
+        instead of calling `can_place_piece_at` once per cell.
+
+        Args:
+            piece (Piece): Piece to place.
+            color (Colors): Color of the player placing the piece.
+            first_piece (bool): Applies the rules of the first piece of a player: covering
+                                a corner of the board instead of touching its color by a corner.
+
+        Returns:
+            np.ndarray: Boolean array of shape (height, width), where `mask[y, x]` is True
+                        when `can_place_piece_at(piece, x, y, color)` would not raise.
+        """
+        _, _, _, min_x, min_y, max_x, max_y = self.piece_masks(piece.data)
+        result = np.zeros((self.height, self.width), dtype=bool)
+        # One window per offset: the window (y, x) holds the placement at (x - min_x, y - min_y)
+        windows = (self.height - (max_y - min_y), self.width - (max_x - min_x))
+        if windows[0] <= 0 or windows[1] <= 0:
+            return result
+
+        cells, edges, diagonals = Board.__kernels.get(piece.data) or self.__kernels_of(piece.data)
+        def correlate(plane: np.ndarray, kernel: List[Tuple[int, int]]) -> np.ndarray:
+            hit = np.zeros(windows, dtype=bool)
+            for kernel_x, kernel_y in kernel:
+                hit |= plane[kernel_y:kernel_y + windows[0], kernel_x:kernel_x + windows[1]]
+            return hit
+
+        # Planes with a border of one cell, for the sides and diagonals of the piece
+        color_planes = self.color_planes()
+        planes = np.zeros((color_planes.shape[0], self.height + 2, self.width + 2), dtype=bool)
+        planes[:, 1:-1, 1:-1] = color_planes
+        planes[Colors.RESET.value] = False
+        planes[Colors.LIGHT_GRAY.value] = False  # piece preview
+        valid = ~correlate(planes.any(axis=0), cells)
+        if first_piece:
+            corners = planes[Colors.RESET.value]
+            corners[[1, 1, -2, -2], [1, -2, 1, -2]] = True
+            valid &= correlate(corners, cells)
+        else:
+            own = planes[color.value]
+            valid &= ~correlate(own, edges) & correlate(own, diagonals)
+
+        result[:windows[0] - min_y, :windows[1] - min_x] = valid[min_y:, min_x:]
+        return result
+
+    def render_cells(self) -> List[List[str]]:
+        """Renders each cell of the board, with its border, as the string drawn in the terminal.
+
+        Returns:
+            List[List[str]]: Rows of cells, each cell being a color code followed by one character.
+        """
+        frame_str = f"{str(Colors.LIGHT_GRAY)}■"
+        cells_str = self.__cell_strings()
+
+        border = [frame_str] * (self.width + 2)
+        rows = [border]
+        for row in self.board.tolist():
+            rows.append([frame_str] + [cells_str[cell] for cell in row] + [frame_str])
+        rows.append(border)
+        return rows
+
+    def render_changes(self) -> Tuple[List[List[str]], List[Tuple[int, int]] | None]:
+        """Renders the cells changed since the last call, for `Renderer.update`.
+
+        The rows are rendered by `render_cells` on the first call, then only the cells
+        put or restored since (recorded in `changed` alongside the journal) are rendered again.
+
+        Returns:
+            tuple: (rows, changes) where `rows` are the rows of cells of `render_cells`, shared
+                   between calls and not to be modified, and `changes` the (row, column) of each
+                   cell rendered again in them, or None if every cell was.
+        """
+        if self.__rows is None:
+            self.__rows = self.render_cells()
+            self.changed = 0
+            return self.__rows, None
+
+        rows = self.__rows
+        cells_str = self.__cell_strings()
+        board = self.board
+        changes = []
+        # The rows and the columns start with the border
+        for x, y in self.cells_of(self.changed):
+            rows[y + 1][x + 1] = cells_str[int(board[y, x])]
+            changes.append((y + 1, x + 1))
+        self.changed = 0
+        return rows, changes
+
+    @staticmethod
+    def __cell_strings() -> Dict[int, str]:
+        """Retrieves the string drawn for a cell of each color value."""
+        cells_str = {color.value: f"{str(color)}■" for color in Colors}
+        cells_str[Colors.RESET.value] = f"{str(Colors.RESET)} "
+        return cells_str
 
     def display(self) -> None:
         """Displays the current state of the board in the terminal.
@@ -179,22 +818,4 @@ class Board:
             - Each piece is shown as a colored block.
             - Empty spaces are represented as blank spaces.
         """
-        frame_str = f"{str(Colors.LIGHT_GRAY)}■"
-        for y in range(-1, self.height + 1):
-            line = ""
-            for x in range(-1, self.width + 1):
-                if x == -1:
-                    line += frame_str
-                    continue
-                elif x == self.width:
-                    line += frame_str
-                    continue
-
-                if y == -1 or y == self.height:
-                    line += frame_str
-                    continue
-
-                cell = int(self.board[y, x])
-                line += f"{str(Colors(cell))}■" if cell != 0 else f"{str(Colors.RESET)} "
-            print(line)
-
+        print("\n".join("".join(row) for row in self.render_cells()))
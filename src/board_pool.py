@@ -0,0 +1,169 @@
+"""Positions stored in shared memory, for worker processes to read and update without pickling them.
+
+A `BoardPool` is an array of slots in one `multiprocessing.shared_memory` block. A slot holds
+the cells of a board as uint8, the `Deck.mask` and last piece of each player, the player to
+move, and the scores written back by the worker playing the position. Pickling a pool only
+sends the name of the block: the processes receiving it attach to the same memory, and
+`board` and `load_players` give views of a slot instead of copies.
+"""
+from multiprocessing import shared_memory
+from typing import List
+
+import numpy as np
+
+from .board import Board
+from .colors import Colors
+from .piece import Piece
+from .player import Player
+
+
+def slot_dtype(width: int, height: int, players: int) -> np.dtype:
+    """Retrieves the type of a slot of a pool.
+
+    Fields:
+        board: color value of each cell.
+        decks: `Deck.mask` of each player.
+        last: first id of the shape of the last piece placed by each player, -1 before its first piece.
+        current: index of the player to move.
+        scores: score of each player, written by the worker playing the position.
+        done: whether the scores are written.
+    """
+    return np.dtype([
+        ("board", np.uint8, (height, width)),
+        ("decks", np.uint32, (players,)),
+        ("last", np.int8, (players,)),
+        ("current", np.uint8),
+        ("scores", np.int16, (players,)),
+        ("done", np.bool_),
+    ])
+
+
+class BoardPool:
+    """Fixed number of position slots in a shared memory block.
+
+    The process creating the pool owns the block and must `unlink` it when every process is done
+    with it. Processes only share the memory: two processes must not write the same slot at once.
+    """
+    size: int
+    width: int
+    height: int
+    players: int
+    # Every slot, a view of the shared memory
+    slots: np.ndarray
+
+    def __init__(self, size: int, width: int = 20, height: int = 20, players: int = 4,
+                 name: str | None = None) -> None:
+        """Creates a pool, or attaches to the pool of another process.
+
+        Args:
+            size (int): Number of slots.
+            width (int): Width of the boards.
+            height (int): Height of the boards.
+            players (int): Number of players of the positions.
+            name (str | None): Name of the shared memory block to attach to, a new zeroed block if None.
+        """
+        self.size = size
+        self.width = width
+        self.height = height
+        self.players = players
+        dtype = slot_dtype(width, height, players)
+        self.__owner = name is None
+        if name is None:
+            self.__memory = shared_memory.SharedMemory(create=True, size=max(1, size * dtype.itemsize))
+        else:
+            self.__memory = shared_memory.SharedMemory(name=name)
+        self.slots = np.ndarray((size,), dtype=dtype, buffer=self.__memory.buf)
+        if self.__owner:
+            self.slots[...] = np.zeros((), dtype=dtype)
+
+    def __reduce__(self) -> tuple:
+        # Other processes attach to the block instead of receiving its content
+        return BoardPool, (self.size, self.width, self.height, self.players, self.name)
+
+    def __enter__(self) -> "BoardPool":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+        if self.__owner:
+            self.unlink()
+
+    def __len__(self) -> int:
+        return self.size
+
+    @property
+    def name(self) -> str:
+        """Name of the shared memory block."""
+        return self.__memory.name
+
+    def store(self, i: int, board: Board, players: List[Player], current: int = 0) -> None:
+        """Copies a position into a slot, and clears its scores.
+
+        Args:
+            i (int): Index of the slot.
+            board (Board): Board of the position, of the size of the pool.
+            players (List[Player]): Players of the position, in the turn order.
+            current (int): Index of the player to move.
+        """
+        slot = self.slots[i]
+        slot["board"] = board.board
+        self.save_players(i, players, current)
+        slot["scores"] = 0
+        slot["done"] = False
+
+    def board(self, i: int) -> Board:
+        """Retrieves the board of a slot.
+
+        Returns:
+            Board: Board over the cells of the slot, the pieces placed on it are written into the slot.
+        """
+        return Board.from_array(self.slots[i]["board"])
+
+    def load_players(self, i: int, pieces: List[Piece], colors: List[Colors]) -> List[Player]:
+        """Rebuilds the players of a slot from their deck masks.
+
+        Decks are small ints, so they are copied: use `save_players` to write them back.
+
+        Args:
+            i (int): Index of the slot.
+            pieces (List[Piece]): Pieces the decks were created from.
+            colors (List[Colors]): Color of each player.
+
+        Returns:
+            List[Player]: Players of the position, in the turn order.
+        """
+        slot = self.slots[i]
+        players = []
+        for j, color in enumerate(colors):
+            player = Player(color, pieces)
+            player.deck.mask = int(slot["decks"][j])
+            player.deck.apply_color(color)
+            last = int(slot["last"][j])
+            player.last_piece = None if last < 0 else player.deck.table[last]
+            players.append(player)
+        return players
+
+    def save_players(self, i: int, players: List[Player], current: int = 0) -> None:
+        """Writes the decks of the players and the player to move back into a slot."""
+        slot = self.slots[i]
+        for j, player in enumerate(players):
+            slot["decks"][j] = player.deck.mask
+            slot["last"][j] = -1 if player.last_piece is None else next(
+                piece_id for piece_id, piece in enumerate(player.deck.table)
+                if piece.shape is player.last_piece.shape)
+        slot["current"] = current
+
+    def set_scores(self, i: int, scores: List[int]) -> None:
+        """Writes the result of the position of a slot."""
+        slot = self.slots[i]
+        slot["scores"] = scores
+        slot["done"] = True
+
+    def close(self) -> None:
+        """Detaches the process from the pool, its views must not be used anymore."""
+        self.slots = None
+        self.__memory.close()
+
+    def unlink(self) -> None:
+        """Frees the shared memory block, once every process closed the pool."""
+        self.__memory.unlink()
@@ -0,0 +1,164 @@
+import asyncio
+
+from collections import deque
+from typing import Callable, Deque, Dict, List
+
+from .agents import Agent
+from .colors import Colors
+from .engine import Engine
+from .piece import Piece
+from .server import HOST, PORT, pass_turns
+
+
+class Client:
+    """Connection to a `Server`, keeping a copy of the games it holds seats in.
+
+    Events are read with `receive`, which updates the copies of the games before returning them,
+    so the boards and the decks are up to date when a TURN event is handled.
+    See `src.server` for the protocol.
+    """
+    pieces: List[Piece]
+    # Copy of each game the client holds seats in, and the seats held
+    games: Dict[int, Engine]
+    seats: Dict[int, List[int]]
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, pieces: List[Piece]) -> None:
+        """Create a new Client, see `connect`.
+
+        Args:
+            reader (asyncio.StreamReader): Lines coming from the server.
+            writer (asyncio.StreamWriter): Lines sent to the server.
+            pieces (List[Piece]): Pieces of the decks of the games, the same as the server.
+        """
+        self.pieces = pieces
+        self.games = {}
+        self.seats = {}
+        self.__reader = reader
+        self.__writer = writer
+        # Events read while waiting for the reply to a command
+        self.__pending: Deque[List[str]] = deque()
+
+    @classmethod
+    async def connect(cls, pieces: List[Piece], host: str = HOST, port: int = PORT) -> "Client":
+        reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer, pieces)
+
+    async def close(self) -> None:
+        self.__writer.close()
+        await self.__writer.wait_closed()
+
+    async def send(self, *words) -> None:
+        self.__writer.write((" ".join(str(word) for word in words) + "\n").encode())
+        await self.__writer.drain()
+
+    async def receive(self) -> List[str]:
+        """Waits for the next event from the server.
+
+        Returns:
+            List[str]: Words of the event line.
+
+        Raises:
+            ConnectionError: If the server closed the connection.
+        """
+        if self.__pending:
+            return self.__pending.popleft()
+        return await self.__read()
+
+    async def new_game(self, players: int, seed: int | None = None) -> int:
+        """Creates a game on the server.
+
+        Returns:
+            int: Identifier of the game.
+        """
+        await self.send("NEW", players, *([] if seed is None else [seed]))
+        return int((await self.__reply("GAME"))[1])
+
+    async def join(self, game: int) -> int:
+        """Takes the next free seat of a game.
+
+        Returns:
+            int: Index of the seat in the turn order.
+        """
+        await self.send("JOIN", game)
+        return int((await self.__reply("SEAT"))[2])
+
+    async def move(self, game: int, piece: Piece, orientation: int, x: int, y: int) -> None:
+        """Sends the move of the seat to move. The server replies with a PLAYED or an ERROR event.
+
+        Args:
+            game (int): Identifier of the game.
+            piece (Piece): Piece of the deck of the seat, in the copy of the game.
+            orientation (int): Index of the orientation in `piece.shape.orientations`.
+            x (int): Horizontal offset of the placement.
+            y (int): Vertical offset of the placement.
+        """
+        slot = self.games[game].players[self.games[game].current].deck.id_of(piece)
+        await self.send("MOVE", game, slot, orientation, x, y)
+
+    async def pass_turn(self, game: int) -> None:
+        """Passes the turn of the seat to move. The server replies with a PASSED or an ERROR event."""
+        await self.send("PASS", game)
+
+    async def play(self, agent: Callable[[int], Agent], game: int) -> List[int]:
+        """Plays the seats of the client in a game, one agent per seat, until the game is over.
+
+        Args:
+            agent (Callable[[int], Agent]): Factory of the agent of each seat, from the index of the seat.
+            game (int): Identifier of the game.
+
+        Returns:
+            List[int]: Score of each seat.
+        """
+        engine = self.games[game]
+        agents = {}
+        for seat in self.seats[game]:
+            agents[seat] = agent(seat)
+            agents[seat].bind(engine, seat)
+        while True:
+            event = await self.receive()
+            if event[0] == "OVER" and int(event[1]) == game:
+                return [int(score) for score in event[2:]]
+            if event[0] == "TURN" and int(event[1]) == game and int(event[2]) in agents:
+                move = agents[int(event[2])].play(engine.board, engine.players[engine.current])
+                if move is None:
+                    await self.pass_turn(game)
+                else:
+                    await self.move(game, *move)
+
+    async def __reply(self, kind: str) -> List[str]:
+        while True:
+            event = await self.__read()
+            if event[0] == kind:
+                return event
+            if event[0] == "ERROR":
+                raise RuntimeError(" ".join(event[1:]))
+            self.__pending.append(event)
+
+    async def __read(self) -> List[str]:
+        line = await self.__reader.readline()
+        if not line:
+            raise ConnectionError("connection closed by the server")
+        event = line.decode().split()
+        self.__update(event)
+        return event
+
+    def __update(self, event: List[str]) -> None:
+        """Applies an event to the copy of its game."""
+        match event:
+            case ["SEAT", game, seat, colors]:
+                game = int(game)
+                if game not in self.games:
+                    colors = [Colors(int(value)) for value in colors.split(",")]
+                    self.games[game] = Engine([Agent() for _ in colors], self.pieces, colors=colors)
+                self.seats.setdefault(game, []).append(int(seat))
+            case ["TURN", game, _]:
+                pass_turns(self.games[int(game)])
+            case ["PLAYED", game, _, slot, orientation, x, y]:
+                engine = self.games[int(game)]
+                piece = engine.players[engine.current].deck.table[int(slot)]
+                engine.apply((piece, int(orientation), int(x), int(y)))
+            case ["PASSED", game, _]:
+                self.games[int(game)].apply(None)
+            case ["OVER", game, *_]:
+                self.seats.pop(int(game), None)
+                self.games.pop(int(game), None)
@@ -0,0 +1,310 @@
+"""Self-play training data, streamed into fixed-size memory-mapped shards.
+
+Each shard is a `.npy` file of `shard_size` rows of `position_dtype`, created full size and
+filled game after game through a memory map, so exporting a dataset larger than the memory
+only keeps one game in memory. A row is the position before a move: the board, the player
+to move, the pieces left to every player, the move played (as a `PlacementIndex` move id)
+and the final scores of the game.
+
+Rows are filled from the start of a shard and a game never spans two shards, the empty rows
+at the end of a shard having `game == 0`. Several writers, for example one per process, write
+their own shards side by side in the same directory. A writer reopening its last shard resumes
+after the last complete game, dropping the rows of a game interrupted while being written.
+"""
+import bisect
+import multiprocessing
+import os
+import random
+import re
+
+from typing import Callable, Iterator, List, Tuple
+
+import numpy as np
+
+from .agents import Agent, RandomAgent
+from .engine import Engine
+from .placement_index import PlacementIndex
+from .resources import PIECES_PATH, load_pieces
+
+MAX_PLAYERS: int = 4
+SHARD_SIZE: int = 1 << 16
+# Shards of writer `writer`, numbered from 0
+SHARD_NAME: str = "positions-{writer:03d}-{shard:05d}.npy"
+SHARD_PATTERN = re.compile(r"positions-(\d{3})-(\d{5})\.npy")
+
+
+def position_dtype(width: int = Engine.WIDTH, height: int = Engine.HEIGHT) -> np.dtype:
+    """Retrieves the type of a row of the shards of a board size.
+
+    Fields:
+        board: the `Board.board` array before the move.
+        player, color: index in the turn order and color value of the player to move.
+        decks: `Deck.mask` of each player, 0 for the missing players.
+        move: `PlacementIndex` id of the move played.
+        scores: final score of each player, 0 for the missing players.
+        game: number of the game in the shards of its writer, from 1, 0 for the empty rows.
+        ply, plies: index of the position in its game, and number of positions of the game.
+    """
+    return np.dtype([
+        ("board", np.uint8, (height, width)),
+        ("player", np.uint8),
+        ("color", np.uint8),
+        ("decks", np.uint32, (MAX_PLAYERS,)),
+        ("move", np.int32),
+        ("scores", np.int16, (MAX_PLAYERS,)),
+        ("game", np.uint32),
+        ("ply", np.uint16),
+        ("plies", np.uint16),
+    ])
+
+
+def play_game(engine: Engine, index: PlacementIndex) -> np.ndarray:
+    """Plays a game until its end, recording the position before each move.
+
+    Passes are not recorded. The `game` field is left to the writer.
+
+    Args:
+        engine (Engine): Game to play, with its agents.
+        index (PlacementIndex): Placement index of the board and pieces of the game.
+
+    Returns:
+        np.ndarray: One row of `position_dtype` per move played.
+    """
+    board = engine.board
+    rows = []
+    while not engine.is_over():
+        player = engine.current
+        before = board.board.astype(np.uint8)
+        decks = [p.deck.mask for p in engine.players]
+        move = engine.step()
+        if move is not None:
+            piece, orientation, x, y = move
+            move_id = index.move_id(piece.oriented(orientation), x, y)
+            rows.append((before, player, engine.players[player].color.value, decks, move_id))
+
+    positions = np.zeros(len(rows), dtype=position_dtype(board.width, board.height))
+    scores = engine.scores()
+    for ply, (before, player, color, decks, move_id) in enumerate(rows):
+        positions[ply]["board"] = before
+        positions[ply]["player"] = player
+        positions[ply]["color"] = color
+        positions[ply]["decks"][:len(decks)] = decks
+        positions[ply]["move"] = move_id
+    positions["scores"][:, :len(scores)] = scores
+    positions["ply"] = np.arange(len(rows))
+    positions["plies"] = len(rows)
+    return positions
+
+
+class ShardWriter:
+    """Appends games to the shards of one writer of a directory.
+
+    Use one writer number per process writing in the same directory at the same time.
+    """
+    directory: str
+    writer: int
+    shard_size: int
+    dtype: np.dtype
+    # Number of the current shard, rows filled in it, and games written by the writer
+    shard: int
+    count: int
+    games: int
+
+    def __init__(self, directory: str, writer: int = 0, shard_size: int = SHARD_SIZE,
+                 width: int = Engine.WIDTH, height: int = Engine.HEIGHT) -> None:
+        """Opens the last shard of a writer, or creates the first one.
+
+        Args:
+            directory (str): Directory of the shards, created if needed.
+            writer (int): Number of the writer, from 0 to 999.
+            shard_size (int): Rows of each new shard.
+            width (int): Width of the boards.
+            height (int): Height of the boards.
+
+        Raises:
+            ValueError: If the last shard doesn't hold positions of this board size.
+        """
+        self.directory = directory
+        self.writer = writer
+        self.shard_size = shard_size
+        self.dtype = position_dtype(width, height)
+        self.__map = None
+        os.makedirs(directory, exist_ok=True)
+
+        shards = [shard for other, shard in shard_files(directory) if other == writer]
+        self.shard = max(shards, default=0)
+        self.count = 0
+        self.games = 0
+        if shards:
+            self.__open(mode="r+")
+            if self.__map.dtype != self.dtype:
+                raise ValueError(f"{self.__path()} holds positions of another board size")
+            self.__resume()
+        else:
+            self.__open(mode="w+")
+
+    def __enter__(self) -> "ShardWriter":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def write(self, positions: np.ndarray) -> None:
+        """Appends the positions of a game, in a new shard if they don't fit in the current one.
+
+        Args:
+            positions (np.ndarray): Rows of `position_dtype` of one game, see `play_game`.
+
+        Raises:
+            ValueError: If the game has more positions than a shard has rows.
+        """
+        if len(positions) > self.shard_size:
+            raise ValueError(f"a game of {len(positions)} positions doesn't fit in shards of {self.shard_size}")
+        if self.count + len(positions) > len(self.__map):
+            self.__map.flush()
+            self.shard += 1
+            self.count = 0
+            self.__open(mode="w+")
+
+        self.games += 1
+        rows = self.__map[self.count:self.count + len(positions)]
+        rows[...] = positions
+        rows["game"] = self.games
+        self.count += len(positions)
+        self.__map.flush()
+
+    def close(self) -> None:
+        if self.__map is not None:
+            self.__map.flush()
+            self.__map = None
+
+    def __path(self) -> str:
+        return os.path.join(self.directory, SHARD_NAME.format(writer=self.writer, shard=self.shard))
+
+    def __open(self, mode: str) -> None:
+        if mode == "w+":
+            self.__map = np.lib.format.open_memmap(self.__path(), mode="w+", dtype=self.dtype,
+                                                   shape=(self.shard_size,))
+        else:
+            self.__map = np.load(self.__path(), mmap_mode="r+")
+
+    def __resume(self) -> None:
+        """Finds the end of the last shard, and drops the rows of an incomplete last game."""
+        games = self.__map["game"]
+        # Rows are filled from the start, so the filled ones come first
+        self.count = bisect.bisect_left(range(len(games)), True, key=lambda i: games[i] == 0)
+        if self.count == 0:
+            self.games = self.__previous_games()
+            return
+        last = self.__map[self.count - 1]
+        game, ply, plies = int(last["game"]), int(last["ply"]), int(last["plies"])
+        if ply + 1 != plies:
+            start = self.count - 1 - ply
+            self.__map[start:self.count] = np.zeros(self.count - start, dtype=self.dtype)
+            self.__map.flush()
+            self.count = start
+            game -= 1
+        self.games = game
+
+    def __previous_games(self) -> int:
+        """Counts the games of the shards before the current one, which is empty."""
+        if self.shard == 0:
+            return 0
+        path = os.path.join(self.directory, SHARD_NAME.format(writer=self.writer, shard=self.shard - 1))
+        return int(np.load(path, mmap_mode="r")["game"].max())
+
+
+def shard_files(directory: str) -> List[Tuple[int, int]]:
+    """Lists the shards of a directory.
+
+    Returns:
+        List[tuple]: (writer, shard) of each shard, in order.
+    """
+    if not os.path.isdir(directory):
+        return []
+    return sorted((int(match[1]), int(match[2]))
+                  for match in map(SHARD_PATTERN.fullmatch, os.listdir(directory)) if match)
+
+
+class ShardReader:
+    """Reads the positions of the shards of a directory, through read-only memory maps."""
+    directory: str
+
+    def __init__(self, directory: str) -> None:
+        """Create a new ShardReader
+
+        Args:
+            directory (str): Directory of the shards.
+        """
+        self.directory = directory
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        """Iterates over the filled rows of each shard, writer by writer.
+
+        Yields:
+            np.ndarray: Memory-mapped rows of `position_dtype`, read from the disk when accessed.
+        """
+        for writer, shard in shard_files(self.directory):
+            positions = np.load(os.path.join(self.directory, SHARD_NAME.format(writer=writer, shard=shard)),
+                                mmap_mode="r")
+            games = positions["game"]
+            yield positions[:bisect.bisect_left(range(len(games)), True, key=lambda i: games[i] == 0)]
+
+    def __len__(self) -> int:
+        return sum(len(positions) for positions in self)
+
+
+def _export(task: Tuple[str, int, int, int, int, Callable[[int], Agent], str]) -> int:
+    """Plays and writes the games of one writer, skipping the games already written.
+
+    Args:
+        task (tuple): (directory, writer, games, shard_size, seed, agent factory, pieces path),
+                      as built by `export_self_play`.
+
+    Returns:
+        int: Number of games played.
+    """
+    directory, writer_number, games, shard_size, seed, agent, pieces_path = task
+    pieces = load_pieces(pieces_path)
+    index = PlacementIndex.of(Engine.WIDTH, Engine.HEIGHT, pieces)
+    played = 0
+    with ShardWriter(directory, writer_number, shard_size) as writer:
+        while writer.games < games:
+            # The seed of a game only depends on its writer and number, so resuming plays the same games
+            game_seed = random.Random(f"{seed}-{writer_number}-{writer.games}").getrandbits(32)
+            colors = Engine.PLAYERS_COLOR.copy()
+            random.Random(game_seed).shuffle(colors)
+            agents = [agent(game_seed * MAX_PLAYERS + seat) for seat in range(MAX_PLAYERS)]
+            writer.write(play_game(Engine(agents, pieces, colors=colors), index))
+            played += 1
+    return played
+
+
+def export_self_play(directory: str, games: int, agent: Callable[[int], Agent] = RandomAgent,
+                     processes: int = 1, shard_size: int = SHARD_SIZE, seed: int = 0,
+                     pieces_path: str = PIECES_PATH) -> int:
+    """Plays self-play games and exports their positions, resuming an interrupted export.
+
+    Games are shared between `processes` writers, writer `i` playing and writing its games in
+    its own shards. Running the export again with the same arguments plays only the missing
+    games, and with a larger `games` appends new ones.
+
+    Args:
+        directory (str): Directory of the shards.
+        games (int): Number of games of the dataset, across all the writers.
+        agent (Callable[[int], Agent]): Factory of the agent of each seat from a seed, picklable
+                                        when several processes are used.
+        processes (int): Number of writers, each in its own process when more than 1.
+        shard_size (int): Rows of each shard.
+        seed (int): Seed of the dataset.
+        pieces_path (str): Directory containing the pieces files.
+
+    Returns:
+        int: Number of games played.
+    """
+    tasks = [(directory, writer, games // processes + (writer < games % processes), shard_size,
+              seed, agent, pieces_path) for writer in range(processes)]
+    if processes == 1:
+        return _export(tasks[0])
+    with multiprocessing.Pool(processes) as pool:
+        return sum(pool.map(_export, tasks))
@@ -0,0 +1,145 @@
+from copy import copy
+from typing import List, Tuple
+
+from .agents import Agent
+from .board import Board
+from .colors import Colors
+from .piece import Piece
+from .player import Player
+from .player.deck import Deck
+from .zobrist import position_hash
+
+
+class Engine:
+    """Runs a game between agents, without any input or output.
+
+    The engine handles the turn order, the players passing when they can't place
+    any piece anymore, the end of the game and the scores. Agents are called in turn
+    with the board and their player, and their moves are applied with `Player.place_piece`.
+    """
+    PLAYERS_COLOR: List[Colors] = [Colors.BLUE, Colors.GREEN, Colors.RED, Colors.YELLOW]
+    WIDTH: int = 20
+    HEIGHT: int = 20
+
+    board: Board
+    players: List[Player]
+    agents: List[Agent]
+    # Index of the player whose turn it is
+    current: int
+    # Players who can't place any piece anymore
+    finished: List[bool]
+    # Moves played, as (player index, piece, orientation, x, y)
+    moves: List[Tuple[int, Piece, int, int, int]]
+
+    def __init__(self, agents: List[Agent], pieces: List[Piece],
+                 board: Board | None = None, colors: List[Colors] | None = None,
+                 deck_size: int = Deck.MAX_SIZE) -> None:
+        """Create a new Engine
+
+        Args:
+            agents (List[Agent]): One agent per player, in the turn order.
+            pieces (List[Piece]): Pieces given to each player.
+            board (Board | None): Game board, an empty 20x20 board by default.
+            colors (List[Colors] | None): Color of each player, `PLAYERS_COLOR` by default.
+            deck_size (int): Number of pieces, for variants played with another set (see `src.polyominoes`).
+        """
+        colors = self.PLAYERS_COLOR if colors is None else colors
+        self.board = Board(self.WIDTH, self.HEIGHT) if board is None else board
+        self.agents = agents
+        self.players = [Player(colors[i], pieces, deck_size) for i in range(len(agents))]
+        self.current = 0
+        self.finished = [False for _ in agents]
+        self.moves = []
+        for index, agent in enumerate(agents):
+            agent.bind(self, index)
+
+    def __copy__(self) -> "Engine":
+        """Copies the state of the game, for search agents to play it further.
+
+        The copy shares the agents and the pieces, but has its own board and decks.
+        """
+        engine = Engine.__new__(Engine)
+        engine.board = copy(self.board)
+        engine.agents = self.agents
+        engine.players = [copy(player) for player in self.players]
+        engine.current = self.current
+        engine.finished = self.finished.copy()
+        engine.moves = self.moves.copy()
+        return engine
+
+    def is_over(self) -> bool:
+        """Checks if the game is over.
+
+        Returns:
+            bool: True when no player can place a piece anymore.
+        """
+        return all(self.finished)
+
+    def step(self) -> Tuple[Piece, int, int, int] | None:
+        """Plays the turn of the current player, then gives the turn to the next player still playing.
+
+        Returns:
+            tuple | None: The move played as (piece, orientation, x, y), 
+                          or None if the player passed.
+        """
+        move = self.agents[self.current].play(self.board, self.players[self.current])
+        self.apply(move)
+        return move
+
+    def apply(self, move: Tuple[Piece, int, int, int] | None) -> None:
+        """Plays a move for the current player, then gives the turn to the next player still playing.
+
+        Args:
+            move (tuple | None): (piece, orientation, x, y) as yielded by `Board.legal_moves`,
+                                 or None if the player passes.
+        """
+        player = self.players[self.current]
+        if move is None:
+            # The board only fills up, a player without legal moves is done for the game
+            self.finished[self.current] = not player.has_legal_move(self.board)
+        else:
+            piece, orientation, x, y = move
+            piece = piece.oriented(orientation)
+            player.place_piece(self.board, piece, x, y)
+            self.moves.append((self.current, piece, orientation, x, y))
+            self.finished[self.current] = player.deck.size() == 0
+
+        if not self.is_over():
+            self.current = (self.current + 1) % len(self.players)
+            while self.finished[self.current]:
+                self.current = (self.current + 1) % len(self.players)
+
+    def hash(self) -> int:
+        """Computes the Zobrist hash of the current position.
+
+        Returns:
+            int: Hash of the cells of the board, the pieces left to each player and the player to move.
+        """
+        return position_hash(self.board, self.players, self.current)
+
+    def run(self) -> List[int]:
+        """Plays the game until its end.
+
+        Returns:
+            List[int]: Score of each player.
+        """
+        while not self.is_over():
+            self.step()
+        return self.scores()
+
+    def scores(self) -> List[int]:
+        """Retrieves the current score of each player.
+
+        Returns:
+            List[int]: Score of each player, see `Player.score`.
+        """
+        return [player.score() for player in self.players]
+
+    def winners(self) -> List[int]:
+        """Retrieves the players with the best score.
+
+        Returns:
+            List[int]: Indexes of the players sharing the best score.
+        """
+        scores = self.scores()
+        return [i for i, score in enumerate(scores) if score == max(scores)]
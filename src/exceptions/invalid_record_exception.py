@@ -0,0 +1,3 @@
+class InvalidRecordException(Exception):
+    def __init__(self, message="The game record file is invalid or truncated."):
+        super().__init__(message)
@@ -0,0 +1,111 @@
+"""Feature planes of many positions at once, for training models.
+
+Positions are stacked as an (N, height, width) array of `Board.board` values, and every
+function works on the whole stack in a few NumPy operations instead of a Python loop per board.
+Results can be written into preallocated arrays with `out`, so a training loop can reuse
+its buffers instead of allocating new ones for each batch.
+"""
+from typing import Sequence
+
+import numpy as np
+
+from .board import Board
+from .colors import Colors
+from .player.deck import Deck
+
+# Planes computed for each color, in this order: see `board_features`
+PLANES_PER_COLOR: int = 3
+
+
+def stack_boards(boards: Sequence[Board], out: np.ndarray | None = None) -> np.ndarray:
+    """Stacks the arrays of boards of the same size.
+
+    Args:
+        boards (Sequence[Board]): Boards to stack.
+        out (np.ndarray | None): Array of shape (N, height, width) to write into, a new uint8 array if None.
+
+    Returns:
+        np.ndarray: The stack of the `board` arrays.
+    """
+    if out is None:
+        out = np.empty((len(boards), boards[0].height, boards[0].width), dtype=np.uint8)
+    for i, board in enumerate(boards):
+        out[i] = board.board
+    return out
+
+
+def board_features(boards: np.ndarray, colors: Sequence[Colors], out: np.ndarray | None = None) -> np.ndarray:
+    """Computes the occupancy, forbidden and anchor planes of each color over a stack of boards.
+
+    The planes follow the bitboards of `Board`: the forbidden cells of a color are the cells
+    sharing a side with it, and its anchors the empty cells touching it by a corner only.
+    Previews (`Colors.LIGHT_GRAY`) are ignored.
+
+    Args:
+        boards (np.ndarray): Stack of `Board.board` arrays, of shape (N, height, width). Any integer
+                             dtype is read in place, without being converted or copied.
+        colors (Sequence[Colors]): Colors to compute the planes of, usually the colors of the players.
+        out (np.ndarray | None): Boolean array of shape (N, 3 * len(colors), height, width) to write into,
+                                 a new C-contiguous array if None.
+
+    Raises:
+        ValueError: If `boards` or `out` doesn't have the expected shape or dtype.
+
+    Returns:
+        np.ndarray: Planes of shape (N, 3 * len(colors), height, width): the occupancy of each
+                    color, then the forbidden cells of each color, then the anchors of each color.
+    """
+    if boards.ndim != 3:
+        raise ValueError(f"expected a stack of boards of shape (N, height, width), not {boards.shape}")
+    n, height, width = boards.shape
+    count = len(colors)
+    shape = (n, PLANES_PER_COLOR * count, height, width)
+    if out is None:
+        out = np.empty(shape, dtype=bool)
+    elif out.shape != shape or out.dtype != bool:
+        raise ValueError(f"expected a boolean array of shape {shape} to write into")
+
+    occupancy = out[:, :count]
+    forbidden = out[:, count:2 * count]
+    anchors = out[:, 2 * count:]
+    values = np.array([color.value for color in colors], dtype=boards.dtype).reshape(1, count, 1, 1)
+    np.equal(boards[:, np.newaxis], values, out=occupancy)
+
+    # Sides and diagonals of each color, shifted by slicing so no padded copy is made
+    edges = np.zeros((n, count, height, width), dtype=bool)
+    edges[..., 1:, :] |= occupancy[..., :-1, :]
+    edges[..., :-1, :] |= occupancy[..., 1:, :]
+    edges[..., :, 1:] |= occupancy[..., :, :-1]
+    edges[..., :, :-1] |= occupancy[..., :, 1:]
+    np.greater(edges, occupancy, out=forbidden)
+
+    anchors[...] = False
+    anchors[..., 1:, 1:] |= occupancy[..., :-1, :-1]
+    anchors[..., 1:, :-1] |= occupancy[..., :-1, 1:]
+    anchors[..., :-1, 1:] |= occupancy[..., 1:, :-1]
+    anchors[..., :-1, :-1] |= occupancy[..., 1:, 1:]
+    edges |= ((boards != Colors.RESET.value) & (boards != Colors.LIGHT_GRAY.value))[:, np.newaxis]
+    np.greater(anchors, edges, out=anchors)
+    return out
+
+
+def remaining_pieces(decks: Sequence[Deck], out: np.ndarray | None = None,
+                     deck_size: int = Deck.MAX_SIZE) -> np.ndarray:
+    """Encodes the pieces left in decks, one boolean per piece id.
+
+    Args:
+        decks (Sequence[Deck]): Decks to encode, for example the deck of each player of each position
+                                flattened in the order of `colors` of `board_features`.
+        out (np.ndarray | None): Boolean array of shape (N, deck_size) to write into, a new array if None.
+        deck_size (int): Number of pieces of the decks, up to 64.
+
+    Returns:
+        np.ndarray: Array of shape (N, deck_size), where `pieces[i, id]` is True while the
+                    piece of id `id` is in the deck `i` (see `Deck.mask`).
+    """
+    masks = np.fromiter((deck.mask for deck in decks), dtype=np.uint64, count=len(decks))
+    bits = np.arange(deck_size, dtype=np.uint64)
+    if out is None:
+        out = np.empty((len(decks), deck_size), dtype=bool)
+    np.not_equal((masks[:, np.newaxis] >> bits) & 1, 0, out=out)
+    return out
@@ -0,0 +1,197 @@
+"""Optional counters and timers over the hot paths of the game.
+
+While enabled, the instrumented methods are replaced on their classes by wrappers counting
+the calls, timing them with the monotonic clock and counting the exceptions they raise by
+type, such as the rule exceptions of `Board.can_place_piece_at`. Disabled, the original methods
+are put back, so the instrumentation costs nothing. Only the current process is instrumented.
+
+    instrumentation.enable()
+    ...
+    print(instrumentation.to_prometheus())
+"""
+import functools
+import inspect
+import json
+import time
+
+from typing import Callable, Dict, List, Tuple
+
+from .agents import Agent
+from .board import Board
+from .piece import Piece
+from .player import Player
+from .player.deck import Deck
+from .renderer import Renderer
+
+
+class Metric:
+    """Calls of an instrumented method."""
+    __slots__ = ("calls", "seconds", "errors")
+    calls: int
+    # Time spent in the calls, exceptions included
+    seconds: float
+    # Number of calls that raised each exception, by exception name
+    errors: Dict[str, int]
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.seconds = 0.0
+        self.errors = {}
+
+    def to_dict(self) -> dict:
+        return {"calls": self.calls, "seconds": self.seconds, "errors": dict(self.errors)}
+
+
+class Instrumentation:
+    """Set of methods to instrument, and their metrics.
+
+    The module-level `instrumentation` instruments the rules, the rendering and the agents;
+    other methods (such as the input handling of the terminal interface) can be added with `instrument`.
+    """
+    # Methods instrumented by default: (class, method, metric name)
+    TARGETS: List[Tuple[type, str, str]] = [
+        (Board, "put", "board.put"),
+        (Board, "can_place_piece_at", "board.can_place_piece_at"),
+        (Player, "place_piece", "player.place_piece"),
+        (Piece, "rotate", "piece.rotate"),
+        (Piece, "mirror", "piece.mirror"),
+        (Board, "render_changes", "render.board"),
+        (Deck, "render_changes", "render.deck"),
+        (Renderer, "update", "render.frame"),
+    ]
+
+    targets: List[Tuple[type, str, str]]
+    metrics: Dict[str, Metric]
+    enabled: bool
+
+    def __init__(self, targets: List[Tuple[type, str, str]] | None = None) -> None:
+        """Create a new Instrumentation, disabled.
+
+        Args:
+            targets (List[tuple] | None): Methods to instrument, `TARGETS` by default.
+                                          The `play` method of every agent class is always added.
+        """
+        self.targets = list(self.TARGETS if targets is None else targets)
+        self.metrics = {}
+        self.enabled = False
+        # Attributes replaced by the wrappers: (class, method) -> original attribute, None if inherited
+        self.__originals: Dict[Tuple[type, str], Callable | None] = {}
+
+    def instrument(self, owner: type, attribute: str, name: str) -> None:
+        """Adds a method to instrument, right away if the instrumentation is enabled.
+
+        Args:
+            owner (type): Class of the method.
+            attribute (str): Name of the method, a function or a coroutine function.
+            name (str): Name of the metric.
+        """
+        self.targets.append((owner, attribute, name))
+        if self.enabled:
+            self.__wrap(owner, attribute, name)
+
+    def enable(self) -> None:
+        """Replaces the instrumented methods by their wrappers."""
+        if self.enabled:
+            return
+        self.enabled = True
+        for owner, attribute, name in self.targets + self.__agent_targets():
+            self.__wrap(owner, attribute, name)
+
+    def disable(self) -> None:
+        """Puts the original methods back, the metrics are kept."""
+        for (owner, attribute), original in self.__originals.items():
+            if original is None:
+                delattr(owner, attribute)
+            else:
+                setattr(owner, attribute, original)
+        self.__originals.clear()
+        self.enabled = False
+
+    def __enter__(self) -> "Instrumentation":
+        self.enable()
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.disable()
+
+    def reset(self) -> None:
+        """Clears the metrics."""
+        self.metrics.clear()
+
+    def to_dict(self) -> Dict[str, dict]:
+        """Retrieves the metrics, by metric name."""
+        return {name: metric.to_dict() for name, metric in sorted(self.metrics.items())}
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), indent=2)
+
+    def to_prometheus(self) -> str:
+        """Exports the metrics in the Prometheus text format.
+
+        Returns:
+            str: The `blokus_calls_total`, `blokus_seconds_total` and `blokus_errors_total`
+                 counters, labelled by function (and by exception for the errors).
+        """
+        lines = []
+        counters = [
+            ("calls", "Calls of each instrumented function.", lambda metric: [({}, metric.calls)]),
+            ("seconds", "Time spent in each instrumented function.", lambda metric: [({}, metric.seconds)]),
+            ("errors", "Calls of each instrumented function that raised, by exception.",
+             lambda metric: [({"exception": error}, count) for error, count in sorted(metric.errors.items())]),
+        ]
+        for counter, help, samples in counters:
+            lines.append(f"# HELP blokus_{counter}_total {help}")
+            lines.append(f"# TYPE blokus_{counter}_total counter")
+            for name, metric in sorted(self.metrics.items()):
+                for labels, value in samples(metric):
+                    labels = ",".join(f'{key}="{value}"' for key, value in {"function": name, **labels}.items())
+                    lines.append(f"blokus_{counter}_total{{{labels}}} {value}")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def __agent_targets() -> List[Tuple[type, str, str]]:
+        """Lists the `play` method of every agent class defining one."""
+        targets = []
+        classes = [Agent]
+        while classes:
+            agent = classes.pop()
+            classes += agent.__subclasses__()
+            if "play" in agent.__dict__:
+                targets.append((agent, "play", f"agent.{agent.__name__}.play"))
+        return targets
+
+    def __wrap(self, owner: type, attribute: str, name: str) -> None:
+        if (owner, attribute) in self.__originals:
+            return
+        self.__originals[(owner, attribute)] = owner.__dict__.get(attribute)
+        function = getattr(owner, attribute)
+        metric = self.metrics.setdefault(name, Metric())
+
+        if inspect.iscoroutinefunction(function):
+            @functools.wraps(function)
+            async def wrapper(*args, **kwargs):
+                start = time.monotonic()
+                try:
+                    return await function(*args, **kwargs)
+                except Exception as e:
+                    metric.errors[type(e).__name__] = metric.errors.get(type(e).__name__, 0) + 1
+                    raise
+                finally:
+                    metric.calls += 1
+                    metric.seconds += time.monotonic() - start
+        else:
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                start = time.monotonic()
+                try:
+                    return function(*args, **kwargs)
+                except Exception as e:
+                    metric.errors[type(e).__name__] = metric.errors.get(type(e).__name__, 0) + 1
+                    raise
+                finally:
+                    metric.calls += 1
+                    metric.seconds += time.monotonic() - start
+        setattr(owner, attribute, wrapper)
+
+
+instrumentation = Instrumentation()
@@ -1,68 +1,209 @@
-from typing import Generator, Tuple, List
+from typing import Dict, FrozenSet, Generator, Tuple, List
+
+
+class Shape:
+    """Table of the unique orientations of a piece shape, built once per shape.
+
+    A shape has up to 8 orientations (4 rotations of the shape and of its mirror),
+    symmetric ones being stored only once. Rotating or mirroring a piece is then
+    an index lookup in `rotations`, `horizontal_mirrors` and `vertical_mirrors`.
+    """
+    # One interned piece per orientation, shared by every player
+    orientations: List["Piece"]
+    # Index of the orientation obtained by rotating / mirroring each orientation
+    rotations: List[int]
+    horizontal_mirrors: List[int]
+    vertical_mirrors: List[int]
+
+    # Every orientation already built: cells -> (shape, index of the orientation)
+    __shapes: Dict[FrozenSet[Tuple[int, int]], Tuple["Shape", int]] = {}
+
+    def __init__(self, data: Tuple[Tuple[int, int]]) -> None:
+        """Create a new Shape, and computes all of its orientations.
+
+        Args:
+            data (tuple): A tuple of coordinates of one orientation of the shape, which will be
+                          the first orientation of the table once normalized.
+        """
+        data = Shape.normalize(data)
+        self.orientations = []
+        indexes: Dict[FrozenSet[Tuple[int, int]], int] = {}
+
+        def index_of(cells: Tuple[Tuple[int, int]]) -> int:
+            key = frozenset(cells)
+            if key not in indexes:
+                indexes[key] = len(self.orientations)
+                self.orientations.append(Piece.build(self, len(self.orientations), cells))
+            return indexes[key]
+
+        index_of(data)
+        for base in (data, Shape.normalize([(-x, y) for x, y in data])):
+            for _ in range(4):
+                base = Shape.normalize([(y, -x) for x, y in base])
+                index_of(base)
+
+        datas = [orientation.data for orientation in self.orientations]
+        self.rotations = [index_of(Shape.normalize([(y, -x) for x, y in d])) for d in datas]
+        self.horizontal_mirrors = [index_of(Shape.normalize([(-x, y) for x, y in d])) for d in datas]
+        self.vertical_mirrors = [index_of(Shape.normalize([(x, -y) for x, y in d])) for d in datas]
+
+        self.register()
+
+    def __reduce__(self) -> tuple:
+        return (Shape.restore, ([orientation.data for orientation in self.orientations],
+                                self.rotations, self.horizontal_mirrors, self.vertical_mirrors))
+
+    @staticmethod
+    def restore(datas: List[Tuple[Tuple[int, int]]], rotations: List[int],
+                horizontal_mirrors: List[int], vertical_mirrors: List[int]) -> "Shape":
+        """Rebuilds a pickled shape from its table, without computing the orientations again.
+
+        Shapes are interned like pieces: a shape already known is returned as it is,
+        and a new one is registered, so loading a cache registers its shapes only once.
+
+        Args:
+            datas (list): Cells of each orientation.
+            rotations, horizontal_mirrors, vertical_mirrors (list): Transitions between the orientations.
+
+        Returns:
+            Shape: The shape.
+        """
+        found = Shape.__shapes.get(frozenset(datas[0]))
+        if found is not None:
+            return found[0]
+        shape = Shape.__new__(Shape)
+        shape.orientations = [Piece.build(shape, index, data) for index, data in enumerate(datas)]
+        shape.rotations = rotations
+        shape.horizontal_mirrors = horizontal_mirrors
+        shape.vertical_mirrors = vertical_mirrors
+        shape.register()
+        return shape
+
+    def register(self) -> None:
+        """Makes the orientations of the shape known to `Shape.of`.
+
+        Shapes built by the constructor or unpickled are registered automatically,
+        this is needed for shapes created another way.
+        Orientations already known keep their current shape.
+        """
+        for index, orientation in enumerate(self.orientations):
+            Shape.__shapes.setdefault(frozenset(orientation.data), (self, index))
+
+    @staticmethod
+    def normalize(data: List[Tuple[int, int]]) -> Tuple[Tuple[int, int]]:
+        """Moves the cells so that the smallest x and y are 0.
+
+        Args:
+            data (list): Cells to move.
+
+        Returns:
+            tuple: The moved cells.
+        """
+        min_x = min(x for x, _ in data)
+        min_y = min(y for _, y in data)
+        return tuple([(x - min_x, y - min_y) for x, y in data])
+
+    @staticmethod
+    def of(data: Tuple[Tuple[int, int]]) -> Tuple["Shape", int]:
+        """Retrieves the shape of the given cells, building its table the first time it is seen.
+
+        Args:
+            data (tuple): Cells of one orientation of the shape, in any position.
+
+        Returns:
+            tuple: The shape, and the index of the orientation matching the normalized cells.
+        """
+        found = Shape.__shapes.get(frozenset(data))
+        if found is None:
+            data = Shape.normalize(data)
+            found = Shape.__shapes.get(frozenset(data))
+        if found is None:
+            found = (Shape(data), 0)
+        return found
 
-from .colors import Colors
 
 class Piece:
-    """Represents a game piece using a set of coordinates.
+    """One orientation of a piece shape: its cells and the cells at each of its corners.
+
+    Pieces are immutable and interned: `Piece(data)` returns the orientation of the
+    shape table matching the cells, so every player and every copy of a game shares
+    one object per (shape, orientation). Rotating or mirroring returns another orientation.
+    Pieces have no color, the color is given with the placement.
 
-    The piece is defined by a tuple of coordinates that represent its cells.
+    The cells of a corner are the ones with no neighbour on both sides of that corner,
+    they are the cells that can touch an other piece diagonally.
     """
+    __slots__ = ("data", "shape", "orientation", "top_left", "top_right", "bottom_left", "bottom_right")
     MAX_SIZE: int = 5
     data: Tuple[Tuple[int, int]]
-    color: Colors
+    shape: Shape
+    # Index of the orientation in `shape.orientations`
+    orientation: int
 
-    bottom_left: List[Tuple[int, int]]
-    bottom_right: List[Tuple[int, int]]
-    top_left: List[Tuple[int, int]]
-    top_right: List[Tuple[int, int]]
+    bottom_left: Tuple[Tuple[int, int]]
+    bottom_right: Tuple[Tuple[int, int]]
+    top_left: Tuple[Tuple[int, int]]
+    top_right: Tuple[Tuple[int, int]]
 
-    def __init__(self, data: Tuple[Tuple[int, int]]) -> None:
-        """Create a new Piece
+    def __new__(cls, data: Tuple[Tuple[int, int]]) -> "Piece":
+        """Retrieves the piece of the given cells.
 
         Args:
             data (tuple): A tuple of coordinates representing the cells of the piece,
                           where each coordinate is a tuple of (x, y).
         """
-        self.data = data
-        self.color = Colors.LIGHT_GRAY
-        self.bottom_left = []
-        self.bottom_right = []
-        self.top_left = []
-        self.top_right = []
+        shape, orientation = Shape.of(data)
+        return shape.orientations[orientation]
+
+    @classmethod
+    def build(cls, shape: Shape, orientation: int, data: Tuple[Tuple[int, int]]) -> "Piece":
+        """Creates an orientation of a shape, for the table of the shape.
 
-        self.__get_extremities()
+        Args:
+            shape (Shape): Shape of the piece.
+            orientation (int): Index of the orientation in `shape.orientations`.
+            data (tuple): Cells of the orientation.
+
+        Returns:
+            Piece: The new orientation.
+        """
+        piece = object.__new__(cls)
+        cells = set(data)
+        top_left, top_right, bottom_left, bottom_right = [], [], [], []
+        for cell_x, cell_y in data:
+            left = (cell_x - 1, cell_y) not in cells
+            right = (cell_x + 1, cell_y) not in cells
+            top = (cell_x, cell_y - 1) not in cells
+            bottom = (cell_x, cell_y + 1) not in cells
+            if left and top:
+                top_left.append((cell_x, cell_y))
+            if top and right:
+                top_right.append((cell_x, cell_y))
+            if left and bottom:
+                bottom_left.append((cell_x, cell_y))
+            if right and bottom:
+                bottom_right.append((cell_x, cell_y))
+
+        for name, value in (("data", data), ("shape", shape), ("orientation", orientation),
+                            ("top_left", tuple(top_left)), ("top_right", tuple(top_right)),
+                            ("bottom_left", tuple(bottom_left)), ("bottom_right", tuple(bottom_right))):
+            object.__setattr__(piece, name, value)
+        return piece
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(f"pieces are immutable, cannot set {name!r}")
+
+    def __reduce__(self) -> tuple:
+        return (Piece, (self.data,))
 
     def __copy__(self) -> "Piece":
-        return Piece(self.data)
-    
-    def __eq__(self, other: "Piece") -> bool:
-        if isinstance(other, Piece):
-            if hasattr(self, 'color') and hasattr(other, 'color'):
-                return (self.color == other.color and 
-                        self.data == other.data)
-            return self.data == other.data
-        return False
-    
-    def __get_extremities(self) -> None:
-        """Identifies and assigns the corners of the data structure."""
-        self.top_left.clear()
-        self.top_right.clear()
-        self.bottom_left.clear()
-        self.bottom_right.clear()
-
-        for cell_x, cell_y in self.iterate_data():
-            if (self.data.count((cell_x - 1, cell_y)) == 0
-                and self.data.count((cell_x, cell_y - 1)) == 0):
-                self.top_left.append((cell_x, cell_y))
-            if (self.data.count((cell_x, cell_y - 1)) == 0
-                and self.data.count((cell_x + 1, cell_y)) == 0):
-                self.top_right.append((cell_x, cell_y))
-            if (self.data.count((cell_x - 1, cell_y)) == 0
-                and self.data.count((cell_x, cell_y + 1)) == 0):
-                self.bottom_left.append((cell_x, cell_y))
-            if (self.data.count((cell_x + 1, cell_y)) == 0
-                and self.data.count((cell_x, cell_y + 1)) == 0):
-                self.bottom_right.append((cell_x, cell_y))
+        return self
+
+    def __deepcopy__(self, memo: dict) -> "Piece":
+        return self
+
+    def __repr__(self) -> str:
+        return f"Piece({self.data!r})"
 
     def iterate_data(self) -> Generator[Tuple[int, int], None, None]:
         """Yields the coordinates of each cell in the piece.
@@ -73,41 +214,34 @@ class Piece:
         for cell_x, cell_y in self.data:
             yield (cell_x, cell_y)
 
-    def rotate(self) -> None:
-        """Rotates the piece by 90 degrees clockwise."""
-        min_x = min(x for x, _ in self.data)
-        min_y = min(y for _, y in self.data)
+    def oriented(self, orientation: int) -> "Piece":
+        """Retrieves another orientation of the shape of the piece.
 
-        cx = min_x + (max(x for x, _ in self.data) - min_x) // 2
-        cy = min_y + (max(y for _, y in self.data) - min_y) // 2
+        Args:
+            orientation (int): Index of the orientation in `shape.orientations`.
 
-        rotated_piece = [((y - cy) + cx, cy - (x - cx)) for x, y in self.data]
-        self.data = tuple([(x - min(x for x, _ in rotated_piece),
-                            y - min(y for _, y in rotated_piece)) for x, y in rotated_piece])
-        
-        self.__get_extremities()
+        Returns:
+            Piece: The piece in that orientation.
+        """
+        return self.shape.orientations[orientation]
 
-    def mirror(self, horizontal: bool = True, vertical: bool = True) -> None:
-        """Mirrors the piece horizontally and/or vertically."""
-        min_x = min(x for x, _ in self.data)
-        max_x = max(x for x, _ in self.data)
-        min_y = min(y for _, y in self.data)
-        max_y = max(y for _, y in self.data)
+    def rotate(self) -> "Piece":
+        """Rotates the piece by 90 degrees clockwise.
 
-        mirrored_piece = []
-        if horizontal:
-            cx = (min_x + max_x) // 2
+        Returns:
+            Piece: The rotated piece.
+        """
+        return self.shape.orientations[self.shape.rotations[self.orientation]]
 
-            for x, y in self.data:
-                mirrored_piece.append(((cx - (x - cx)), y))
+    def mirror(self, horizontal: bool = True, vertical: bool = True) -> "Piece":
+        """Mirrors the piece horizontally and/or vertically.
 
+        Returns:
+            Piece: The mirrored piece.
+        """
+        orientation = self.orientation
+        if horizontal:
+            orientation = self.shape.horizontal_mirrors[orientation]
         if vertical:
-            cy = (min_y + max_y) // 2
-
-            for x, y in (mirrored_piece if horizontal else self.data):
-                mirrored_piece.append((x, (cy - (y - cy))))
-
-        self.data = tuple([(x - min(x for x, _ in mirrored_piece),
-                            y - min(y for _, y in mirrored_piece)) for x, y in mirrored_piece])
-        
-        self.__get_extremities()
+            orientation = self.shape.vertical_mirrors[orientation]
+        return self.shape.orientations[orientation]
@@ -0,0 +1,190 @@
+from typing import TYPE_CHECKING, Dict, List, Tuple
+
+from .board import Board
+from .colors import Colors
+from .exceptions import OutOfBoardException
+from .piece import Piece, Shape
+
+if TYPE_CHECKING:
+    from .player import Player
+
+
+class PlacementIndex:
+    """Table of every placement inside a board, each identified by a dense integer move id.
+
+    A placement is a shape, one of its orientations and an offset keeping it inside the board.
+    Each move id has the bitboard masks (see `Board`) checked by the placement rules:
+    the cells covered, the sides that must not touch the color of the player, and the
+    diagonal neighbours of which one must touch it. Moves are numbered shape by shape,
+    orientation by orientation, then row by row, so the ids of a board size and a set of
+    shapes never change: they can be used to encode moves in records or policy vectors.
+    The table is built once per board size and set of shapes, see `of`.
+    """
+    width: int
+    height: int
+    stride: int
+    shapes: List[Shape]
+    # Shape (index in `shapes`), orientation and offset of each move id
+    shape_ids: List[int]
+    orientations: List[int]
+    xs: List[int]
+    ys: List[int]
+    # Bitboard masks of each move id
+    cells: List[int]
+    edges: List[int]
+    corners: List[int]
+    # Moves covering each cell (y * width + x) with one of the corner cells of their orientation
+    covering: List[List[int]]
+
+    __indexes: Dict[Tuple[int, int, Tuple[Shape, ...]], "PlacementIndex"] = {}
+
+    def __init__(self, width: int, height: int, pieces: List[Piece]) -> None:
+        """Builds the table, prefer `of` which builds it once.
+
+        Args:
+            width (int): Width of the board.
+            height (int): Height of the board.
+            pieces (List[Piece]): Pieces of the decks, each shape is indexed once.
+        """
+        self.width = width
+        self.height = height
+        self.shapes = []
+        for piece in pieces:
+            if piece.shape not in self.shapes:
+                self.shapes.append(piece.shape)
+        self.__shape_ids = {shape: i for i, shape in enumerate(self.shapes)}
+        # First move id, first offset and number of columns of each (shape, orientation)
+        self.__ranges: Dict[Tuple[int, int], Tuple[int, int, int, int, int]] = {}
+
+        self.shape_ids, self.orientations, self.xs, self.ys = [], [], [], []
+        self.cells, self.edges, self.corners = [], [], []
+        self.covering = [[] for _ in range(width * height)]
+
+        board = Board(width, height)
+        self.stride = board.stride
+        for shape_id, shape in enumerate(self.shapes):
+            for orientation, piece in enumerate(shape.orientations):
+                cells, edges, diagonals, min_x, min_y, max_x, max_y = board.piece_masks(piece.data)
+                corner_cells = set(piece.top_left + piece.top_right + piece.bottom_left + piece.bottom_right)
+                xs = range(-min_x, width - max_x)
+                ys = range(-min_y, height - max_y)
+                self.__ranges[(shape_id, orientation)] = (len(self.cells), xs.start, ys.start, len(xs), len(ys))
+                for y in ys:
+                    for x in xs:
+                        move_id = len(self.cells)
+                        self.shape_ids.append(shape_id)
+                        self.orientations.append(orientation)
+                        self.xs.append(x)
+                        self.ys.append(y)
+                        self.cells.append(cells << (y * self.stride + x))
+                        self.edges.append(board.shift(edges, x - 1, y - 1) & board.mask)
+                        self.corners.append(board.shift(diagonals, x - 1, y - 1) & board.mask)
+                        for cell_x, cell_y in corner_cells:
+                            self.covering[(cell_y + y) * width + cell_x + x].append(move_id)
+
+    @classmethod
+    def of(cls, width: int, height: int, pieces: List[Piece]) -> "PlacementIndex":
+        """Retrieves the table of a board size and of the shapes of the pieces, building it the first time.
+
+        Args:
+            width (int): Width of the board.
+            height (int): Height of the board.
+            pieces (List[Piece]): Pieces of the decks.
+
+        Returns:
+            PlacementIndex: The shared table.
+        """
+        shapes = tuple(dict.fromkeys(piece.shape for piece in pieces))
+        key = (width, height, shapes)
+        index = cls.__indexes.get(key)
+        if index is None:
+            index = cls.__indexes[key] = cls(width, height, pieces)
+        return index
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def move_id(self, piece: Piece, x: int, y: int) -> int:
+        """Encodes a placement.
+
+        Args:
+            piece (Piece): Piece placed, in its orientation.
+            x (int): Horizontal offset of the placement.
+            y (int): Vertical offset of the placement.
+
+        Raises:
+            ValueError: If the shape of the piece is not in the table.
+            OutOfBoardException: If the placement is not inside the board.
+
+        Returns:
+            int: Id of the move.
+        """
+        shape_id = self.__shape_ids.get(piece.shape)
+        if shape_id is None:
+            raise ValueError(f"{piece!r} is not in the placement index")
+        start, x0, y0, columns, rows = self.__ranges[(shape_id, piece.orientation)]
+        if not (0 <= x - x0 < columns and 0 <= y - y0 < rows):
+            raise OutOfBoardException()
+        return start + (y - y0) * columns + x - x0
+
+    def move(self, move_id: int) -> Tuple[Piece, int, int]:
+        """Decodes a move id.
+
+        Args:
+            move_id (int): Id of the move.
+
+        Returns:
+            tuple: (piece, x, y) where the piece is in the orientation of the move.
+        """
+        piece = self.shapes[self.shape_ids[move_id]].orientations[self.orientations[move_id]]
+        return piece, self.xs[move_id], self.ys[move_id]
+
+    def is_legal(self, board: Board, move_id: int, color: Colors, first_piece: bool = False) -> bool:
+        """Checks a move with the rules of `Board.can_place_piece_at`, without raising any exception.
+
+        Args:
+            board (Board): Board to place the piece on, of the size of the table.
+            move_id (int): Id of the move.
+            color (Colors): Color of the player placing the piece.
+            first_piece (bool): Applies the rules of the first piece of a player: covering
+                                a corner of the board instead of touching its color by a corner.
+
+        Returns:
+            bool: True if the piece can be placed.
+        """
+        cells = self.cells[move_id]
+        if cells & board.occupied:
+            return False
+        if first_piece:
+            return cells & board.corners != 0
+        own = board.occupancy.get(color.value, 0)
+        return not self.edges[move_id] & own and self.corners[move_id] & own != 0
+
+    def legal_move_ids(self, board: Board, player: "Player") -> List[int]:
+        """Lists the legal moves of a player, as `Board.legal_moves` does.
+
+        Only the moves covering an anchor of the player (or a free corner of the board for
+        the first piece) with a corner cell are tried, so they only need to be checked
+        against the occupied and forbidden cells.
+
+        Args:
+            board (Board): Board to place the pieces on, of the size of the table.
+            player (Player): Player to find the moves of.
+
+        Returns:
+            List[int]: Ids of the legal moves, in increasing order.
+        """
+        if player.deck.is_full():
+            anchors = board.corners & ~board.occupied
+            blocked = board.occupied
+        else:
+            anchors = board.anchors.get(player.color.value, 0)
+            blocked = board.occupied | board.forbidden.get(player.color.value, 0)
+        shapes = {i for i, shape in enumerate(self.shapes) if shape.orientations[0] in player.deck}
+
+        moves = set()
+        for x, y in board.cells_of(anchors):
+            for move_id in self.covering[y * self.width + x]:
+                if self.shape_ids[move_id] in shapes and not self.cells[move_id] & blocked:
+                    moves.add(move_id)
+        return sorted(moves)
@@ -1,52 +1,156 @@
-from copy import copy
-from typing import List
+from typing import Dict, Iterator, List, Tuple
 
 from ..exceptions import PieceNotFoundException, NotEnoughPiecesInTheDeckException
 from ..colors import Colors
 from ..piece import Piece
+from ..zobrist import deck_key
 
 
 class Deck:
-    """Represents a collection of game pieces with a fixed maximum size."""
+    """Represents a collection of game pieces with a fixed maximum size, 21 in the standard game.
+
+    Each piece of the deck has a stable id, its position in the deck when it was created.
+    The pieces left are the bits of `mask`, so checking, removing and restoring a piece
+    takes constant time, and copies of the deck only copy the mask. Pieces are interned
+    and have no color, so `table` is shared by the decks of every player.
+    """
     MAX_SIZE: int = 21
-    pieces: List[Piece]
-    index: int
+    # Number of pieces of the deck when it was created, `MAX_SIZE` unless playing another set of pieces
+    max_size: int
+    # Piece of each id, shared with the copies of the deck
+    table: List[Piece]
+    # Bit `id` is set while the piece of id `id` is in the deck
+    mask: int
+    # Color of the player of the deck, and Zobrist hash of the pieces left, set by `apply_color`
+    color: Colors | None
+    hash: int
+
+    # Rendered cells of each piece orientation in each color, shared by every deck: (data, color) -> rows
+    __sprites: Dict[Tuple[Tuple[Tuple[int, int]], Colors | None], List[List[str]]] = {}
 
-    def __init__(self, pieces: List[Piece]) -> None:
+    def __init__(self, pieces: List[Piece], max_size: int = MAX_SIZE) -> None:
         """Initializes a new instance of the Deck.
 
         Args:
             pieces (List[Piece]): A list of pieces to populate the deck. 
-                                  The deck must contain exactly 21 pieces at initialization.
+                                  The deck must contain exactly `max_size` pieces at initialization.
+            max_size (int): Number of pieces of the deck, such as 56 for the polyominoes of
+                            up to 6 cells (see `src.polyominoes`).
 
         Raises:
-            NotEnoughPiecesInTheDeckException: If fewer or more than 21 pieces are provided.
+            NotEnoughPiecesInTheDeckException: If fewer or more than `max_size` pieces are provided.
         """
-        if (len(pieces) > self.MAX_SIZE
-            or len(pieces) < self.MAX_SIZE):
+        if (len(pieces) > max_size
+            or len(pieces) < max_size):
             raise NotEnoughPiecesInTheDeckException()
 
-        self.pieces = [copy(piece) for piece in pieces]
-        self.index = 0
+        self.max_size = max_size
+        self.pieces = pieces
+        self.color = None
+        self.hash = 0
+
+    def __copy__(self) -> "Deck":
+        """Copies the deck, sharing its pieces."""
+        deck = Deck.__new__(Deck)
+        deck.max_size = self.max_size
+        deck.table = self.table
+        deck.__shapes = self.__shapes
+        deck.mask = self.mask
+        deck.color = self.color
+        deck.hash = self.hash
+        deck.__layout = self.__layout
+        deck.__reported = None
+        return deck
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        # Rebuilt on demand from the pieces, which are interned again when unpickled
+        state["_Deck__shapes"] = None
+        state["_Deck__layout"] = None
+        state["_Deck__reported"] = None
+        return state
+
+    def __iter__(self) -> Iterator[Piece]:
+        table = self.table
+        return (table[piece_id] for piece_id in self.ids())
+
+    def __contains__(self, piece: Piece) -> bool:
+        return self.__ids_of(piece) & self.mask != 0
+
+    @property
+    def pieces(self) -> List[Piece]:
+        """Pieces left in the deck, by id."""
+        return list(self)
+
+    @pieces.setter
+    def pieces(self, pieces: List[Piece]) -> None:
+        """Fills the deck with the pieces, their ids being their positions in the list."""
+        self.table = list(pieces)
+        self.mask = (1 << len(pieces)) - 1
+        self.__shapes = None
+        # Last rendering as (mask, color, rows), see `render_cells`, and the rows last returned
+        # by `render_changes`
+        self.__layout = None
+        self.__reported = None
+
+    def __ids_of(self, piece: Piece) -> int:
+        """Retrieves the ids of the pieces of the same shape as a piece, as a mask."""
+        if self.__shapes is None:
+            shapes = {}
+            for piece_id, other in enumerate(self.table):
+                shapes[other.shape] = shapes.get(other.shape, 0) | 1 << piece_id
+            self.__shapes = shapes
+        return self.__shapes.get(piece.shape, 0)
+
+    def ids(self) -> Iterator[int]:
+        """Yields the ids of the pieces left in the deck, in increasing order."""
+        mask = self.mask
+        while mask:
+            low = mask & -mask
+            yield low.bit_length() - 1
+            mask ^= low
+
+    def has(self, piece_id: int) -> bool:
+        """Checks if the piece of an id is still in the deck.
+
+        Args:
+            piece_id (int): Id of the piece.
+
+        Returns:
+            bool: True if the piece is in the deck.
+        """
+        return piece_id >= 0 and (self.mask >> piece_id) & 1 == 1
+
+    def id_of(self, piece: Piece) -> int:
+        """Retrieves the id of a piece left in the deck.
 
-    def __iter__(self) -> List[Piece]:
-        return self.pieces
+        Pieces of the same shape are interchangeable, whatever their orientation:
+        the id is the smallest one left in the deck with the shape of the piece.
+
+        Args:
+            piece (Piece): Piece to find.
+
+        Raises:
+            ValueError: If no piece of that shape is left in the deck.
+
+        Returns:
+            int: Id of the piece.
+        """
+        ids = self.__ids_of(piece) & self.mask
+        if not ids:
+            raise ValueError(f"{piece!r} is not in the deck")
+        return (ids & -ids).bit_length() - 1
 
-    def __next__(self) -> Piece:
-        if self.index >= self.size():
-            raise StopIteration
-        result = self.pieces[self.index]
-        self.index += 1
-        return result
-    
     def apply_color(self, color: Colors) -> None:
-        """Applies the given color to all pieces in the deck.
+        """Gives the deck the color of its player.
 
         Args:
-            color (Colors): Color to apply to each piece in the deck.
+            color (Colors): Color of the player of the deck.
         """
-        for piece in self.pieces:
-            piece.color = color
+        self.color = color
+        self.hash = 0
+        for piece_id in self.ids():
+            self.hash ^= deck_key(color.value, piece_id)
 
     def is_full(self) -> bool:
         """Checks if the deck is full.
@@ -54,7 +158,7 @@ class Deck:
         Returns:
             bool: True if the number of pieces in the deck equals the maximum size, False otherwise.
         """
-        return self.size() == self.MAX_SIZE
+        return self.size() == self.max_size
 
     def size(self) -> int:
         """Retrieves the current number of pieces in the deck.
@@ -62,34 +166,82 @@ class Deck:
         Returns:
             int: The number of pieces in the deck.
         """
-        return len(self.pieces)
+        return self.mask.bit_count()
 
-    def display(self) -> None:
-        """Displays the deck of pieces in a visual format."""
-        # TODO: This code is not really optimized and does a lot of processing
-        pieces_to_display = [[[0 for _ in range(Piece.MAX_SIZE)] for _ in range(Piece.MAX_SIZE)] for _ in range(self.size())]
+    def render_cells(self) -> List[List[str]]:
+        """Renders the deck side by side, as the strings drawn in the terminal.
 
-        color = self.get(0).color
-        for i, piece in enumerate(self.pieces):
+        Each piece is drawn from a sprite rendered once per orientation and color, and the
+        rows are kept until the pieces left or the color change, so redrawing an unchanged
+        deck costs nothing.
+
+        Returns:
+            List[List[str]]: Rows of cells, each cell being one character
+                             with the color codes it needs. They are shared
+                             between calls and must not be modified.
+        """
+        if self.__layout is not None and self.__layout[:2] == (self.mask, self.color):
+            return self.__layout[2]
+
+        sprites = [self.__sprite(piece, self.color) for piece in self]
+        height = max((len(sprite) for sprite in sprites), default=Piece.MAX_SIZE)
+        separator = [" ", "|", " "]
+        rows = []
+        for y in range(height):
+            line = separator.copy()
+            for sprite in sprites:
+                line += sprite[y] if y < len(sprite) else [" "] * len(sprite[0])
+                line += separator
+            rows.append(line)
+        self.__layout = (self.mask, self.color, rows)
+        return rows
+
+    def render_changes(self) -> Tuple[List[List[str]], List[Tuple[int, int]] | None]:
+        """Renders the deck for `Renderer.update`, with the cells changed since the last call.
+
+        Removing a piece moves the ones after it, so the deck is either unchanged or rendered again.
+
+        Returns:
+            tuple: (rows, changes) where `rows` are the rows of cells of `render_cells`, and
+                   `changes` is empty if they are the same as on the last call, None otherwise.
+        """
+        rows = self.render_cells()
+        changes = [] if rows is self.__reported else None
+        self.__reported = rows
+        return rows, changes
+
+    @staticmethod
+    def __sprite(piece: Piece, color: Colors | None) -> List[List[str]]:
+        """Retrieves the rendered cells of a piece, at least `Piece.MAX_SIZE` wide and high.
+
+        Args:
+            piece (Piece): Piece to render, in its orientation.
+            color (Colors | None): Color of the cells of the piece.
+
+        Returns:
+            List[List[str]]: Rows of cells of the piece.
+        """
+        key = (piece.data, color)
+        sprite = Deck.__sprites.get(key)
+        if sprite is None:
+            width = max(Piece.MAX_SIZE, max(x for x, _ in piece.data) + 1)
+            height = max(Piece.MAX_SIZE, max(y for _, y in piece.data) + 1)
+            sprite = [[" "] * width for _ in range(height)]
+            filled = f"{str(color or Colors.RESET)}■{str(Colors.RESET)}"
             for x, y in piece.data:
-                pieces_to_display[i][y][x] = 1
-
-        for y in range(Piece.MAX_SIZE):
-            line = " | "
-            for piece_to_display in pieces_to_display:
-                for x in range(Piece.MAX_SIZE):
-                    if piece_to_display[y][x] == 1:
-                        line += f"{str(color)}■{str(Colors.RESET)}"
-                    else:
-                        line += " "
-                line += " | "
-            print(line)
+                sprite[y][x] = filled
+            Deck.__sprites[key] = sprite
+        return sprite
+
+    def display(self) -> None:
+        """Displays the deck of pieces in a visual format."""
+        print("\n".join("".join(row) for row in self.render_cells()))
 
     def get(self, i: int) -> Piece:
         """Retrieves a piece from the deck at the specified index.
 
         Args:
-            i (int): Index of the piece to retrieve from the deck.
+            i (int): Index of the piece to retrieve among the pieces left in the deck.
 
         Raises:
             PieceNotFoundException: If the index is out of bounds (i.e., 
@@ -100,15 +252,38 @@ class Deck:
         """
         if i < 0 or i >= self.size():
             raise PieceNotFoundException()
-        return self.pieces[i]
-    
+        for index, piece_id in enumerate(self.ids()):
+            if index == i:
+                return self.table[piece_id]
+
     def remove(self, piece: Piece) -> None:
         """Removes a specific piece from the deck.
 
         Args:
-            piece (Piece): Piece to be removed from the deck.
+            piece (Piece): Piece to be removed from the deck, in any orientation.
 
         Raises:
             ValueError: If the specified piece is not found in the deck.
         """
-        self.pieces.remove(piece)
+        piece_id = self.id_of(piece)
+        self.mask ^= 1 << piece_id
+        if self.color is not None:
+            self.hash ^= deck_key(self.color.value, piece_id)
+
+    def restore(self, piece: Piece) -> None:
+        """Puts a piece removed from the deck back.
+
+        Args:
+            piece (Piece): Piece to put back, in any orientation.
+
+        Raises:
+            ValueError: If no piece of that shape was removed from the deck.
+        """
+        ids = self.__ids_of(piece) & ~self.mask
+        if not ids:
+            raise ValueError(f"{piece!r} cannot be restored to the deck")
+        # The last one removed, as `remove` takes the first one left
+        piece_id = ids.bit_length() - 1
+        self.mask |= 1 << piece_id
+        if self.color is not None:
+            self.hash ^= deck_key(self.color.value, piece_id)
@@ -1,6 +1,7 @@
+from copy import copy
 from typing import List
 
-from ..exceptions import PieceNotInCornerException, PieceOverlapException
+from ..exceptions import OutOfBoardException, PieceNotFoundException, PieceNotInCornerException, PieceOverlapException
 from ..board import Board
 from ..piece import Piece
 from ..colors import Colors
@@ -14,18 +15,35 @@ class Player:
     to place on the game board. The player can retrieve pieces from their deck 
     and place them on the board while adhering to the game's rules.
     """
+    # Bonus when all pieces have been placed, and when the last one is the single square
+    ALL_PIECES_BONUS: int = 15
+    SINGLE_SQUARE_BONUS: int = 5
+
+    color: Colors
     deck: Deck
+    last_piece: Piece | None
 
-    def __init__(self, color: Colors, pieces: List[Piece]) -> None:
+    def __init__(self, color: Colors, pieces: List[Piece], deck_size: int = Deck.MAX_SIZE) -> None:
         """Create a new Player
 
         Args:
             color (Colors): Color of the player and the piece that will be placed
             pieces (List[Piece]): Deck of pieces
+            deck_size (int): Number of pieces of the deck, see `Deck`.
         """
-        self.deck = Deck(pieces)
+        self.color = color
+        self.last_piece = None
+        self.deck = Deck(pieces, deck_size)
         self.deck.apply_color(color)
 
+    def __copy__(self) -> "Player":
+        """Copies the player, with a copy of its deck sharing the same pieces."""
+        player = Player.__new__(Player)
+        player.color = self.color
+        player.last_piece = self.last_piece
+        player.deck = copy(self.deck)
+        return player
+
     def place_piece(self, board: Board, piece: Piece, x: int, y: int) -> None:
         """Places a piece on the specified position on the board.
 
@@ -41,19 +59,53 @@ class Player:
             y (int): y-coordinate on the board where the piece will be placed.
 
         Raises:
+            OutOfBoardException: If a cell of the piece is outside of the board, on any turn.
+            PieceNotFoundException: If no piece of that shape is left in the deck.
             PieceNotInCornerException: If the piece is being placed outside of the corner 
-                                        when the deck contains 21 pieces.
+                                        when the deck is full.
             PieceOverlapException: If the piece overlaps with another piece on the board 
                                 at the specified coordinates.
             NotAdjacentPieceException: If the piece being placed is not adjacent to 
                                     an existing piece (if applicable).
         """
+        # Coordinates can come from the network, they are checked before anything else
+        if board.is_piece_out_of_board_at(piece, x, y):
+            raise OutOfBoardException()
+        if piece not in self.deck:
+            raise PieceNotFoundException()
         if self.deck.is_full():
             if board.is_piece_overlapping_at(piece, x, y):
                 raise PieceOverlapException()
             if not board.is_piece_in_corner_at(piece, x, y):
                 raise PieceNotInCornerException()
         else:
-            board.can_place_piece_at(piece, x, y)
-        board.put(piece, x, y)
+            board.can_place_piece_at(piece, x, y, self.color)
+        board.put(piece, x, y, self.color)
         self.deck.remove(piece)
+        self.last_piece = piece
+
+    def has_legal_move(self, board: Board) -> bool:
+        """Checks if the player can still place one of the pieces of its deck.
+
+        Args:
+            board (Board): Game board where the pieces would be placed.
+
+        Returns:
+            bool: True if at least one piece can be placed, False when the player must pass.
+        """
+        return board.has_legal_move(self)
+
+    def score(self) -> int:
+        """Computes the score of the player with the Blokus scoring rules.
+
+        Each square of the pieces left in the deck costs one point. A player who placed
+        all of the pieces earns a bonus, increased when the last one was the single square.
+
+        Returns:
+            int: Score of the player.
+        """
+        if self.deck.size() > 0:
+            return -sum(len(piece.data) for piece in self.deck.pieces)
+        if self.last_piece is not None and len(self.last_piece.data) == 1:
+            return self.ALL_PIECES_BONUS + self.SINGLE_SQUARE_BONUS
+        return self.ALL_PIECES_BONUS
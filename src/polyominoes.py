@@ -0,0 +1,99 @@
+"""Free polyominoes, generated instead of being read from the pieces files.
+
+A free polyomino is a set of connected cells, two polyominoes being the same when one is a
+rotation or a mirror of the other. Each one is identified by its canonical form, the smallest
+of its 8 orientations once normalized and sorted, so growing every polyomino of size n by one
+cell in every possible way and keeping the distinct canonical forms gives those of size n + 1.
+The sizes 1 to 5 are the 21 pieces of the game.
+"""
+import os
+
+from typing import List, Set, Tuple
+
+from .piece import Piece
+from .resources import CACHE_VERSION, PIECES_PATH, read_cache_file, write_cache_file
+
+# Generated polyominoes up to a size, relative to the pieces directory
+POLYOMINOES_CACHE_PATH: str = os.path.join("__pycache__", "polyominoes-{max_size}.pickle")
+
+
+def canonical(cells: Tuple[Tuple[int, int]]) -> Tuple[Tuple[int, int]]:
+    """Computes the canonical form of a polyomino.
+
+    Args:
+        cells (tuple): Cells of the polyomino, in any orientation and position.
+
+    Returns:
+        tuple: The smallest of the sorted and normalized orientations of the polyomino.
+    """
+    best = None
+    for orientation in (cells, [(-x, y) for x, y in cells]):
+        for _ in range(4):
+            orientation = [(y, -x) for x, y in orientation]
+            min_x = min(x for x, _ in orientation)
+            min_y = min(y for _, y in orientation)
+            form = tuple(sorted((x - min_x, y - min_y) for x, y in orientation))
+            if best is None or form < best:
+                best = form
+    return best
+
+
+def enumerate_polyominoes(max_size: int, min_size: int = 1) -> List[Tuple[Tuple[int, int]]]:
+    """Lists every free polyomino of a range of sizes.
+
+    Args:
+        max_size (int): Largest number of cells.
+        min_size (int): Smallest number of cells.
+
+    Returns:
+        List[tuple]: Canonical form of each polyomino, by size then by canonical form.
+    """
+    polyominoes = []
+    level: Set[Tuple[Tuple[int, int]]] = {((0, 0),)}
+    for size in range(1, max_size + 1):
+        if size >= min_size:
+            polyominoes += sorted(level)
+        if size == max_size:
+            break
+        grown = set()
+        for cells in level:
+            occupied = set(cells)
+            # Each free cell next to the polyomino, tried once even if it touches several cells
+            neighbours = {(x + dx, y + dy) for x, y in cells for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1))}
+            for cell in neighbours - occupied:
+                grown.add(canonical(cells + (cell,)))
+        level = grown
+    return polyominoes
+
+
+def load_polyominoes(max_size: int, min_size: int = 1, pieces_path: str = PIECES_PATH,
+                     use_cache: bool = True) -> List[Piece]:
+    """Generates the pieces of every free polyomino of a range of sizes.
+
+    The polyominoes up to `max_size` and the orientation tables of their shapes are cached
+    in `POLYOMINOES_CACHE_PATH`, as the pieces files are by `load_pieces`.
+
+    Args:
+        max_size (int): Largest number of cells.
+        min_size (int): Smallest number of cells.
+        pieces_path (str): Directory of the cache.
+        use_cache (bool): Reads and writes the generated polyominoes.
+
+    Returns:
+        List[Piece]: One piece per polyomino, in its canonical orientation, by size then by canonical form.
+    """
+    path = os.path.join(pieces_path, POLYOMINOES_CACHE_PATH.format(max_size=max_size))
+    cache = read_cache_file(path) if use_cache else None
+    if cache is None:
+        polyominoes = enumerate_polyominoes(max_size)
+        pieces = [Piece(cells) for cells in polyominoes]
+        if use_cache:
+            write_cache_file(path, {
+                "version": CACHE_VERSION,
+                "polyominoes": polyominoes,
+                "shapes": [piece.shape for piece in pieces],
+            })
+    else:
+        # The shapes of the cache are registered as they are unpickled
+        pieces = [Piece(cells) for cells in cache["polyominoes"]]
+    return [piece for piece in pieces if len(piece.data) >= min_size]
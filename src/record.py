@@ -0,0 +1,280 @@
+import mmap
+import struct
+
+from typing import TYPE_CHECKING, BinaryIO, Generator, Iterator, List, Tuple
+
+from .board import Board
+from .colors import Colors
+from .exceptions import InvalidRecordException
+from .piece import Piece
+from .player import Player
+
+if TYPE_CHECKING:
+    from .engine import Engine
+
+# A record file is the magic and the version, followed by the games one after the other.
+MAGIC: bytes = b"BLKR"
+VERSION: int = 1
+FILE_HEADER = struct.Struct("<4sB")
+# Header of a game: players, width, height, flags, seed, moves, then the color of each player
+GAME_HEADER = struct.Struct("<BBBBQH")
+HAS_SEED: int = 1
+
+# A move takes 3 bytes: the piece slot in the deck (5 bits) and the orientation (3 bits),
+# then the player (2 high bits) and the cell of the offset y * width + x (14 low bits).
+MOVE_SIZE: int = 3
+MAX_CELLS: int = 1 << 14
+
+
+class GameRecord:
+    """Moves of a game in the compact record format, with what is needed to replay them.
+
+    Moves are kept encoded, they are decoded only when iterated.
+    """
+    colors: List[Colors]
+    width: int
+    height: int
+    seed: int | None
+    moves: bytes
+
+    def __init__(self, colors: List[Colors], width: int, height: int,
+                 seed: int | None = None, moves: bytes = b"") -> None:
+        """Create a new GameRecord
+
+        Args:
+            colors (List[Colors]): Color of each player, in the turn order.
+            width (int): Width of the board.
+            height (int): Height of the board.
+            seed (int | None): Seed the game was played with, if any.
+            moves (bytes): Encoded moves, see `encode_move`.
+        """
+        self.colors = colors
+        self.width = width
+        self.height = height
+        self.seed = seed
+        self.moves = moves
+
+    @classmethod
+    def of(cls, engine: "Engine", pieces: List[Piece], seed: int | None = None) -> "GameRecord":
+        """Records the moves played so far in a game.
+
+        Args:
+            engine (Engine): Game to record.
+            pieces (List[Piece]): Pieces the decks of the game were created from.
+            seed (int | None): Seed the game was played with, if any.
+
+        Returns:
+            GameRecord: Record of the game.
+        """
+        board = engine.board
+        record = cls([player.color for player in engine.players], board.width, board.height, seed)
+        # Pieces of the same shape are interchangeable, each placement takes the first unused slot
+        used = [set() for _ in engine.players]
+        moves = bytearray()
+        for player, piece, orientation, x, y in engine.moves:
+            slot = next(slot for slot, other in enumerate(pieces)
+                        if other.shape is piece.shape and slot not in used[player])
+            used[player].add(slot)
+            moves += record.encode_move(player, slot, orientation, x, y)
+        record.moves = bytes(moves)
+        return record
+
+    def __len__(self) -> int:
+        return len(self.moves) // MOVE_SIZE
+
+    def encode_move(self, player: int, slot: int, orientation: int, x: int, y: int) -> bytes:
+        """Encodes a move in 3 bytes.
+
+        Args:
+            player (int): Index of the player in the turn order.
+            slot (int): Position of the piece in the deck when it was created.
+            orientation (int): Index of the orientation in the orientations of the shape of the piece.
+            x (int): Horizontal offset of the placement.
+            y (int): Vertical offset of the placement.
+
+        Returns:
+            bytes: Encoded move.
+
+        Raises:
+            ValueError: If a field of the move doesn't fit in its bits.
+        """
+        cell = y * self.width + x
+        if not (0 <= slot < 32 and 0 <= orientation < 8 and 0 <= player < 4 and 0 <= cell < MAX_CELLS):
+            raise ValueError(f"move of player {player} (slot {slot}, orientation {orientation}, cell {cell}) "
+                             f"doesn't fit in a record: up to 4 players, 32 slots, 8 orientations and 16384 cells")
+        return bytes((slot << 3 | orientation, player << 6 | cell >> 8, cell & 0xFF))
+
+    def decode_moves(self) -> Iterator[Tuple[int, int, int, int, int]]:
+        """Decodes the moves of the game.
+
+        Yields:
+            tuple: (player, slot, orientation, x, y) of each move, see `encode_move`.
+        """
+        moves = self.moves
+        for i in range(0, len(moves), MOVE_SIZE):
+            piece, player_cell, cell = moves[i], moves[i + 1], moves[i + 2]
+            y, x = divmod((player_cell & 0x3F) << 8 | cell, self.width)
+            yield player_cell >> 6, piece >> 3, piece & 0x7, x, y
+
+    def positions(self, pieces: List[Piece]) -> Generator[Tuple[Board, List[Player]], None, None]:
+        """Replays the game, yielding the position after each move.
+
+        The same board and players are updated move after move, copy them to keep a position.
+
+        Args:
+            pieces (List[Piece]): Pieces the decks of the game were created from.
+
+        Yields:
+            tuple: (board, players) after each move.
+
+        Raises:
+            OutOfBoardException, PieceOverlapException, NotAdjacentPieceException, PieceNotInCornerException:
+                If a move of the record is illegal.
+        """
+        board = Board(self.width, self.height)
+        players = [Player(color, pieces) for color in self.colors]
+        for player_index, slot, orientation, x, y in self.decode_moves():
+            player = players[player_index]
+            piece = player.deck.table[slot].oriented(orientation)
+            player.place_piece(board, piece, x, y)
+            yield board, players
+
+    def to_bytes(self) -> bytes:
+        """Encodes the game, header and moves.
+
+        Raises:
+            ValueError: If the game doesn't fit in the format.
+        """
+        if len(self.colors) > 4 or self.width * self.height > MAX_CELLS:
+            raise ValueError("records hold games of up to 4 players on up to 16384 cells")
+        header = GAME_HEADER.pack(len(self.colors), self.width, self.height,
+                                  HAS_SEED if self.seed is not None else 0,
+                                  self.seed or 0, len(self))
+        return header + bytes(color.value for color in self.colors) + bytes(self.moves)
+
+
+class RecordWriter:
+    """Appends games to a record file."""
+    file: BinaryIO
+
+    def __init__(self, path: str) -> None:
+        """Opens a record file, creating it if needed.
+
+        Args:
+            path (str): Path of the record file.
+        """
+        self.file = open(path, "ab")
+        if self.file.tell() == 0:
+            self.file.write(FILE_HEADER.pack(MAGIC, VERSION))
+
+    def __enter__(self) -> "RecordWriter":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def write(self, record: GameRecord) -> None:
+        self.file.write(record.to_bytes())
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class RecordReader:
+    """Reads the games of a record file one at a time.
+
+    The file is memory-mapped by default, so large files are iterated without being loaded,
+    only the bytes of the current game being copied. Otherwise it is read as a stream.
+    """
+    path: str
+    memory_map: bool
+
+    def __init__(self, path: str, memory_map: bool = True) -> None:
+        """Create a new RecordReader
+
+        Args:
+            path (str): Path of the record file.
+            memory_map (bool): Whether to memory-map the file instead of reading it.
+        """
+        self.path = path
+        self.memory_map = memory_map
+        self.__file = open(path, "rb")
+        self.__map = None
+
+    def __enter__(self) -> "RecordReader":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def __iter__(self) -> Iterator[GameRecord]:
+        self.__file.seek(0)
+        if self.memory_map:
+            return self.__iterate_map()
+        return self.__iterate_stream()
+
+    def close(self) -> None:
+        if self.__map is not None:
+            self.__map.close()
+            self.__map = None
+        self.__file.close()
+
+    def __iterate_map(self) -> Iterator[GameRecord]:
+        if self.__map is None:
+            if self.__file.seek(0, 2) == 0:
+                raise InvalidRecordException()
+            self.__map = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+        data = self.__map
+        self.__check_header(data[:FILE_HEADER.size])
+        offset = FILE_HEADER.size
+        while offset < len(data):
+            if offset + GAME_HEADER.size > len(data):
+                raise InvalidRecordException()
+            record, size = self.__header(data[offset:offset + GAME_HEADER.size])
+            offset += GAME_HEADER.size
+            end = offset + len(record.colors) + size
+            if end > len(data):
+                raise InvalidRecordException()
+            record.colors = self.__colors(data[offset:offset + len(record.colors)])
+            record.moves = data[offset + len(record.colors):end]
+            offset = end
+            yield record
+
+    def __iterate_stream(self) -> Iterator[GameRecord]:
+        self.__check_header(self.__file.read(FILE_HEADER.size))
+        while header := self.__file.read(GAME_HEADER.size):
+            if len(header) < GAME_HEADER.size:
+                raise InvalidRecordException()
+            record, size = self.__header(header)
+            colors = self.__file.read(len(record.colors))
+            record.moves = self.__file.read(size)
+            if len(colors) < len(record.colors) or len(record.moves) < size:
+                raise InvalidRecordException()
+            record.colors = self.__colors(colors)
+            yield record
+
+    @staticmethod
+    def __check_header(header: bytes) -> None:
+        if len(header) < FILE_HEADER.size:
+            raise InvalidRecordException()
+        magic, version = FILE_HEADER.unpack(header)
+        if magic != MAGIC or version != VERSION:
+            raise InvalidRecordException(f"Unsupported record file (version {version}).")
+
+    @staticmethod
+    def __colors(values: bytes) -> List[Colors]:
+        try:
+            return [Colors(value) for value in values]
+        except ValueError:
+            raise InvalidRecordException() from None
+
+    @staticmethod
+    def __header(header: bytes) -> Tuple[GameRecord, int]:
+        """Decodes the header of a game.
+
+        Returns:
+            tuple: (record without its colors and moves, size of the moves in bytes).
+        """
+        players, width, height, flags, seed, moves = GAME_HEADER.unpack(header)
+        record = GameRecord([None] * players, width, height, seed if flags & HAS_SEED else None)
+        return record, moves * MOVE_SIZE
@@ -0,0 +1,131 @@
+import sys
+
+from typing import Dict, List, TextIO, Tuple
+
+from .colors import Colors
+
+
+class Renderer:
+    """Draws frames in the terminal, only redrawing the cells that changed.
+
+    A frame is made of grids (such as `Board.render_cells` and `Deck.render_cells`)
+    stacked one below the other. The renderer keeps the last frame drawn, and writes
+    the ANSI cursor moves and cell strings of the changed cells only, in a single write.
+    With `update`, the grids report the cells changed since the last frame (see
+    `Board.render_changes`), and only those are compared.
+    After each frame the cursor is left below it, on a cleared line, for the prompts.
+    """
+    CLEAR_SCREEN: str = "\033[2J\033[H"
+    CLEAR_BELOW: str = "\033[J"
+    # Drawn where a cell of the previous frame no longer exists
+    EMPTY_CELL: str = f"{str(Colors.RESET)} "
+
+    stream: TextIO
+    # Cells of the last frame drawn, None until the first frame or after `invalidate`
+    frame: List[List[str]] | None
+    # Rows of each grid of the last frame drawn by `update`, as given, and the row where they start
+    grids: List[Tuple[List[List[str]], int]]
+
+    def __init__(self, stream: TextIO = sys.stdout) -> None:
+        """Create a new Renderer
+
+        Args:
+            stream (TextIO): Terminal output where the frames are written.
+        """
+        self.stream = stream
+        self.frame = None
+        self.grids = []
+
+    def invalidate(self) -> None:
+        """Forgets the last frame, so the next one clears the screen and is fully drawn."""
+        self.frame = None
+        self.grids = []
+
+    def diff(self, frame: List[List[str]], changes: Dict[int, List[int] | None] | None = None) -> str:
+        """Computes the output drawing a frame over the last one, and keeps it as the last frame.
+
+        Args:
+            frame (List[List[str]]): Rows of cells of the new frame.
+            changes (Dict[int, List[int] | None] | None): Columns of the cells which may have changed
+                in each row, None for a whole row. Rows missing from it are the same as in the last
+                frame. Every cell is compared if None, or if there is no last frame.
+
+        Returns:
+            str: ANSI codes and cells to write.
+        """
+        output = []
+        previous = self.frame
+        if previous is None:
+            output.append(self.CLEAR_SCREEN)
+            previous = []
+            changes = None
+        if changes is None:
+            changes = dict.fromkeys(range(len(frame)))
+
+        # Rows of the last frame are kept, except those changed, or below the new frame
+        kept = previous[:len(frame)] + [[] for _ in range(len(frame) - len(previous))]
+        for y in sorted(changes.keys() | range(len(frame), len(previous))):
+            row = frame[y] if y < len(frame) else []
+            previous_row = previous[y] if y < len(previous) else []
+            columns = changes.get(y)
+            # Rows partly changed are the same length, their kept cells are updated in place
+            in_place = columns is not None
+            if columns is None:
+                columns = range(max(len(row), len(previous_row)))
+                if y < len(frame):
+                    kept[y] = list(row)
+            # Column where the cursor is after the last cell written on this row
+            cursor = None
+            for x in columns:
+                cell = row[x] if x < len(row) else self.EMPTY_CELL
+                if x < len(previous_row) and previous_row[x] == cell:
+                    continue
+                if cursor != x:
+                    # ANSI positions start at 1
+                    output.append(f"\033[{y + 1};{x + 1}H")
+                output.append(cell)
+                cursor = x + 1
+                if in_place:
+                    previous_row[x] = cell
+
+        output.append(f"\033[{len(frame) + 1};1H{str(Colors.RESET)}{self.CLEAR_BELOW}")
+        self.frame = kept
+        return "".join(output)
+
+    def render(self, *grids: List[List[str]]) -> None:
+        """Draws the grids one below the other, comparing every cell with the last frame.
+
+        Args:
+            *grids (List[List[str]]): Rows of cells of each part of the frame.
+        """
+        self.grids = []
+        frame = [row for grid in grids for row in grid]
+        self.stream.write(self.diff(frame))
+        self.stream.flush()
+
+    def update(self, *grids: Tuple[List[List[str]], List[Tuple[int, int]] | None]) -> None:
+        """Draws the grids one below the other, comparing only the cells they report as changed.
+
+        The changes of a grid are only used if the same rows were drawn at the same place
+        in the last frame, otherwise its cells are all compared.
+
+        Args:
+            *grids (tuple): (rows, changes) of each part of the frame, as returned by
+                            `Board.render_changes` and `Deck.render_changes`.
+        """
+        frame = []
+        changes = {}
+        drawn = []
+        for i, (rows, cells) in enumerate(grids):
+            offset = len(frame)
+            if (cells is None or i >= len(self.grids)
+                or self.grids[i][0] is not rows or self.grids[i][1] != offset):
+                changes.update(dict.fromkeys(range(offset, offset + len(rows))))
+            else:
+                for y, x in cells:
+                    changes.setdefault(offset + y, []).append(x)
+            drawn.append((rows, offset))
+            frame += rows
+        self.grids = drawn
+        self.stream.write(self.diff(frame, changes))
+        self.stream.flush()
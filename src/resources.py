@@ -0,0 +1,210 @@
+import hashlib
+import os
+import pickle
+
+from typing import List, Tuple
+
+from .piece import Piece
+
+# Directory of the pieces shipped with the game
+PIECES_PATH: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "res", "pieces")
+# Compiled pieces, relative to the pieces directory
+CACHE_PATH: str = os.path.join("__pycache__", "pieces.pickle")
+# Changed whenever the content of the cache changes
+CACHE_VERSION: int = 2
+
+
+def pieces_files(pieces_path: str = PIECES_PATH) -> List[str]:
+    """Lists the pieces files of a directory.
+
+    Files are listed in alphabetical order so the pieces always come in the same order.
+
+    Args:
+        pieces_path (str): Directory containing the pieces files.
+
+    Returns:
+        List[str]: Path of each pieces file.
+    """
+    paths = []
+    for root, dirs, files in os.walk(pieces_path):
+        dirs.sort()
+        for file in sorted(files):
+            if file.endswith(".txt"):
+                paths.append(os.path.join(root, file))
+    return paths
+
+
+def parse_pieces(paths: List[str]) -> List[Tuple[Tuple[int, int]]]:
+    """Reads the pieces of text files (see `res/pieces/HOWTO.md` for the format).
+
+    Args:
+        paths (List[str]): Pieces files to read.
+
+    Returns:
+        List[tuple]: Cells of each piece, in the order of the files.
+    """
+    piece_separator = "&"
+    coord_piece_separator = ";"
+    coord_separator = ","
+
+    pieces_data = []
+    for path in paths:
+        with open(path) as piece_file:
+            for raw_data_piece in piece_file.read().split(piece_separator):
+                piece_data = []
+                for coord_piece in raw_data_piece.split(coord_piece_separator):
+                    x, y = coord_piece.split(coord_separator)
+                    piece_data.append((int(x), int(y)))
+                pieces_data.append(tuple(piece_data))
+    return pieces_data
+
+
+def load_pieces(pieces_path: str = PIECES_PATH, use_cache: bool = True) -> List[Piece]:
+    """Loads the pieces of the text files in the 'res/pieces/' directory.
+
+    The parsed pieces and the orientation tables of their shapes are compiled to
+    `CACHE_PATH`, which later loads only unpickle. The cache is used while the files keep
+    their size and modification time, or when their content hash is still the same.
+
+    Args:
+        pieces_path (str): Directory containing the pieces files.
+        use_cache (bool): Reads and writes the compiled pieces.
+
+    Returns:
+        List[Piece]: The pieces, in the order of the files.
+    """
+    paths = pieces_files(pieces_path)
+    pieces_data = load_cache(pieces_path, paths) if use_cache else None
+    if pieces_data is None:
+        pieces_data = parse_pieces(paths)
+        pieces = [Piece(piece_data) for piece_data in pieces_data]
+        if use_cache:
+            save_cache(pieces_path, paths, pieces)
+        return pieces
+    return [Piece(piece_data) for piece_data in pieces_data]
+
+
+def files_stats(paths: List[str]) -> List[Tuple[str, int, int]]:
+    """Retrieves the size and modification time of files.
+
+    Args:
+        paths (List[str]): Files to check.
+
+    Returns:
+        List[tuple]: (path, size, modification time in nanoseconds) of each file.
+    """
+    stats = []
+    for path in paths:
+        stat = os.stat(path)
+        stats.append((path, stat.st_size, stat.st_mtime_ns))
+    return stats
+
+
+def files_digest(paths: List[str]) -> str:
+    """Hashes the content of files.
+
+    Args:
+        paths (List[str]): Files to hash.
+
+    Returns:
+        str: SHA-256 of the names and contents of the files.
+    """
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(os.path.basename(path).encode())
+        with open(path, "rb") as file:
+            digest.update(file.read())
+    return digest.hexdigest()
+
+
+def load_cache(pieces_path: str, paths: List[str]) -> List[Tuple[Tuple[int, int]]] | None:
+    """Loads the compiled pieces, the orientation tables of their shapes being registered by unpickling.
+
+    Args:
+        pieces_path (str): Directory containing the pieces files.
+        paths (List[str]): Current pieces files of the directory.
+
+    Returns:
+        List[tuple] | None: Cells of each piece, or None if there is no valid cache.
+    """
+    cache = read_cache_file(os.path.join(pieces_path, CACHE_PATH))
+    if cache is None:
+        return None
+
+    stats = files_stats(paths)
+    if cache["stats"] != stats:
+        if cache["digest"] != files_digest(paths):
+            return None
+        # Same content with new modification times, no need to hash the files next time
+        cache["stats"] = stats
+        write_cache(pieces_path, cache)
+    # The shapes are registered as they are unpickled
+    return cache["pieces"]
+
+
+def save_cache(pieces_path: str, paths: List[str], pieces: List[Piece]) -> None:
+    """Compiles the pieces and the orientation tables of their shapes.
+
+    Args:
+        pieces_path (str): Directory containing the pieces files.
+        paths (List[str]): Pieces files the pieces come from.
+        pieces (List[Piece]): Pieces to compile.
+    """
+    shapes = []
+    for piece in pieces:
+        if piece.shape not in shapes:
+            shapes.append(piece.shape)
+    write_cache(pieces_path, {
+        "version": CACHE_VERSION,
+        "stats": files_stats(paths),
+        "digest": files_digest(paths),
+        "pieces": [piece.data for piece in pieces],
+        "shapes": shapes,
+    })
+
+
+def write_cache(pieces_path: str, cache: dict) -> None:
+    """Writes the compiled pieces, the cache is skipped if the directory is read-only.
+
+    Args:
+        pieces_path (str): Directory containing the pieces files.
+        cache (dict): Content of the cache.
+    """
+    write_cache_file(os.path.join(pieces_path, CACHE_PATH), cache)
+
+
+def read_cache_file(path: str) -> dict | None:
+    """Reads a cache file written by `write_cache_file`.
+
+    Args:
+        path (str): Path of the cache file.
+
+    Returns:
+        dict | None: Content of the cache, or None if it is missing, corrupted or of another `CACHE_VERSION`.
+    """
+    try:
+        with open(path, "rb") as cache_file:
+            cache = pickle.load(cache_file)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return None
+    if not isinstance(cache, dict) or cache.get("version") != CACHE_VERSION:
+        return None
+    return cache
+
+
+def write_cache_file(path: str, cache: dict) -> None:
+    """Writes a cache file, the cache is skipped if its directory is read-only.
+
+    Args:
+        path (str): Path of the cache file.
+        cache (dict): Content of the cache, with its "version".
+    """
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Written aside then renamed, so concurrent workers never read a partial cache
+        temporary_path = f"{path}.{os.getpid()}"
+        with open(temporary_path, "wb") as cache_file:
+            pickle.dump(cache, cache_file, pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_path, path)
+    except OSError:
+        pass
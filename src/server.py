@@ -0,0 +1,226 @@
+"""Asyncio server hosting many games, played by clients over a local socket.
+
+Each line is a command or an event, its words separated by spaces:
+
+    client -> server
+        NEW <players> [<seed>]                      creates a game
+        JOIN <game>                                 takes the next free seat of a game
+        MOVE <game> <slot> <orientation> <x> <y>    plays the piece at `slot` in the deck of the seat to move
+        PASS <game>                                 passes the turn of the seat to move
+    server -> client
+        GAME <game>                                 the game created
+        SEAT <game> <seat> <colors>                 the seat taken, with the color values of every seat
+        TURN <game> <seat>                          the seat to move, sent to every seat
+        PLAYED <game> <seat> <slot> <orientation> <x> <y>
+        PASSED <game> <seat>                        the seat passed its turn, sent to every seat
+        OVER <game> <scores>                        the score of each seat, the game is closed
+        ERROR <exception> <message>                 the command was refused
+
+A connection can hold several seats, of one or several games. Moves are checked with
+`Player.place_piece`, and players without any legal move pass their turn automatically,
+without any event. A player with legal moves can also choose to pass with PASS.
+"""
+import asyncio
+import random
+import time
+
+from typing import Dict, List
+
+from .agents import Agent
+from .engine import Engine
+from .exceptions import PieceNotFoundException
+from .piece import Piece
+
+HOST: str = "127.0.0.1"
+PORT: int = 7070
+
+
+def pass_turns(engine: Engine) -> None:
+    """Passes the turn of the players without any legal move, until a player can move.
+
+    Args:
+        engine (Engine): Game to pass the turns in.
+    """
+    while not engine.is_over() and not engine.players[engine.current].has_legal_move(engine.board):
+        engine.apply(None)
+
+
+class ProtocolError(Exception):
+    """A command the server cannot run."""
+
+
+class ServerGame:
+    """A game hosted by the server: its board, decks and move log, and the connection of each seat."""
+    id: int
+    engine: Engine
+    # Writer of the connection of each seat, None while the seat is free
+    seats: List[asyncio.StreamWriter | None]
+
+    def __init__(self, id: int, players: int, pieces: List[Piece], seed: int | None) -> None:
+        """Create a new ServerGame
+
+        Args:
+            id (int): Identifier of the game on the server.
+            players (int): Number of seats.
+            pieces (List[Piece]): Pieces of each deck.
+            seed (int | None): Seed of the color of each seat.
+        """
+        self.id = id
+        colors = Engine.PLAYERS_COLOR.copy()
+        random.Random(seed).shuffle(colors)
+        # Moves come from the connections, the agents are never asked to play
+        self.engine = Engine([Agent() for _ in range(players)], pieces, colors=colors[:players])
+        self.seats = [None] * players
+
+    def started(self) -> bool:
+        return all(seat is not None for seat in self.seats)
+
+    def broadcast(self, *words) -> None:
+        line = (" ".join(str(word) for word in words) + "\n").encode()
+        for writer in set(self.seats):
+            if writer is not None and not writer.is_closing():
+                writer.write(line)
+
+
+class Server:
+    """Hosts games for the clients connected to it.
+
+    Games only live in memory, and end when they are over or when a connection
+    holding one of their seats is closed.
+    """
+    pieces: List[Piece]
+    games: Dict[int, ServerGame]
+    # Moves played since the server started, and the time spent checking and playing them
+    moves: int
+    move_time: float
+
+    def __init__(self, pieces: List[Piece]) -> None:
+        """Create a new Server
+
+        Args:
+            pieces (List[Piece]): Pieces of the decks of the games.
+        """
+        self.pieces = pieces
+        self.games = {}
+        self.moves = 0
+        self.move_time = 0.0
+        self.__next_id = 0
+        self.__server = None
+
+    async def start(self, host: str = HOST, port: int = PORT) -> int:
+        """Starts listening for connections.
+
+        Args:
+            host (str): Address to listen on.
+            port (int): Port to listen on, 0 for any free port.
+
+        Returns:
+            int: The port listened on.
+        """
+        self.__server = await asyncio.start_server(self.__handle_connection, host, port)
+        return self.__server.sockets[0].getsockname()[1]
+
+    async def close(self) -> None:
+        if self.__server is not None:
+            self.__server.close()
+            await self.__server.wait_closed()
+            self.__server = None
+
+    async def serve_forever(self) -> None:
+        await self.__server.serve_forever()
+
+    async def __handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while line := await reader.readline():
+                try:
+                    self.handle(writer, line.decode().split())
+                except Exception as e:
+                    writer.write(f"ERROR {type(e).__name__} {e}\n".encode())
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            for game in [game for game in self.games.values() if writer in game.seats]:
+                self.__end(game)
+            writer.close()
+
+    def handle(self, writer: asyncio.StreamWriter, words: List[str]) -> None:
+        """Runs a command of a connection.
+
+        Args:
+            writer (asyncio.StreamWriter): Connection the command comes from, to send the replies to.
+            words (List[str]): Words of the command line.
+
+        Raises:
+            ProtocolError: If the command is unknown or malformed.
+            Exception: The exception raised by `Player.place_piece` if the move is illegal.
+        """
+        match words:
+            case ["NEW", players, *seed] if len(seed) <= 1:
+                players = int(players)
+                if not 1 <= players <= len(Engine.PLAYERS_COLOR):
+                    raise ProtocolError(f"games have 1 to {len(Engine.PLAYERS_COLOR)} players")
+                game = ServerGame(self.__next_id, players, self.pieces, int(seed[0]) if seed else None)
+                self.__next_id += 1
+                self.games[game.id] = game
+                writer.write(f"GAME {game.id}\n".encode())
+            case ["JOIN", id]:
+                game = self.__game(id)
+                if game.started():
+                    raise ProtocolError(f"game {game.id} is full")
+                seat = game.seats.index(None)
+                game.seats[seat] = writer
+                colors = ",".join(str(player.color.value) for player in game.engine.players)
+                writer.write(f"SEAT {game.id} {seat} {colors}\n".encode())
+                if game.started():
+                    self.__next_turn(game)
+            case ["MOVE", id, slot, orientation, x, y]:
+                game = self.__game(id)
+                if not game.started() or game.seats[game.engine.current] is not writer:
+                    raise ProtocolError("not your turn")
+                self.__move(game, int(slot), int(orientation), int(x), int(y))
+            case ["PASS", id]:
+                game = self.__game(id)
+                if not game.started() or game.seats[game.engine.current] is not writer:
+                    raise ProtocolError("not your turn")
+                seat = game.engine.current
+                game.engine.apply(None)
+                game.broadcast("PASSED", game.id, seat)
+                self.__next_turn(game)
+            case _:
+                raise ProtocolError(f"unknown command {' '.join(words)!r}")
+
+    def __game(self, id: str) -> ServerGame:
+        game = self.games.get(int(id))
+        if game is None:
+            raise ProtocolError(f"no game {id}")
+        return game
+
+    def __move(self, game: ServerGame, slot: int, orientation: int, x: int, y: int) -> None:
+        start = time.monotonic()
+        engine = game.engine
+        seat = engine.current
+        deck = engine.players[seat].deck
+        if not deck.has(slot):
+            raise PieceNotFoundException()
+        piece = deck.table[slot]
+        if not 0 <= orientation < len(piece.shape.orientations):
+            raise ProtocolError(f"no orientation {orientation}")
+
+        engine.apply((piece, orientation, x, y))
+        game.broadcast("PLAYED", game.id, seat, slot, orientation, x, y)
+        self.__next_turn(game)
+        self.moves += 1
+        self.move_time += time.monotonic() - start
+
+    def __next_turn(self, game: ServerGame) -> None:
+        engine = game.engine
+        pass_turns(engine)
+        if engine.is_over():
+            self.__end(game)
+        else:
+            game.broadcast("TURN", game.id, engine.current)
+
+    def __end(self, game: ServerGame) -> None:
+        game.broadcast("OVER", game.id, *game.engine.scores())
+        self.games.pop(game.id, None)
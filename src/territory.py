@@ -0,0 +1,178 @@
+from typing import List, Tuple
+
+from .board import Board
+from .colors import Colors
+from .piece import Piece
+
+# Maps of a position: reachable area of each color (in the order of the colors), and score of each color
+Maps = Tuple[Tuple[int, ...], Tuple[float, ...]]
+
+
+class TerritoryEvaluator:
+    """Territory and influence of each color of a board, kept up to date with its journal.
+
+    The reachable area of a color is the cells its next pieces could cover: the cells connected
+    to one of its anchors (or to a free corner of the board before its first piece) by free cells
+    not forbidden to it, within `radius` steps. Cells reachable by several colors are contested.
+
+    The maps follow the pieces put on the board and undone (see `Board.journal`): the pieces put
+    since the last read only update the colors whose area they cover, and the maps before them are
+    kept to be restored by an undo. They are bitboards, like the ones of `Board`, and the scores are
+    computed with the maps, so reading them again costs nothing until the board changes.
+    """
+    # Weights of the score: free cells of the area, contested cells of the area, anchors
+    AREA_WEIGHT: float = 1.0
+    CONTESTED_WEIGHT: float = 0.5
+    ANCHOR_WEIGHT: float = 1.0
+
+    board: Board
+    colors: List[Colors]
+    radius: int
+
+    def __init__(self, board: Board, colors: List[Colors], radius: int = Piece.MAX_SIZE - 1) -> None:
+        """Create a new TerritoryEvaluator
+
+        Args:
+            board (Board): Board to evaluate.
+            colors (List[Colors]): Colors to evaluate, usually the colors of the players.
+            radius (int): Steps from an anchor counted in the reachable area, the largest
+                          piece reaching `Piece.MAX_SIZE - 1` cells away from the anchor it covers.
+        """
+        self.board = board
+        self.colors = colors
+        self.radius = radius
+        self.reset()
+
+    def fork(self, board: Board) -> "TerritoryEvaluator":
+        """Creates an evaluator for a copy of the board, starting from the current maps.
+
+        Args:
+            board (Board): Copy of the board (see `Board.__copy__`), with an empty journal.
+
+        Returns:
+            TerritoryEvaluator: Evaluator of the copy, which doesn't compute its maps again.
+        """
+        self.__sync()
+        evaluator = TerritoryEvaluator.__new__(TerritoryEvaluator)
+        evaluator.board = board
+        evaluator.colors = self.colors
+        evaluator.radius = self.radius
+        evaluator.__maps = self.__maps
+        evaluator.__stack = []
+        return evaluator
+
+    def reset(self) -> None:
+        """Computes the maps from scratch, needed after changes outside of the journal (such as `Board.rotate`)."""
+        self.__maps = self.__compute()
+        # Journal entries applied to the maps, with the maps before each of them (None if unknown,
+        # computed again from the board if an undo goes back to them)
+        self.__stack: List[Tuple[tuple, Maps | None]] = [(entry, None) for entry in self.board.journal]
+
+    def reach(self, color: Colors) -> int:
+        """Retrieves the reachable area of a color, as a bitboard."""
+        self.__sync()
+        return self.__maps[0][self.colors.index(color)]
+
+    def contested(self) -> int:
+        """Retrieves the cells reachable by several colors, as a bitboard."""
+        self.__sync()
+        return self.__contested(self.__maps[0])
+
+    def score(self, color: Colors) -> float:
+        """Retrieves the evaluation of a color.
+
+        Returns:
+            float: Weighted sum of the free and contested cells of its area and of its anchors.
+        """
+        self.__sync()
+        return self.__maps[1][self.colors.index(color)]
+
+    def scores(self) -> List[float]:
+        """Retrieves the evaluation of each color, in the order of the colors."""
+        self.__sync()
+        return list(self.__maps[1])
+
+    def __sync(self) -> None:
+        """Restores the maps of the pieces undone, then applies the pieces put since the last call."""
+        journal = self.board.journal
+        stack = self.__stack
+        if len(stack) == len(journal) and (not stack or stack[-1][0] is journal[-1]):
+            return
+        maps = self.__maps
+        while stack and (len(stack) > len(journal) or stack[-1][0] is not journal[len(stack) - 1]):
+            maps = stack.pop()[1]
+        if len(stack) == len(journal):
+            self.__maps = maps if maps is not None else self.__compute()
+            return
+
+        # The board only holds the bitboards after the last piece: the pieces put since the last
+        # read are applied at once, the maps between them being unknown
+        cells = 0
+        colors = set()
+        for entry in journal[len(stack):]:
+            cells |= entry[4]
+            colors.add(entry[1])
+        stack.append((journal[len(stack)], maps))
+        stack += [(entry, None) for entry in journal[len(stack):]]
+        self.__maps = self.__update(maps, cells, colors) if maps is not None else self.__compute()
+
+    def __compute(self) -> Maps:
+        """Computes every map from the bitboards of the board."""
+        return self.__update(None, 0, set())
+
+    def __update(self, maps: Maps | None, cells: int, colors: set) -> Maps:
+        """Computes the maps of the board after cells are put.
+
+        Args:
+            maps (Maps | None): Maps before the cells are put, None to compute every map.
+            cells (int): Bitboard of the cells put.
+            colors (set): Values of the colors of the cells.
+
+        Returns:
+            Maps: The maps of the board.
+        """
+        board = self.board
+        occupancy, forbidden, anchors, occupied = board.occupancy, board.forbidden, board.anchors, board.occupied
+        reaches = []
+        for i, other in enumerate(self.colors):
+            value = other.value
+            # Cells of another color only shrink the areas they cover
+            if maps is not None and value not in colors and not maps[0][i] & cells:
+                reaches.append(maps[0][i])
+                continue
+            free = board.mask & ~occupied & ~forbidden.get(value, 0)
+            seeds = anchors.get(value, 0) if occupancy.get(value, 0) else board.corners & ~occupied
+            reaches.append(self.__flood(seeds & free, free))
+
+        contested = self.__contested(reaches)
+        scores = []
+        for other, reach in zip(self.colors, reaches):
+            if occupancy.get(other.value, 0):
+                anchor_count = anchors.get(other.value, 0).bit_count()
+            else:
+                anchor_count = (board.corners & ~occupied).bit_count()
+            scores.append(self.AREA_WEIGHT * (reach & ~contested).bit_count()
+                          + self.CONTESTED_WEIGHT * (reach & contested).bit_count()
+                          + self.ANCHOR_WEIGHT * anchor_count)
+        return tuple(reaches), tuple(scores)
+
+    def __flood(self, reach: int, free: int) -> int:
+        """Grows an area through free cells, one step per side, `radius` times at most."""
+        stride = self.board.stride
+        frontier = reach
+        for _ in range(self.radius):
+            # The column after the last one of each row is never free, so shifts don't wrap
+            frontier = (frontier << 1 | frontier >> 1 | frontier << stride | frontier >> stride) & free & ~reach
+            if not frontier:
+                break
+            reach |= frontier
+        return reach
+
+    @staticmethod
+    def __contested(reaches: Tuple[int, ...] | List[int]) -> int:
+        seen = 0
+        contested = 0
+        for reach in reaches:
+            contested |= seen & reach
+            seen |= reach
+        return contested
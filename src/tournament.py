@@ -0,0 +1,155 @@
+import multiprocessing
+import random
+
+from itertools import combinations
+from typing import Callable, Dict, List, Tuple
+
+from .agents import Agent
+from .engine import Engine
+from .piece import Piece
+from .resources import PIECES_PATH, load_pieces
+
+# State of each worker process, set once by `_init_worker` instead of being sent with every game
+_entrants: Dict[str, Callable[[int], Agent]] = {}
+_pieces: List[Piece] = []
+
+
+def _init_worker(entrants: Dict[str, Callable[[int], Agent]], pieces_path: str) -> None:
+    """Loads the pieces and the entrants in a worker process.
+
+    Args:
+        entrants (Dict[str, Callable[[int], Agent]]): Agent factory of each entrant.
+        pieces_path (str): Directory containing the pieces files.
+    """
+    global _entrants, _pieces
+    _entrants = entrants
+    _pieces = load_pieces(pieces_path)
+
+
+def _play_game(game: Tuple[int, str, str, int]) -> Tuple[int, str, str, int, int]:
+    """Plays one game of a tournament.
+
+    The two entrants play on alternate seats (first, second, first, second).
+    The seed of the game sets the colors of the seats and the seed of each agent.
+
+    Args:
+        game (tuple): (index, first, second, seed) as built by `Tournament.schedule`.
+
+    Returns:
+        tuple: (index, first, second, score of first, score of second), where the score
+               of an entrant is the sum of the scores of its two seats.
+    """
+    index, first, second, seed = game
+    rng = random.Random(seed)
+    colors = Engine.PLAYERS_COLOR.copy()
+    rng.shuffle(colors)
+
+    names = [first, second, first, second]
+    agents = [_entrants[name](seed * len(names) + seat) for seat, name in enumerate(names)]
+    scores = Engine(agents, _pieces, colors=colors).run()
+    return (index, first, second, scores[0] + scores[2], scores[1] + scores[3])
+
+
+class Tournament:
+    """Round-robin tournament between agents, played across a pool of processes.
+
+    Every pair of entrants plays `games_per_pair` games, alternating which of them takes
+    the first seat. Each game gets its own seed derived from the seed of the tournament,
+    so a tournament is reproducible whatever the number of processes.
+    Entrants are factories building an agent from a seed, they must be picklable
+    (a class or a `functools.partial`) to be sent to the worker processes.
+    """
+    ELO_INITIAL: float = 1500
+    ELO_K: float = 16
+
+    entrants: Dict[str, Callable[[int], Agent]]
+    games_per_pair: int
+    seed: int
+    processes: int | None
+    pieces_path: str
+    # Played games, as (index, first, second, score of first, score of second), by index
+    results: List[Tuple[int, str, str, int, int]]
+
+    def __init__(self, entrants: Dict[str, Callable[[int], Agent]], games_per_pair: int = 10,
+                 seed: int = 0, processes: int | None = None, pieces_path: str = PIECES_PATH) -> None:
+        """Create a new Tournament
+
+        Args:
+            entrants (Dict[str, Callable[[int], Agent]]): Agent factory of each entrant, by name.
+            games_per_pair (int): Number of games played by each pair of entrants.
+            seed (int): Seed of the tournament.
+            processes (int | None): Number of worker processes, one per core by default.
+                                    With 1, games are played in the current process.
+            pieces_path (str): Directory containing the pieces files.
+        """
+        self.entrants = entrants
+        self.games_per_pair = games_per_pair
+        self.seed = seed
+        self.processes = processes
+        self.pieces_path = pieces_path
+        self.results = []
+
+    def schedule(self) -> List[Tuple[int, str, str, int]]:
+        """Lists the games of the tournament.
+
+        Returns:
+            List[tuple]: (index, first, second, seed) of each game.
+        """
+        rng = random.Random(self.seed)
+        games = []
+        for first, second in combinations(self.entrants, 2):
+            for i in range(self.games_per_pair):
+                pair = (first, second) if i % 2 == 0 else (second, first)
+                games.append((len(games), *pair, rng.getrandbits(32)))
+        return games
+
+    def run(self) -> List[Tuple[int, str, str, int, int]]:
+        """Plays every game of the tournament.
+
+        Returns:
+            List[tuple]: Result of each game, see `results`.
+        """
+        games = self.schedule()
+        if self.processes == 1:
+            _init_worker(self.entrants, self.pieces_path)
+            results = [_play_game(game) for game in games]
+        else:
+            with multiprocessing.Pool(self.processes, _init_worker, (self.entrants, self.pieces_path)) as pool:
+                # Large chunks keep the workers busy instead of waiting for the next game
+                chunksize = max(1, len(games) // (4 * (self.processes or multiprocessing.cpu_count())))
+                results = list(pool.imap_unordered(_play_game, games, chunksize))
+
+        self.results = sorted(results)
+        return self.results
+
+    def elo(self) -> Dict[str, float]:
+        """Computes the Elo rating of each entrant, updated game by game in the order of the schedule.
+
+        Returns:
+            Dict[str, float]: Rating of each entrant.
+        """
+        ratings = {name: self.ELO_INITIAL for name in self.entrants}
+        for _, first, second, first_score, second_score in self.results:
+            expected = 1 / (1 + 10 ** ((ratings[second] - ratings[first]) / 400))
+            actual = 1 if first_score > second_score else 0.5 if first_score == second_score else 0
+            ratings[first] += self.ELO_K * (actual - expected)
+            ratings[second] -= self.ELO_K * (actual - expected)
+        return ratings
+
+    def win_rates(self) -> Dict[str, float]:
+        """Computes the share of games won by each entrant, draws counting as half a win.
+
+        Returns:
+            Dict[str, float]: Win rate of each entrant.
+        """
+        wins = {name: 0.0 for name in self.entrants}
+        games = {name: 0 for name in self.entrants}
+        for _, first, second, first_score, second_score in self.results:
+            games[first] += 1
+            games[second] += 1
+            if first_score == second_score:
+                wins[first] += 0.5
+                wins[second] += 0.5
+            else:
+                wins[first if first_score > second_score else second] += 1
+        return {name: wins[name] / games[name] if games[name] else 0.0 for name in self.entrants}
@@ -0,0 +1,87 @@
+from typing import Any, List, Tuple
+
+
+class TranspositionTable:
+    """Bounded table of search results by position hash, shared by search agents.
+
+    The table holds a fixed number of slots, the slot of a position being its hash modulo
+    the capacity. When two positions need the same slot, the stored one is replaced if it
+    comes from an older search (`new_search`) or if the new result was searched at least
+    as deep, so deep results of the current search are kept over shallow ones.
+    """
+    # Kind of value stored, for alpha-beta searches
+    EXACT: int = 0
+    LOWER_BOUND: int = 1
+    UPPER_BOUND: int = 2
+
+    capacity: int
+    # Entry of each slot, as (hash, depth, value, flag, move, generation), or None
+    entries: List[Tuple[int, int, Any, int, Any, int] | None]
+    generation: int
+
+    hits: int
+    misses: int
+    replacements: int
+
+    def __init__(self, capacity: int = 1 << 20) -> None:
+        """Create a new TranspositionTable
+
+        Args:
+            capacity (int): Number of slots of the table.
+        """
+        self.capacity = capacity
+        self.entries = [None] * capacity
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.replacements = 0
+
+    def new_search(self) -> None:
+        """Marks the entries stored so far as older, so they are replaced first."""
+        self.generation += 1
+
+    def lookup(self, position: int) -> Tuple[int, Any, int, Any] | None:
+        """Retrieves the result stored for a position.
+
+        Args:
+            position (int): Hash of the position.
+
+        Returns:
+            tuple | None: (depth, value, flag, move), or None if the position isn't stored.
+        """
+        entry = self.entries[position % self.capacity]
+        if entry is None or entry[0] != position:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry[1:5]
+
+    def store(self, position: int, depth: int, value: Any, flag: int = EXACT, move: Any = None) -> bool:
+        """Stores the result of the search of a position, following the replacement policy.
+
+        Args:
+            position (int): Hash of the position.
+            depth (int): Depth the position was searched to.
+            value (Any): Value of the position.
+            flag (int): EXACT, LOWER_BOUND or UPPER_BOUND.
+            move (Any): Best move found, if any.
+
+        Returns:
+            bool: False if a more valuable entry was kept instead.
+        """
+        slot = position % self.capacity
+        entry = self.entries[slot]
+        if entry is not None and entry[0] != position:
+            if entry[5] == self.generation and entry[1] > depth:
+                return False
+            self.replacements += 1
+        self.entries[slot] = (position, depth, value, flag, move, self.generation)
+        return True
+
+    def clear(self) -> None:
+        """Removes every entry."""
+        self.entries = [None] * self.capacity
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.replacements = 0
@@ -0,0 +1,85 @@
+import hashlib
+
+from typing import TYPE_CHECKING, Dict, List, Tuple
+
+if TYPE_CHECKING:
+    from .board import Board
+    from .player import Player
+
+# Random 64-bit key of each feature of a position, created on first use
+_keys: Dict[Tuple, int] = {}
+
+
+def key(*feature: int | str) -> int:
+    """Retrieves the Zobrist key of a feature of a position.
+
+    Keys are derived from a hash of the feature rather than drawn from a random generator,
+    so every process gets the same keys whatever the order they are first used in.
+
+    Args:
+        *feature (int | str): Feature, such as ("cell", x, y, color value).
+
+    Returns:
+        int: The 64-bit key of the feature.
+    """
+    value = _keys.get(feature)
+    if value is None:
+        digest = hashlib.blake2b(repr(feature).encode(), digest_size=8).digest()
+        value = _keys[feature] = int.from_bytes(digest, "little")
+    return value
+
+
+def cell_key(x: int, y: int, color: int) -> int:
+    """Retrieves the key of a cell holding a color.
+
+    Args:
+        x (int): Horizontal position of the cell.
+        y (int): Vertical position of the cell.
+        color (int): Value of the color in the cell.
+
+    Returns:
+        int: The 64-bit key.
+    """
+    return key("cell", x, y, color)
+
+
+def deck_key(color: int, slot: int) -> int:
+    """Retrieves the key of a piece still in the deck of a color.
+
+    Args:
+        color (int): Value of the color of the deck.
+        slot (int): Position of the piece in the deck when it was created.
+
+    Returns:
+        int: The 64-bit key.
+    """
+    return key("deck", color, slot)
+
+
+def side_key(player: int) -> int:
+    """Retrieves the key of the player to move.
+
+    Args:
+        player (int): Index of the player in the turn order.
+
+    Returns:
+        int: The 64-bit key.
+    """
+    return key("side", player)
+
+
+def position_hash(board: "Board", players: List["Player"], current: int) -> int:
+    """Computes the Zobrist hash of a position from the hashes kept up to date by the board and the decks.
+
+    Args:
+        board (Board): Game board.
+        players (List[Player]): Players, in the turn order.
+        current (int): Index of the player to move.
+
+    Returns:
+        int: The 64-bit hash of the position.
+    """
+    value = board.hash ^ side_key(current)
+    for player in players:
+        value ^= player.deck.hash
+    return value
@@ -2,8 +2,13 @@ import unittest
 
 from src.exceptions import *
 from src.board import Board
+from src.agents import RandomAgent
 from src.colors import Colors
+from src.engine import Engine
 from src.piece import Piece
+from src.player import Player
+from src.player.deck import Deck
+from src.resources import load_pieces
 
 
 class BoardTest(unittest.TestCase):
@@ -15,11 +20,8 @@ class BoardTest(unittest.TestCase):
 
     def test_is_piece_overlapping_at(self) -> None:
         piece = Piece(tuple([(0, 0)]))
-        piece.color = Colors.BLUE
 
-        self.board.put(piece, 2, 2)
-        # Needed to call 'save' method to have 'backup' 
-        # variable used in the 'is_piece_overlapping_at' method
+        self.board.put(piece, 2, 2, Colors.BLUE)
         self.board.save()
 
         self.assertFalse(self.board.is_piece_overlapping_at(piece, 0, 0))
@@ -38,35 +40,199 @@ class BoardTest(unittest.TestCase):
 
     def test_can_place_piece_at(self) -> None:
         piece = Piece(tuple([(0, 0)]))
-        piece.color = Colors.BLUE
         
-        self.board.put(piece, 2, 2)
-        # Needed to call 'save' method to have 'backup' 
-        # variable used in the 'can_place_piece_at' method
+        self.board.put(piece, 2, 2, Colors.BLUE)
         self.board.save()
 
         with self.assertRaises(OutOfBoardException):
-            self.board.can_place_piece_at(piece, -1, -1)
+            self.board.can_place_piece_at(piece, -1, -1, Colors.BLUE)
 
         with self.assertRaises(PieceOverlapException):
-            self.board.can_place_piece_at(piece, 2, 2)
+            self.board.can_place_piece_at(piece, 2, 2, Colors.BLUE)
 
         with self.assertRaises(NotAdjacentPieceException):
-            self.board.can_place_piece_at(piece, 0, 0)
+            self.board.can_place_piece_at(piece, 0, 0, Colors.BLUE)
 
         with self.assertRaises(NotAdjacentPieceException):
-            self.board.can_place_piece_at(piece, 2, 1)
+            self.board.can_place_piece_at(piece, 2, 1, Colors.BLUE)
 
         with self.assertRaises(NotAdjacentPieceException):
-            self.board.can_place_piece_at(piece, 1, 2)
+            self.board.can_place_piece_at(piece, 1, 2, Colors.BLUE)
 
         with self.assertRaises(NotAdjacentPieceException):
-            self.board.can_place_piece_at(piece, 2, 3)
+            self.board.can_place_piece_at(piece, 2, 3, Colors.BLUE)
 
         with self.assertRaises(NotAdjacentPieceException):
-            self.board.can_place_piece_at(piece, 3, 2)
+            self.board.can_place_piece_at(piece, 3, 2, Colors.BLUE)
 
-        self.board.can_place_piece_at(piece, 1, 1)
-        self.board.can_place_piece_at(piece, 1, 3)
-        self.board.can_place_piece_at(piece, 3, 3)
-        self.board.can_place_piece_at(piece, 3, 1)
+        self.board.can_place_piece_at(piece, 1, 1, Colors.BLUE)
+        self.board.can_place_piece_at(piece, 1, 3, Colors.BLUE)
+        self.board.can_place_piece_at(piece, 3, 3, Colors.BLUE)
+        self.board.can_place_piece_at(piece, 3, 1, Colors.BLUE)
+
+    def test_can_place_piece_at_side_contact(self) -> None:
+        piece = Piece(((0, 0), (1, 0), (1, 1)))
+        self.board.put(piece, 0, 0, Colors.BLUE)
+
+        # Touches (1, 1) by a corner, but also shares a side with (1, 0)
+        other = Piece(((0, 0), (1, 0), (1, 1), (2, 1)))
+        with self.assertRaises(NotAdjacentPieceException):
+            self.board.can_place_piece_at(other, 2, 0, Colors.BLUE)
+        self.board.can_place_piece_at(other, 2, 2, Colors.BLUE)
+
+        # Pieces of an other color never count as adjacent
+        with self.assertRaises(NotAdjacentPieceException):
+            self.board.can_place_piece_at(other, 2, 2, Colors.RED)
+        with self.assertRaises(PieceOverlapException):
+            self.board.can_place_piece_at(other, 0, 0, Colors.RED)
+
+    def test_anchors(self) -> None:
+        piece = Piece(((0, 0), (1, 0)))
+        self.board.put(piece, 0, 0, Colors.BLUE)
+
+        self.assertEqual({(2, 1)}, self.board.get_anchors(Colors.BLUE))
+        self.assertEqual(set(), self.board.get_anchors(Colors.RED))
+
+        self.board.put(piece, 2, 1, Colors.RED)
+        self.assertEqual(set(), self.board.get_anchors(Colors.BLUE))
+        self.assertEqual({(1, 2), (4, 0), (4, 2)}, self.board.get_anchors(Colors.RED))
+
+    def test_legal_moves(self) -> None:
+        player = Player(Colors.BLUE, [Piece(((0, 0), (1, 0))) for _ in range(Deck.MAX_SIZE)])
+
+        # First piece: one of the two orientations in each corner of the board
+        self.assertEqual(8, len(list(self.board.legal_moves(player))))
+
+        player.place_piece(self.board, player.deck.get(0), 0, 0)
+        # Only the anchor (2, 1) can be covered, the horizontal domino can't start
+        # at (1, 1) and the vertical one can't start at (2, 0): they would touch (1, 0) by a side
+        moves = {(frozenset(player.deck.get(0).shape.orientations[orientation].data), x, y)
+                 for _, orientation, x, y in self.board.legal_moves(player)}
+        self.assertEqual({(frozenset([(0, 0), (1, 0)]), 2, 1), (frozenset([(0, 0), (0, 1)]), 2, 1)}, moves)
+
+    def test_has_legal_move(self) -> None:
+        player = Player(Colors.BLUE, [Piece(((0, 0), (1, 0), (2, 0), (3, 0), (4, 0)))
+                                      for _ in range(Deck.MAX_SIZE)])
+        self.assertTrue(self.board.has_legal_move(player))
+
+        player.place_piece(self.board, player.deck.get(0), 0, 0)
+        self.assertFalse(self.board.has_legal_move(player))
+
+    def test_placement_mask(self) -> None:
+        piece = Piece(((0, 0), (1, 0), (1, 1)))
+
+        mask = self.board.placement_mask(piece, Colors.BLUE, first_piece=True)
+        # No cell of the piece can reach the bottom left corner
+        self.assertEqual({(0, 0), (3, 0), (3, 3)}, {(int(x), int(y)) for y, x in zip(*mask.nonzero())})
+
+        self.board.put(piece, 0, 0, Colors.BLUE)
+        mask = self.board.placement_mask(piece, Colors.BLUE)
+        for y in range(self.HEIGHT):
+            for x in range(self.WIDTH):
+                try:
+                    self.board.can_place_piece_at(piece, x, y, Colors.BLUE)
+                    self.assertTrue(mask[y, x])
+                except (OutOfBoardException, PieceOverlapException, NotAdjacentPieceException):
+                    self.assertFalse(mask[y, x])
+
+    def test_undo_redo(self) -> None:
+        piece = Piece(((0, 0), (1, 0)))
+        self.board.put(piece, 0, 0, Colors.BLUE)
+        board = self.board.get().copy()
+        anchors = self.board.get_anchors(Colors.BLUE)
+
+        self.board.put(piece, 2, 1, Colors.BLUE)
+        self.assertTrue(self.board.undo())
+        self.assertTrue((board == self.board.get()).all())
+        self.assertEqual(anchors, self.board.get_anchors(Colors.BLUE))
+        self.assertFalse(self.board.is_piece_overlapping_at(piece, 2, 1))
+
+        self.assertTrue(self.board.redo())
+        self.assertTrue(self.board.is_piece_overlapping_at(piece, 2, 1))
+        self.assertFalse(self.board.redo())
+
+        self.assertTrue(self.board.undo())
+        self.assertTrue(self.board.undo())
+        self.assertFalse(self.board.undo())
+        self.assertFalse(self.board.get().any())
+
+    def test_undo_bitboards(self) -> None:
+        engine = Engine([RandomAgent(seed) for seed in range(4)], load_pieces())
+        board = engine.board
+        # State before each piece, by length of the journal (passes add no entry)
+        states = {}
+        while not engine.is_over():
+            states[len(board.journal)] = (board.get().copy(), dict(board.occupancy), dict(board.forbidden),
+                                          dict(board.anchors), board.occupied, board.hash)
+            engine.step()
+            # The bitboards updated piece by piece match the ones built from the cells
+            rebuilt = Board.from_array(board.get().copy())
+            self.assertEqual((rebuilt.occupancy, rebuilt.forbidden, rebuilt.anchors, rebuilt.hash),
+                             (board.occupancy, board.forbidden, board.anchors, board.hash))
+
+        while board.undo():
+            cells, occupancy, forbidden, anchors, occupied, hash = states[len(board.journal)]
+            self.assertTrue((cells == board.get()).all())
+            self.assertEqual((occupancy, forbidden, anchors, occupied, hash),
+                             (board.occupancy, board.forbidden, board.anchors, board.occupied, board.hash))
+
+    def test_put_out_of_board(self) -> None:
+        piece = Piece(((0, 0), (1, 0)))
+        for x, y in ((-1, 0), (0, -1), (self.WIDTH - 1, 0), (0, self.HEIGHT)):
+            with self.assertRaises(OutOfBoardException):
+                self.board.put(piece, x, y, Colors.BLUE)
+        # Negative offsets used to wrap to the opposite edge of the array
+        self.assertFalse(self.board.get().any())
+        self.assertEqual([], self.board.journal)
+
+    def test_preview(self) -> None:
+        piece = Piece(((0, 0), (1, 0)))
+        self.board.put(piece, 0, 0, Colors.BLUE)
+
+        self.board.push_preview(piece, 2, 1, Colors.BLUE)
+        self.assertEqual(Colors.BLUE.value, self.board.get()[1, 2])
+        self.board.pop_preview()
+        self.assertEqual(0, self.board.get()[1, 2])
+        self.assertFalse(self.board.redo())
+
+        # Nothing left to pop, the piece placed before stays
+        self.board.pop_preview()
+        self.assertEqual(Colors.BLUE.value, self.board.get()[0, 0])
+
+    def test_preview_under_put(self) -> None:
+        piece = Piece(((0, 0), (1, 0)))
+        self.board.push_preview(piece, 0, 0)
+        self.board.put(piece, 3, 4, Colors.BLUE)
+
+        # The preview is removed, not the piece put after it
+        self.board.pop_preview()
+        self.assertFalse(self.board.get()[0].any())
+        self.assertEqual(Colors.BLUE.value, self.board.get()[4, 3])
+        self.assertTrue(self.board.is_piece_overlapping_at(piece, 3, 4))
+        self.assertEqual(1, len(self.board.journal))
+
+    def test_preview_keeps_redo(self) -> None:
+        piece = Piece(((0, 0), (1, 0)))
+        self.board.put(piece, 0, 0, Colors.BLUE)
+        self.assertTrue(self.board.undo())
+
+        self.board.push_preview(piece, 2, 2)
+        self.board.pop_preview()
+        self.assertTrue(self.board.redo())
+        self.assertEqual(Colors.BLUE.value, self.board.get()[0, 0])
+
+    def test_render_changes(self) -> None:
+        rows, changes = self.board.render_changes()
+        self.assertIsNone(changes)
+        self.assertEqual(self.board.render_cells(), rows)
+
+        piece = Piece(((0, 0), (1, 0)))
+        self.board.put(piece, 2, 3, Colors.BLUE)
+        self.assertEqual((rows, [(4, 3), (4, 4)]), self.board.render_changes())
+        self.assertEqual(self.board.render_cells(), rows)
+        self.assertEqual([], self.board.render_changes()[1])
+
+        # Undone cells are rendered again too
+        self.board.undo()
+        self.assertEqual([(4, 3), (4, 4)], self.board.render_changes()[1])
+        self.assertEqual(self.board.render_cells(), rows)
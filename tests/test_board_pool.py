@@ -0,0 +1,64 @@
+import multiprocessing
+import pickle
+import unittest
+
+from src.agents import RandomAgent
+from src.board import Board
+from src.board_pool import BoardPool
+from src.engine import Engine
+from src.resources import load_pieces
+
+
+def play(pool: BoardPool, i: int) -> None:
+    """Plays the position of a slot until the end of the game, in the memory of the pool."""
+    pieces = load_pieces()
+    board = pool.board(i)
+    engine = Engine([RandomAgent(i) for _ in range(4)], pieces, board=board)
+    engine.players = pool.load_players(i, pieces, Engine.PLAYERS_COLOR)
+    engine.current = int(pool.slots[i]["current"])
+    engine.run()
+    pool.save_players(i, engine.players, engine.current)
+    pool.set_scores(i, engine.scores())
+    pool.close()
+
+
+class BoardPoolTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.pieces = load_pieces()
+
+    def test_store(self) -> None:
+        engine = Engine([RandomAgent(0) for _ in range(4)], self.pieces)
+        for _ in range(9):
+            engine.step()
+        with BoardPool(2) as pool:
+            pool.store(1, engine.board, engine.players, engine.current)
+            board = pool.board(1)
+            self.assertEqual(engine.board.occupancy, board.occupancy)
+            self.assertEqual(engine.board.anchors, board.anchors)
+            players = pool.load_players(1, self.pieces, Engine.PLAYERS_COLOR)
+            self.assertEqual([player.deck.hash for player in engine.players],
+                             [player.deck.hash for player in players])
+            self.assertEqual(1, int(pool.slots[1]["current"]))
+
+            # Views share the memory of the pool
+            piece, orientation, x, y = next(board.legal_moves(players[1]))
+            board.put(piece.oriented(orientation), x, y, players[1].color)
+            self.assertEqual(board.occupancy, pool.board(1).occupancy)
+            self.assertEqual(0, pool.board(0).occupied)
+            self.assertLess(len(pickle.dumps(pool)), 200)
+
+    def test_workers(self) -> None:
+        with BoardPool(4) as pool:
+            for i in range(len(pool)):
+                pool.store(i, Board(20, 20), Engine([RandomAgent() for _ in range(4)], self.pieces).players)
+            with multiprocessing.Pool(2) as workers:
+                workers.starmap(play, [(pool, i) for i in range(len(pool))])
+
+            self.assertTrue(pool.slots["done"].all())
+            for i in range(len(pool)):
+                players = pool.load_players(i, self.pieces, Engine.PLAYERS_COLOR)
+                self.assertEqual([player.score() for player in players], list(pool.slots[i]["scores"]))
+                placed = sum(len(piece.data) for player in players for piece in player.deck.table) \
+                    - sum(len(piece.data) for player in players for piece in player.deck)
+                self.assertEqual(placed, int((pool.slots[i]["board"] != 0).sum()))
@@ -0,0 +1,64 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from src.board import Board
+from src.colors import Colors
+from src.dataset import ShardReader, ShardWriter, export_self_play, shard_files
+from src.placement_index import PlacementIndex
+from src.player import Player
+from src.resources import load_pieces
+
+
+class DatasetTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = self.directory.name
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_export(self) -> None:
+        self.assertEqual(3, export_self_play(self.path, 3, shard_size=100))
+        positions = np.concatenate(list(ShardReader(self.path)))
+        self.assertEqual(len(ShardReader(self.path)), len(positions))
+        self.assertEqual([1, 2, 3], sorted(set(positions["game"])))
+        self.assertGreater(len(shard_files(self.path)), 1)
+
+        # Each row is the position before its move
+        pieces = load_pieces()
+        index = PlacementIndex.of(20, 20, pieces)
+        game = positions[positions["game"] == 1]
+        board = Board(20, 20)
+        players = {color.value: Player(color, pieces) for color in Colors if 1 <= color.value <= 4}
+        for row in game:
+            np.testing.assert_array_equal(row["board"], board.board)
+            self.assertEqual(row["decks"][row["player"]], players[row["color"]].deck.mask)
+            players[row["color"]].place_piece(board, *index.move(row["move"]))
+        self.assertEqual(sorted(row["scores"][row["player"]] for row in game[-4:]),
+                         sorted(player.score() for player in players.values()))
+
+    def test_resume(self) -> None:
+        export_self_play(self.path, 2, shard_size=1000)
+        complete = np.concatenate(list(ShardReader(self.path)))
+
+        # Interrupted while writing the second game
+        writer, shard = shard_files(self.path)[-1]
+        shard = np.load(os.path.join(self.path, f"positions-{writer:03d}-{shard:05d}.npy"), mmap_mode="r+")
+        shard[len(complete) - 5:len(complete)] = np.zeros(5, dtype=shard.dtype)
+        shard.flush()
+        del shard
+
+        with ShardWriter(self.path) as writer:
+            self.assertEqual(1, writer.games)
+        self.assertEqual(1, export_self_play(self.path, 2, shard_size=1000))
+        np.testing.assert_array_equal(complete, np.concatenate(list(ShardReader(self.path))))
+        self.assertEqual(0, export_self_play(self.path, 2, shard_size=1000))
+
+    def test_parallel_writers(self) -> None:
+        self.assertEqual(4, export_self_play(self.path, 4, processes=2, shard_size=1000))
+        self.assertEqual({0, 1}, {writer for writer, _ in shard_files(self.path)})
+        self.assertEqual(4, sum(len(set(positions["game"])) for positions in ShardReader(self.path)))
@@ -1,8 +1,12 @@
 import unittest
 
+from copy import copy
+
+from src.colors import Colors
 from src.exceptions import PieceNotFoundException, NotEnoughPiecesInTheDeckException
 from src.piece import Piece
 from src.player.deck import Deck
+from src.resources import load_pieces
 
 from .player.test_deck import TestDeck
 
@@ -15,6 +19,10 @@ class DeckTest(unittest.TestCase):
         with self.assertRaises(NotEnoughPiecesInTheDeckException):
             Deck([(0, 0) for _ in range(Deck.MAX_SIZE - 1)])
         Deck([(0, 0) for _ in range(Deck.MAX_SIZE)])
+        # Other sets of pieces give the size of their decks
+        with self.assertRaises(NotEnoughPiecesInTheDeckException):
+            Deck([(0, 0) for _ in range(Deck.MAX_SIZE)], 56)
+        self.assertEqual(56, Deck([(0, 0) for _ in range(56)], 56).max_size)
 
     def test_get(self) -> None:
         piece = Piece(tuple([(0, 0)]))
@@ -25,3 +33,60 @@ class DeckTest(unittest.TestCase):
         with self.assertRaises(PieceNotFoundException):
             deck.get(1)
         self.assertEqual(piece, deck.get(0))
+
+    def test_remove_restore(self) -> None:
+        deck = Deck(load_pieces())
+        deck.apply_color(Colors.BLUE)
+        hash = deck.hash
+        piece = deck.get(3)
+
+        piece = piece.rotate()
+        deck.remove(piece)
+        self.assertNotIn(piece, deck)
+        self.assertFalse(deck.has(3))
+        self.assertEqual(Deck.MAX_SIZE - 1, deck.size())
+        with self.assertRaises(ValueError):
+            deck.remove(piece)
+
+        deck.restore(piece)
+        self.assertIn(piece, deck)
+        self.assertEqual(hash, deck.hash)
+        with self.assertRaises(ValueError):
+            deck.restore(piece)
+
+    def test_copy(self) -> None:
+        deck = Deck(load_pieces())
+        deck.apply_color(Colors.RED)
+        other = copy(deck)
+        other.remove(other.get(0))
+
+        self.assertEqual(Deck.MAX_SIZE, deck.size())
+        self.assertEqual(Deck.MAX_SIZE - 1, other.size())
+        self.assertIs(deck.get(1), other.get(0))
+        self.assertNotEqual(deck.hash, other.hash)
+
+    def test_iter(self) -> None:
+        deck = Deck(load_pieces())
+        iterator = iter(deck)
+        self.assertIs(deck.get(0), next(iterator))
+        self.assertEqual(deck.pieces, [deck.get(0)] + list(iterator))
+
+    def test_render_cells(self) -> None:
+        deck = Deck(load_pieces())
+        deck.apply_color(Colors.RED)
+        rows = deck.render_cells()
+        self.assertEqual(Piece.MAX_SIZE, len(rows))
+        self.assertEqual(3 + Deck.MAX_SIZE * (Piece.MAX_SIZE + 3), len(rows[0]))
+        self.assertEqual(sum(len(piece.data) for piece in deck), sum(row.count(f"{Colors.RED}■{Colors.RESET}")
+                                                                     for row in rows))
+        self.assertIs(rows, deck.render_cells())
+
+        deck.remove(deck.get(0))
+        self.assertEqual(len(rows[0]) - Piece.MAX_SIZE - 3, len(deck.render_cells()[0]))
+        deck.apply_color(Colors.BLUE)
+        self.assertIn(f"{Colors.BLUE}■{Colors.RESET}", deck.render_cells()[0] + deck.render_cells()[1])
+
+        # Pieces larger than the usual ones get larger sprites
+        deck = TestDeck([Piece(tuple((0, y) for y in range(7)))])
+        deck.apply_color(Colors.GREEN)
+        self.assertEqual(7, len(deck.render_cells()))
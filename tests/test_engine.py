@@ -0,0 +1,60 @@
+import tempfile
+import unittest
+
+from src.agents import RandomAgent
+from src.board import Board
+from src.engine import Engine
+from src.features import remaining_pieces
+from src.piece import Piece
+from src.polyominoes import load_polyominoes
+from src.resources import load_pieces
+
+
+class EngineTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.pieces = load_pieces()
+
+    def test_run(self) -> None:
+        engine = Engine([RandomAgent(seed) for seed in range(4)], self.pieces)
+        scores = engine.run()
+
+        self.assertTrue(engine.is_over())
+        self.assertEqual(4, len(scores))
+        for player, score in zip(engine.players, scores):
+            self.assertFalse(player.has_legal_move(engine.board))
+            self.assertEqual(score, player.score())
+        self.assertIn(scores.index(max(scores)), engine.winners())
+
+    def test_reproducible(self) -> None:
+        games = []
+        for _ in range(2):
+            engine = Engine([RandomAgent(seed) for seed in range(4)], self.pieces)
+            engine.run()
+            games.append([(player, piece.data, x, y) for player, piece, _, x, y in engine.moves])
+        self.assertEqual(games[0], games[1])
+
+    def test_hexominoes(self) -> None:
+        # Every polyomino of up to 6 cells: 56 pieces per player
+        with tempfile.TemporaryDirectory() as directory:
+            pieces = load_polyominoes(6, pieces_path=directory)
+        engine = Engine([RandomAgent(seed) for seed in range(4)], pieces, deck_size=len(pieces))
+        scores = engine.run()
+
+        self.assertEqual(56, len(pieces))
+        self.assertTrue(engine.is_over())
+        self.assertTrue(any(len(piece.data) == 6 for _, piece, _, _, _ in engine.moves))
+        for player, score in zip(engine.players, scores):
+            self.assertFalse(player.has_legal_move(engine.board))
+            self.assertEqual(score, player.score())
+        self.assertEqual((4, 56), remaining_pieces([player.deck for player in engine.players],
+                                                   deck_size=len(pieces)).shape)
+
+    def test_pass(self) -> None:
+        # A 3x3 board only fits two 3x1 bars, on opposite sides
+        pieces = [Piece(((0, 0), (1, 0), (2, 0))) for _ in range(21)]
+        engine = Engine([RandomAgent(seed) for seed in range(4)], pieces, Board(3, 3))
+        scores = engine.run()
+
+        self.assertEqual([0, 1], [player for player, _, _, _, _ in engine.moves])
+        self.assertEqual([-20 * 3] * 2 + [-21 * 3] * 2, scores)
@@ -0,0 +1,62 @@
+import random
+import unittest
+
+from copy import copy
+
+import numpy as np
+
+from src.board import Board
+from src.colors import Colors
+from src.features import board_features, remaining_pieces, stack_boards
+from src.placement_index import PlacementIndex
+from src.player import Player
+from src.resources import load_pieces
+
+
+class FeaturesTest(unittest.TestCase):
+    COLORS = [Colors.RED, Colors.GREEN, Colors.YELLOW, Colors.BLUE]
+
+    def setUp(self) -> None:
+        pieces = load_pieces()
+        index = PlacementIndex.of(20, 20, pieces)
+        rng = random.Random(0)
+        self.boards = []
+        self.players = []
+        board = Board(20, 20)
+        players = [Player(color, pieces) for color in self.COLORS]
+        for turn in range(16):
+            player = players[turn % len(players)]
+            move_ids = index.legal_move_ids(board, player)
+            if move_ids:
+                player.place_piece(board, *index.move(rng.choice(move_ids)))
+            self.boards.append(copy(board))
+            self.players.append([copy(player) for player in players])
+
+    def test_board_features(self) -> None:
+        stack = stack_boards(self.boards)
+        planes = board_features(stack, self.COLORS)
+        self.assertEqual((16, 12, 20, 20), planes.shape)
+        self.assertTrue(planes.flags.c_contiguous)
+
+        for board, features in zip(self.boards, planes):
+            for i, color in enumerate(self.COLORS):
+                for offset, bitboards in enumerate((board.occupancy, board.forbidden, board.anchors)):
+                    expected = np.zeros((20, 20), dtype=bool)
+                    for x, y in board.cells_of(bitboards.get(color.value, 0)):
+                        expected[y, x] = True
+                    np.testing.assert_array_equal(expected, features[offset * 4 + i])
+
+    def test_out(self) -> None:
+        stack = stack_boards(self.boards)
+        out = np.ones((16, 12, 20, 20), dtype=bool)
+        self.assertIs(out, board_features(stack, self.COLORS, out=out))
+        np.testing.assert_array_equal(board_features(stack.astype(np.int64), self.COLORS), out)
+        with self.assertRaises(ValueError):
+            board_features(stack, self.COLORS, out=np.empty((16, 3, 20, 20), dtype=bool))
+
+    def test_remaining_pieces(self) -> None:
+        decks = [player.deck for players in self.players for player in players]
+        pieces = remaining_pieces(decks)
+        self.assertEqual((64, 21), pieces.shape)
+        for deck, row in zip(decks, pieces):
+            self.assertEqual(list(deck.ids()), list(np.flatnonzero(row)))
@@ -0,0 +1,67 @@
+import asyncio
+import json
+import unittest
+
+from src.board import Board
+from src.colors import Colors
+from src.exceptions import NotAdjacentPieceException
+from src.instrumentation import Instrumentation
+from src.player import Player
+from src.resources import load_pieces
+
+
+class InstrumentationTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.instrumentation = Instrumentation()
+        self.pieces = load_pieces()
+
+    def tearDown(self) -> None:
+        self.instrumentation.disable()
+
+    def test_disabled(self) -> None:
+        put = Board.__dict__["put"]
+        with self.instrumentation:
+            self.assertIsNot(put, Board.__dict__["put"])
+        self.assertIs(put, Board.__dict__["put"])
+
+        Board(20, 20).put(self.pieces[0], 0, 0, Colors.RED)
+        self.assertEqual(0, self.instrumentation.metrics["board.put"].calls)
+
+    def test_metrics(self) -> None:
+        self.instrumentation.enable()
+        board = Board(20, 20)
+        player = Player(Colors.RED, self.pieces)
+        player.place_piece(board, self.pieces[0], 0, 0)
+        with self.assertRaises(NotAdjacentPieceException):
+            player.place_piece(board, self.pieces[1], 10, 10)
+        self.pieces[2].rotate()
+
+        metrics = self.instrumentation.to_dict()
+        self.assertEqual(2, metrics["player.place_piece"]["calls"])
+        self.assertEqual({"NotAdjacentPieceException": 1}, metrics["player.place_piece"]["errors"])
+        self.assertEqual({"NotAdjacentPieceException": 1}, metrics["board.can_place_piece_at"]["errors"])
+        self.assertEqual(1, metrics["board.put"]["calls"])
+        self.assertEqual(1, metrics["piece.rotate"]["calls"])
+        self.assertGreater(metrics["player.place_piece"]["seconds"], 0)
+        self.assertEqual(metrics, json.loads(self.instrumentation.to_json()))
+
+        text = self.instrumentation.to_prometheus()
+        self.assertIn('blokus_calls_total{function="board.put"} 1\n', text)
+        self.assertIn('blokus_errors_total{function="player.place_piece",exception="NotAdjacentPieceException"} 1\n',
+                      text)
+
+        self.instrumentation.reset()
+        self.assertEqual({}, self.instrumentation.to_dict())
+
+    def test_instrument(self) -> None:
+        class Prompt:
+            async def ask(self) -> str:
+                return "1"
+
+        self.instrumentation.enable()
+        self.instrumentation.instrument(Prompt, "ask", "input.ask")
+        self.assertEqual("1", asyncio.run(Prompt().ask()))
+        self.assertEqual(1, self.instrumentation.metrics["input.ask"].calls)
+        self.instrumentation.disable()
+        self.assertFalse(hasattr(Prompt.ask, "__wrapped__"))
@@ -0,0 +1,44 @@
+import unittest
+
+from src.agents import MCTSAgent, RandomAgent
+from src.agents.mcts_agent import search
+from src.engine import Engine
+from src.resources import load_pieces
+
+
+class MCTSAgentTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.pieces = load_pieces()
+
+    def test_play(self) -> None:
+        agent = MCTSAgent(0, budget=0.05)
+        engine = Engine([agent] + [RandomAgent(seed) for seed in range(3)], self.pieces)
+        player = engine.players[0]
+        moves = [(piece.shape.orientations[orientation].data, x, y)
+                 for piece, orientation, x, y in engine.board.legal_moves(player)]
+
+        piece, orientation, x, y = engine.step()
+        self.assertIn((piece.shape.orientations[orientation].data, x, y), moves)
+        self.assertNotIn(piece, player.deck.pieces)
+        self.assertGreater(agent.playouts, 0)
+        self.assertGreater(agent.playouts_per_second, 0)
+
+    def test_search_leaves_game_unchanged(self) -> None:
+        engine = Engine([RandomAgent(seed) for seed in range(4)], self.pieces)
+        for _ in range(8):
+            engine.step()
+        hash = engine.hash()
+
+        statistics, playouts = search(engine, 0.05, 0)
+        self.assertEqual(hash, engine.hash())
+        self.assertEqual(playouts, sum(visits for visits, _ in statistics.values()))
+
+    def test_processes(self) -> None:
+        agent = MCTSAgent(0, budget=0.05, processes=2)
+        engine = Engine([agent] + [RandomAgent(seed) for seed in range(3)], self.pieces)
+        try:
+            self.assertIsNotNone(engine.step())
+        finally:
+            agent.close()
+        self.assertGreater(agent.playouts, 1)
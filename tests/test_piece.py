@@ -9,28 +9,62 @@ class PieceTest(unittest.TestCase):
                                  (0, 1), (1, 1),
                                  (0, 2), (1, 2)))
         
-        self.assertEqual([(0, 2)], rectangle_piece.bottom_left)
-        self.assertEqual([(1, 2)], rectangle_piece.bottom_right)
-        self.assertEqual([(0, 0)], rectangle_piece.top_left)
-        self.assertEqual([(1, 0)], rectangle_piece.top_right)
+        self.assertEqual(((0, 2),), rectangle_piece.bottom_left)
+        self.assertEqual(((1, 2),), rectangle_piece.bottom_right)
+        self.assertEqual(((0, 0),), rectangle_piece.top_left)
+        self.assertEqual(((1, 0),), rectangle_piece.top_right)
 
         bar_piece = Piece(((0, 0), (1, 0), (2, 0)))
 
-        self.assertEqual([(0, 0)], bar_piece.bottom_left)
-        self.assertEqual([(0, 0)], bar_piece.top_left)
-        self.assertEqual([(2, 0)], bar_piece.bottom_right)
-        self.assertEqual([(2, 0)], bar_piece.top_right)
+        self.assertEqual(((0, 0),), bar_piece.bottom_left)
+        self.assertEqual(((0, 0),), bar_piece.top_left)
+        self.assertEqual(((2, 0),), bar_piece.bottom_right)
+        self.assertEqual(((2, 0),), bar_piece.top_right)
 
-        bar_piece.rotate()
+        bar_piece = bar_piece.rotate()
 
-        self.assertEqual([(0, 0)], bar_piece.top_left)
-        self.assertEqual([(0, 0)], bar_piece.top_right)
-        self.assertEqual([(0, 2)], bar_piece.bottom_left)
-        self.assertEqual([(0, 2)], bar_piece.bottom_right)
+        self.assertEqual(((0, 0),), bar_piece.top_left)
+        self.assertEqual(((0, 0),), bar_piece.top_right)
+        self.assertEqual(((0, 2),), bar_piece.bottom_left)
+        self.assertEqual(((0, 2),), bar_piece.bottom_right)
 
         point_piece = Piece(((0, 0), ))
 
-        self.assertEqual([(0, 0)], point_piece.top_left)
-        self.assertEqual([(0, 0)], point_piece.top_right)
-        self.assertEqual([(0, 0)], point_piece.bottom_left)
-        self.assertEqual([(0, 0)], point_piece.bottom_right)
\ No newline at end of file
+        self.assertEqual(((0, 0),), point_piece.top_left)
+        self.assertEqual(((0, 0),), point_piece.top_right)
+        self.assertEqual(((0, 0),), point_piece.bottom_left)
+        self.assertEqual(((0, 0),), point_piece.bottom_right)
+
+    def test_orientations(self):
+        square_piece = Piece(((0, 0), (1, 0), (0, 1), (1, 1)))
+        self.assertEqual(1, len(square_piece.shape.orientations))
+
+        bar_piece = Piece(((0, 0), (1, 0), (2, 0)))
+        self.assertEqual(2, len(bar_piece.shape.orientations))
+
+        l_piece = Piece(((0, 0), (0, 1), (0, 2), (1, 2)))
+        self.assertEqual(8, len(l_piece.shape.orientations))
+        # The table is built once and shared by every piece of the same shape
+        self.assertIs(l_piece.shape, Piece(((0, 0), (0, 1), (0, 2), (1, 2))).shape)
+
+        data = l_piece.data
+        for _ in range(4):
+            l_piece = l_piece.rotate()
+        self.assertEqual(data, l_piece.data)
+
+        l_piece = l_piece.rotate()
+        self.assertEqual({(2, 0), (0, 1), (1, 1), (2, 1)}, set(l_piece.data))
+        self.assertEqual(((0, 1),), l_piece.bottom_left)
+
+        l_piece = l_piece.mirror(True, False)
+        self.assertEqual({(0, 0), (0, 1), (1, 1), (2, 1)}, set(l_piece.data))
+        l_piece = l_piece.mirror(False, True)
+        self.assertEqual({(0, 0), (1, 0), (2, 0), (0, 1)}, set(l_piece.data))
+
+    def test_offset_cells(self):
+        # Cells away from the origin are normalized, they don't add an orientation to the table
+        domino = Piece(((1, 1), (2, 1)))
+        self.assertEqual(((0, 0), (1, 0)), domino.data)
+        self.assertEqual(2, len(domino.shape.orientations))
+        self.assertIs(domino, Piece(((0, 0), (1, 0))))
+        self.assertIs(domino, domino.rotate().rotate())
@@ -0,0 +1,50 @@
+import random
+import unittest
+
+from src.board import Board
+from src.colors import Colors
+from src.exceptions import OutOfBoardException
+from src.piece import Piece
+from src.placement_index import PlacementIndex
+from src.player import Player
+from src.resources import load_pieces
+
+
+class PlacementIndexTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.pieces = load_pieces()
+        self.index = PlacementIndex.of(20, 20, self.pieces)
+
+    def test_of(self) -> None:
+        self.assertIs(self.index, PlacementIndex.of(20, 20, list(reversed(self.pieces))[::-1]))
+        self.assertIsNot(self.index, PlacementIndex.of(14, 14, self.pieces))
+
+    def test_move_id(self) -> None:
+        self.assertEqual(len(set(zip(self.index.shape_ids, self.index.orientations,
+                                     self.index.xs, self.index.ys))), len(self.index))
+        for move_id in random.Random(0).sample(range(len(self.index)), 200):
+            piece, x, y = self.index.move(move_id)
+            self.assertEqual(move_id, self.index.move_id(piece, x, y))
+
+        with self.assertRaises(OutOfBoardException):
+            self.index.move_id(self.pieces[0], 20, 0)
+        with self.assertRaises(ValueError):
+            self.index.move_id(Piece(tuple((x, 0) for x in range(7))), 0, 0)
+
+    def test_legal_move_ids(self) -> None:
+        board = Board(20, 20)
+        players = [Player(color, self.pieces) for color in (Colors.BLUE, Colors.GREEN)]
+        rng = random.Random(1)
+        for turn in range(12):
+            player = players[turn % 2]
+            expected = {(piece.oriented(orientation), x, y)
+                        for piece, orientation, x, y in board.legal_moves(player)}
+            move_ids = self.index.legal_move_ids(board, player)
+            self.assertEqual(expected, {self.index.move(move_id) for move_id in move_ids})
+            for move_id in move_ids:
+                self.assertTrue(self.index.is_legal(board, move_id, player.color, player.deck.is_full()))
+
+            piece, x, y = self.index.move(rng.choice(move_ids))
+            player.place_piece(board, piece, x, y)
+            self.assertFalse(self.index.is_legal(board, self.index.move_id(piece, x, y), player.color))
@@ -42,8 +42,7 @@ class PlayerTest(unittest.TestCase):
         player_red.place_piece(board, piece, 3, 4)
         self.assertEqual(20, player_red.deck.size())
 
-        piece = player_red.deck.get(0)
-        piece.rotate()
+        piece = player_red.deck.get(0).rotate()
         board.save()
         player_red.place_piece(board, piece, 2, 2)
         self.assertEqual(19, player_red.deck.size())
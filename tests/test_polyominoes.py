@@ -0,0 +1,42 @@
+import os
+import tempfile
+import unittest
+
+from src.player.deck import Deck
+from src.polyominoes import POLYOMINOES_CACHE_PATH, canonical, enumerate_polyominoes, load_polyominoes
+from src.resources import load_pieces
+
+
+class PolyominoesTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_canonical(self) -> None:
+        pieces = load_pieces()
+        for piece in pieces:
+            forms = {canonical(orientation.data) for orientation in piece.shape.orientations}
+            self.assertEqual({canonical(piece.data)}, forms)
+        self.assertEqual(canonical(((5, 5), (5, 6))), canonical(((0, 0), (1, 0))))
+
+    def test_enumerate_polyominoes(self) -> None:
+        counts = [0] * 9
+        for cells in enumerate_polyominoes(8):
+            counts[len(cells)] += 1
+        self.assertEqual([0, 1, 1, 2, 5, 12, 35, 108, 369], counts)
+        self.assertEqual([cells for cells in enumerate_polyominoes(8) if len(cells) >= 6],
+                         enumerate_polyominoes(8, min_size=6))
+
+    def test_load_polyominoes(self) -> None:
+        pieces = load_polyominoes(5, pieces_path=self.directory.name)
+        self.assertEqual({piece.shape for piece in load_pieces() if len(piece.data) <= 4},
+                         {piece.shape for piece in pieces if len(piece.data) <= 4})
+        self.assertEqual(Deck.MAX_SIZE, Deck(pieces).size())
+
+        self.assertTrue(os.path.exists(os.path.join(self.directory.name,
+                                                    POLYOMINOES_CACHE_PATH.format(max_size=5))))
+        self.assertEqual(pieces, load_polyominoes(5, pieces_path=self.directory.name))
+        self.assertEqual(12, len(load_polyominoes(5, min_size=5, pieces_path=self.directory.name)))
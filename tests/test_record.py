@@ -0,0 +1,78 @@
+import os
+import pickle
+import tempfile
+import unittest
+
+from src.agents import RandomAgent
+from src.engine import Engine
+from src.exceptions import InvalidRecordException
+from src.record import FILE_HEADER, GAME_HEADER, GameRecord, RecordReader, RecordWriter
+from src.resources import load_pieces
+
+
+class RecordTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.pieces = load_pieces()
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "games.blkr")
+
+        self.engines = []
+        for seed in range(3):
+            engine = Engine([RandomAgent(seed * 4 + i) for i in range(4)], self.pieces)
+            engine.run()
+            self.engines.append(engine)
+        with RecordWriter(self.path) as writer:
+            for seed, engine in enumerate(self.engines):
+                writer.write(GameRecord.of(engine, self.pieces, seed))
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_read(self) -> None:
+        for memory_map in (True, False):
+            with RecordReader(self.path, memory_map) as reader:
+                records = list(reader)
+                self.assertEqual(3, len(records))
+                for seed, (record, engine) in enumerate(zip(records, self.engines)):
+                    self.assertEqual(seed, record.seed)
+                    self.assertEqual([player.color for player in engine.players], record.colors)
+                    self.assertEqual(len(engine.moves), len(record))
+
+    def test_positions(self) -> None:
+        with RecordReader(self.path) as reader:
+            for record, engine in zip(reader, self.engines):
+                for board, players in record.positions(self.pieces):
+                    pass
+                self.assertTrue((board.board == engine.board.board).all())
+                self.assertEqual(engine.scores(), [player.score() for player in players])
+
+    def test_size(self) -> None:
+        engine = self.engines[0]
+        pickled = len(pickle.dumps(engine.board.board)) * len(engine.moves)
+        self.assertLess(os.path.getsize(self.path) * 10, pickled)
+
+    def test_invalid(self) -> None:
+        with open(self.path, "r+b") as file:
+            file.truncate(os.path.getsize(self.path) - 1)
+        for memory_map in (True, False):
+            with RecordReader(self.path, memory_map) as reader:
+                with self.assertRaises(InvalidRecordException):
+                    list(reader)
+
+    def test_invalid_color(self) -> None:
+        # The color of the first player of the first game, right after the headers
+        with open(self.path, "r+b") as file:
+            file.seek(FILE_HEADER.size + GAME_HEADER.size)
+            file.write(bytes((0xFF,)))
+        for memory_map in (True, False):
+            with RecordReader(self.path, memory_map) as reader:
+                with self.assertRaises(InvalidRecordException):
+                    list(reader)
+
+    def test_encode_move_range(self) -> None:
+        record = GameRecord([player.color for player in self.engines[0].players], 20, 20)
+        self.assertEqual(3, len(record.encode_move(3, 31, 7, 19, 19)))
+        for move in ((4, 0, 0, 0, 0), (0, 32, 0, 0, 0), (0, 0, 8, 0, 0), (0, 0, 0, -1, 0), (0, 0, 0, 0, 1000)):
+            with self.assertRaises(ValueError):
+                record.encode_move(*move)
@@ -0,0 +1,63 @@
+import io
+import unittest
+
+from src.board import Board
+from src.colors import Colors
+from src.piece import Piece
+from src.player.deck import Deck
+from src.renderer import Renderer
+
+
+class RendererTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.stream = io.StringIO()
+        self.renderer = Renderer(self.stream)
+        self.board = Board(5, 5)
+
+    def test_render(self) -> None:
+        self.renderer.render(self.board.render_cells())
+        output = self.stream.getvalue()
+        self.assertTrue(output.startswith(Renderer.CLEAR_SCREEN))
+        self.assertEqual(7 * 7, output.count("■") + output.count(" "))
+
+        # Nothing changed, only the cursor goes back below the frame
+        self.stream.seek(0)
+        self.stream.truncate()
+        self.renderer.render(self.board.render_cells())
+        self.assertEqual(f"\033[8;1H{str(Colors.RESET)}{Renderer.CLEAR_BELOW}", self.stream.getvalue())
+
+    def test_diff(self) -> None:
+        self.renderer.diff(self.board.render_cells())
+
+        piece = Piece(((0, 0), (1, 0)))
+        self.board.put(piece, 1, 2, Colors.BLUE)
+        output = self.renderer.diff(self.board.render_cells())
+
+        # One cursor move to the first cell, the second one follows it
+        self.assertTrue(output.startswith(f"\033[4;3H{str(Colors.BLUE)}■{str(Colors.BLUE)}■\033["))
+        self.assertEqual(2, output.count("■"))
+
+    def test_update(self) -> None:
+        deck = Deck([Piece(((0, 0),)), Piece(((0, 0), (1, 0)))], 2)
+        self.renderer.update(self.board.render_changes(), deck.render_changes())
+
+        self.board.put(Piece(((0, 0), (1, 0))), 1, 2, Colors.BLUE)
+        self.stream.seek(0)
+        self.stream.truncate()
+        self.renderer.update(self.board.render_changes(), deck.render_changes())
+        # Only the cells put are compared and drawn
+        self.assertEqual(f"\033[4;3H{str(Colors.BLUE)}■{str(Colors.BLUE)}■"
+                         f"\033[13;1H{str(Colors.RESET)}{Renderer.CLEAR_BELOW}", self.stream.getvalue())
+
+        # The deck changed, its cells are all compared
+        deck.remove(deck.get(0))
+        self.renderer.update(self.board.render_changes(), deck.render_changes())
+        self.assertEqual(self.board.render_cells() + deck.render_cells(), self.renderer.frame)
+
+    def test_shrink(self) -> None:
+        self.renderer.diff([["a", "b"], ["c"]])
+        output = self.renderer.diff([["a"]])
+
+        self.assertEqual(f"\033[1;2H{Renderer.EMPTY_CELL}\033[2;1H{Renderer.EMPTY_CELL}"
+                         f"\033[2;1H{str(Colors.RESET)}{Renderer.CLEAR_BELOW}", output)
@@ -0,0 +1,37 @@
+import os
+import tempfile
+import unittest
+
+from src.resources import CACHE_PATH, load_pieces
+
+
+class ResourcesTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "pieces.txt")
+        with open(self.path, "w") as pieces_file:
+            pieces_file.write("0,0&0,0;1,0;1,1")
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_load_pieces(self) -> None:
+        pieces = load_pieces(self.directory.name, use_cache=False)
+
+        self.assertEqual([{(0, 0)}, {(0, 0), (1, 0), (1, 1)}], [set(piece.data) for piece in pieces])
+        self.assertEqual(4, len(pieces[1].shape.orientations))
+        self.assertFalse(os.path.exists(os.path.join(self.directory.name, CACHE_PATH)))
+
+    def test_cache(self) -> None:
+        pieces = load_pieces(self.directory.name)
+        self.assertTrue(os.path.exists(os.path.join(self.directory.name, CACHE_PATH)))
+        self.assertEqual(pieces, load_pieces(self.directory.name))
+
+        # Same content, only the modification time changes
+        os.utime(self.path, ns=(0, 0))
+        self.assertEqual(pieces, load_pieces(self.directory.name))
+
+        with open(self.path, "w") as pieces_file:
+            pieces_file.write("0,0;0,1")
+        self.assertEqual([{(0, 0), (0, 1)}], [set(piece.data) for piece in load_pieces(self.directory.name)])
@@ -0,0 +1,55 @@
+import time
+import unittest
+
+from src.agents import RandomAgent, SearchAgent
+from src.engine import Engine
+from src.resources import load_pieces
+
+
+class SearchAgentTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.pieces = load_pieces()
+
+    def play(self, agent: SearchAgent, turns: int = 8) -> Engine:
+        engine = Engine([agent] + [RandomAgent(seed) for seed in range(3)], self.pieces)
+        for _ in range(turns):
+            engine.step()
+        return engine
+
+    def test_node_limit(self) -> None:
+        for mode in (SearchAgent.PARANOID, SearchAgent.MAX_N):
+            agent = SearchAgent(mode, nodes=500, time_limit=None)
+            engine = self.play(agent)
+            player = engine.players[0]
+            moves = [(piece.shape.orientations[orientation].data, x, y)
+                     for piece, orientation, x, y in engine.board.legal_moves(player)]
+
+            piece, orientation, x, y = engine.step()
+            self.assertIn((piece.shape.orientations[orientation].data, x, y), moves)
+            # The node going over the budget is counted before the search stops
+            self.assertLessEqual(agent.searched, agent.nodes + 1)
+            self.assertGreaterEqual(agent.depth, 1)
+
+    def test_time_limit(self) -> None:
+        for time_limit, depth in ((0.2, 1), (0.001, 0)):
+            agent = SearchAgent(time_limit=time_limit)
+            engine = self.play(agent)
+
+            start = time.monotonic()
+            self.assertIsNotNone(engine.step())
+            # The deadline is checked while the moves are listed, so the search stops
+            # within a few moves of it even when no iteration could complete
+            self.assertLess(time.monotonic() - start, agent.time_limit + 0.05)
+            self.assertGreaterEqual(agent.depth, depth)
+
+    def test_reproducible(self) -> None:
+        games = []
+        for _ in range(2):
+            engine = self.play(SearchAgent(nodes=300, time_limit=None), 12)
+            games.append([(player, piece.data, x, y) for player, piece, _, x, y in engine.moves])
+        self.assertEqual(games[0], games[1])
+
+    def test_mode(self) -> None:
+        with self.assertRaises(ValueError):
+            SearchAgent("minimax")
@@ -0,0 +1,85 @@
+import asyncio
+import unittest
+
+from src.agents import RandomAgent
+from src.client import Client
+from src.resources import load_pieces
+from src.server import Server
+
+
+class ServerTest(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self) -> None:
+        self.pieces = load_pieces()
+        self.server = Server(self.pieces)
+        self.port = await self.server.start(port=0)
+
+    async def asyncTearDown(self) -> None:
+        await self.server.close()
+
+    async def play_game(self, seed: int) -> None:
+        clients = [await Client.connect(self.pieces, port=self.port) for _ in range(4)]
+        game = await clients[0].new_game(4, seed)
+        for client in clients:
+            await client.join(game)
+        engine = clients[0].games[game]
+
+        results = await asyncio.gather(*(client.play(lambda seat: RandomAgent(seed * 4 + seat), game)
+                                         for client in clients))
+        for scores in results:
+            self.assertEqual(engine.scores(), scores)
+        for client in clients:
+            await client.close()
+
+    async def test_games(self) -> None:
+        await asyncio.gather(*(self.play_game(seed) for seed in range(10)))
+        self.assertEqual({}, self.server.games)
+        self.assertGreater(self.server.moves, 0)
+
+    async def test_illegal_move(self) -> None:
+        client = await Client.connect(self.pieces, port=self.port)
+        game = await client.new_game(2)
+        first = await client.join(game)
+        other = await Client.connect(self.pieces, port=self.port)
+        await other.join(game)
+
+        for connection in (client, other):
+            self.assertEqual(["TURN", str(game), str(first)], await connection.receive())
+        await other.move(game, other.games[game].players[first].deck.pieces[0], 0, 0, 0)
+        self.assertEqual("ERROR", (await other.receive())[0])
+
+        engine = client.games[game]
+        await client.move(game, engine.players[first].deck.pieces[0], 0, 5, 5)
+        self.assertEqual(["ERROR", "PieceNotInCornerException"], (await client.receive())[:2])
+
+        await other.close()
+        self.assertEqual("OVER", (await client.receive())[0])
+        await client.close()
+
+    async def test_out_of_board_move(self) -> None:
+        client = await Client.connect(self.pieces, port=self.port)
+        game = await client.new_game(1)
+        seat = await client.join(game)
+        self.assertEqual(["TURN", str(game), str(seat)], await client.receive())
+
+        engine = client.games[game]
+        domino = next(piece for piece in engine.players[seat].deck.pieces if len(piece.data) == 2)
+        # A negative offset would wrap to the opposite edge of the board array
+        for x, y in ((-1, 0), (0, -1)):
+            await client.move(game, domino, 0, x, y)
+            self.assertEqual(["ERROR", "OutOfBoardException"], (await client.receive())[:2])
+        self.assertFalse(self.server.games[game].engine.board.get().any())
+        await client.close()
+
+    async def test_pass(self) -> None:
+        client = await Client.connect(self.pieces, port=self.port)
+        game = await client.new_game(2)
+        first = await client.join(game)
+        second = await client.join(game)
+        self.assertEqual(["TURN", str(game), str(first)], await client.receive())
+
+        await client.pass_turn(game)
+        self.assertEqual(["PASSED", str(game), str(first)], await client.receive())
+        self.assertEqual(["TURN", str(game), str(second)], await client.receive())
+        self.assertEqual(second, client.games[game].current)
+        await client.close()
@@ -0,0 +1,83 @@
+import random
+import unittest
+
+from copy import copy
+
+from src.board import Board
+from src.colors import Colors
+from src.placement_index import PlacementIndex
+from src.player import Player
+from src.resources import load_pieces
+from src.territory import TerritoryEvaluator
+
+
+class TerritoryEvaluatorTest(unittest.TestCase):
+    COLORS = [Colors.BLUE, Colors.GREEN, Colors.RED, Colors.YELLOW]
+
+    def setUp(self) -> None:
+        self.pieces = load_pieces()
+        self.index = PlacementIndex.of(20, 20, self.pieces)
+        self.board = Board(20, 20)
+        self.players = [Player(color, self.pieces) for color in self.COLORS]
+        self.rng = random.Random(0)
+
+    def play(self, turns: int) -> None:
+        for turn in range(turns):
+            player = self.players[turn % len(self.players)]
+            move_ids = self.index.legal_move_ids(self.board, player)
+            if move_ids:
+                player.place_piece(self.board, *self.index.move(self.rng.choice(move_ids)))
+
+    def assertMatchesFresh(self, evaluator: TerritoryEvaluator) -> None:
+        fresh = TerritoryEvaluator(evaluator.board, self.COLORS)
+        self.assertEqual(fresh.scores(), evaluator.scores())
+        self.assertEqual(fresh.contested(), evaluator.contested())
+        for color in self.COLORS:
+            self.assertEqual(fresh.reach(color), evaluator.reach(color))
+
+    def test_empty_board(self) -> None:
+        evaluator = TerritoryEvaluator(self.board, self.COLORS)
+        # Every color can reach the 15 cells within 4 steps of each corner
+        self.assertEqual(4 * 15, evaluator.reach(Colors.BLUE).bit_count())
+        self.assertEqual(evaluator.reach(Colors.BLUE), evaluator.contested())
+        self.assertEqual(4 * 15 * TerritoryEvaluator.CONTESTED_WEIGHT + 4 * TerritoryEvaluator.ANCHOR_WEIGHT,
+                         evaluator.score(Colors.BLUE))
+
+    def test_incremental(self) -> None:
+        evaluator = TerritoryEvaluator(self.board, self.COLORS)
+        for _ in range(6):
+            self.play(4)
+            self.assertMatchesFresh(evaluator)
+            self.assertNotEqual(0, evaluator.reach(Colors.BLUE) & self.board.anchors[Colors.BLUE.value])
+            self.assertEqual(0, evaluator.reach(Colors.BLUE) & self.board.occupied)
+
+    def test_undo(self) -> None:
+        evaluator = TerritoryEvaluator(self.board, self.COLORS)
+        self.play(8)
+        scores = evaluator.scores()
+        self.play(8)
+        evaluator.scores()
+        for _ in range(8):
+            self.board.undo()
+        self.assertEqual(scores, evaluator.scores())
+
+        # Pieces put again after an undo, and previews
+        self.board.redo()
+        self.board.undo()
+        self.board.undo()
+        self.play(4)
+        self.board.push_preview(self.pieces[0], 10, 10)
+        self.assertMatchesFresh(evaluator)
+        self.board.pop_preview()
+        self.assertMatchesFresh(evaluator)
+
+    def test_fork(self) -> None:
+        evaluator = TerritoryEvaluator(self.board, self.COLORS)
+        self.play(8)
+        board = copy(self.board)
+        fork = evaluator.fork(board)
+        self.assertEqual(evaluator.scores(), fork.scores())
+
+        self.board = board
+        self.play(4)
+        self.assertMatchesFresh(fork)
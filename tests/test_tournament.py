@@ -0,0 +1,29 @@
+import unittest
+
+from src.agents import RandomAgent
+from src.tournament import Tournament
+
+
+class TournamentTest(unittest.TestCase):
+
+    def test_schedule(self) -> None:
+        tournament = Tournament({"a": RandomAgent, "b": RandomAgent, "c": RandomAgent}, games_per_pair=4)
+        games = tournament.schedule()
+
+        self.assertEqual(3 * 4, len(games))
+        self.assertEqual(list(range(len(games))), [index for index, _, _, _ in games])
+        self.assertEqual(2, sum(1 for _, first, second, _ in games if (first, second) == ("a", "b")))
+        self.assertEqual(games, Tournament(tournament.entrants, games_per_pair=4).schedule())
+
+    def test_run(self) -> None:
+        entrants = {"a": RandomAgent, "b": RandomAgent}
+        tournament = Tournament(entrants, games_per_pair=4, processes=1)
+        results = tournament.run()
+
+        self.assertEqual(4, len(results))
+        self.assertEqual(results, Tournament(entrants, games_per_pair=4, processes=2).run())
+
+        win_rates = tournament.win_rates()
+        self.assertAlmostEqual(1, win_rates["a"] + win_rates["b"])
+        elo = tournament.elo()
+        self.assertAlmostEqual(2 * Tournament.ELO_INITIAL, elo["a"] + elo["b"])
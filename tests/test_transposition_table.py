@@ -0,0 +1,31 @@
+import unittest
+
+from src.transposition_table import TranspositionTable
+
+
+class TranspositionTableTest(unittest.TestCase):
+
+    def test_lookup(self) -> None:
+        table = TranspositionTable(8)
+        self.assertIsNone(table.lookup(3))
+
+        table.store(3, 2, 10, TranspositionTable.LOWER_BOUND, "move")
+        self.assertEqual((2, 10, TranspositionTable.LOWER_BOUND, "move"), table.lookup(3))
+        # Same slot, other position
+        self.assertIsNone(table.lookup(3 + 8))
+        self.assertEqual(1, table.hits)
+        self.assertEqual(2, table.misses)
+
+    def test_replacement(self) -> None:
+        table = TranspositionTable(8)
+        table.store(3, 4, 10)
+
+        self.assertFalse(table.store(3 + 8, 2, 20))
+        self.assertEqual((4, 10, TranspositionTable.EXACT, None), table.lookup(3))
+        self.assertTrue(table.store(3 + 8, 4, 20))
+        self.assertIsNone(table.lookup(3))
+
+        # Entries of an older search are always replaced
+        table.new_search()
+        self.assertTrue(table.store(3, 1, 30))
+        self.assertEqual((1, 30, TranspositionTable.EXACT, None), table.lookup(3))
@@ -0,0 +1,61 @@
+import unittest
+
+from src.board import Board
+from src.colors import Colors
+from src.piece import Piece
+from src.player import Player
+from src.player.deck import Deck
+from src.zobrist import position_hash
+
+
+class ZobristTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.first = Piece(((0, 0), (1, 0)))
+        self.second = Piece(((0, 0),))
+
+    def test_board_hash(self) -> None:
+        board = Board(5, 5)
+        board.put(self.first, 0, 0, Colors.BLUE)
+        board.put(self.second, 4, 4, Colors.RED)
+
+        other = Board(5, 5)
+        other.put(self.second, 4, 4, Colors.RED)
+        other.put(self.first, 0, 0, Colors.BLUE)
+        self.assertEqual(board.hash, other.hash)
+
+        other.undo()
+        self.assertNotEqual(board.hash, other.hash)
+        other.undo()
+        self.assertEqual(0, other.hash)
+        other.redo()
+        other.redo()
+        self.assertEqual(board.hash, other.hash)
+
+        # Pieces of another color on the same cells
+        other = Board(5, 5)
+        other.put(self.second, 4, 4, Colors.RED)
+        other.put(self.first, 0, 0, Colors.GREEN)
+        self.assertNotEqual(board.hash, other.hash)
+
+    def test_position_hash(self) -> None:
+        board = Board(5, 5)
+        players = [Player(color, [Piece(((0, 0),)) for _ in range(Deck.MAX_SIZE)])
+                   for color in [Colors.BLUE, Colors.RED]]
+        start = position_hash(board, players, 0)
+        self.assertNotEqual(start, position_hash(board, players, 1))
+
+        players[0].place_piece(board, players[0].deck.get(0), 0, 0)
+        self.assertNotEqual(start, position_hash(board, players, 0))
+
+        # Pieces of the same shape are interchangeable
+        other_board = Board(5, 5)
+        other_players = [Player(color, [Piece(((0, 0),)) for _ in range(Deck.MAX_SIZE)])
+                         for color in [Colors.BLUE, Colors.RED]]
+        other_players[0].place_piece(other_board, other_players[0].deck.get(1), 0, 0)
+        self.assertEqual(position_hash(board, players, 0), position_hash(other_board, other_players, 0))
+
+        # Same cells, but one less piece in the deck
+        other_players[0].deck.remove(Piece(((0, 0),)))
+        self.assertEqual(board.hash, other_board.hash)
+        self.assertNotEqual(position_hash(board, players, 0), position_hash(other_board, other_players, 0))